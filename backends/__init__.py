@@ -0,0 +1,10 @@
+"""Inference backends package."""
+
+__all__ = ["AUTOCAST_BACKENDS", "blend_weights", "check_parity", "dynamic_layers", "fuse_conv_bn", "load_backend", "OnnxModule", "optimization_passes", "optimize_model", "precision_context", "quantize_dynamic_int8", "quantize_static_int8", "restore_weights", "TILE_BLENDS", "TiledRunner", "variant_name"]
+
+from backends.loader        import check_parity, load_backend, restore_weights, variant_name
+from backends.onnx          import OnnxModule
+from backends.optimization  import fuse_conv_bn, optimization_passes, optimize_model
+from backends.precision     import AUTOCAST_BACKENDS, precision_context
+from backends.quantization  import dynamic_layers, quantize_dynamic_int8, quantize_static_int8
+from backends.tiling        import blend_weights, TILE_BLENDS, TiledRunner
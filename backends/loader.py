@@ -0,0 +1,202 @@
+"""Inference backend loader."""
+
+__all__ = ["check_parity", "load_backend", "restore_weights", "variant_name"]
+
+from logging                        import Logger
+from os                             import environ, makedirs
+from os.path                        import exists
+from typing                         import Callable, Iterable
+
+from torch                          import compile, jit, load, no_grad, onnx, save, Tensor
+from torch.nn                       import Module
+
+from backends.onnx                  import OnnxModule
+from backends.quantization          import quantize_dynamic_int8, quantize_static_int8
+from utilities                      import LOGGER
+
+def load_backend(
+    model:          Module,
+    backend:        str,
+    example:        Tensor,
+    key:            str,
+    cache_path:     str =               "results/cache/backends",
+    calibration:    Iterable[Tensor] =  None
+) -> Callable[[Tensor], Tensor]:
+    """# Prepare a model for execution on an inference backend.
+
+    Exported artifacts (TorchScript modules, ONNX models, and Inductor's compiled kernels) are
+    cached on disk, so later runs skip re-tracing. Weights the artifacts were exported with must
+    first be restored into the eager model (see `restore_weights`), so that both compute the same
+    function.
+
+    ## Args:
+        * model         (Module):           Eager model, in evaluation mode.
+        * backend       (str):              One of "eager", "torchscript", "compile", "onnx",
+                                            "int8-dynamic", or "int8-static".
+        * example       (Tensor):           Example input, used for tracing.
+        * key           (str):              Key of model's artifacts (i.e., model, classes, input
+                                            size, optimization, and version of cached weights).
+        * cache_path    (str, optional):    Directory in which artifacts are cached. Defaults to
+                                            "results/cache/backends".
+        * calibration   (Iterable, optional):   Batches on which static quantization is
+                                                calibrated. Defaults to None.
+
+    ## Returns:
+        * Callable: Model executed by backend.
+    """
+    # Initialize logger.
+    _logger_:   Logger =    LOGGER.getChild("backend-loader")
+
+    # Eager model needs no preparation.
+    if backend == "eager": return model
+
+    # Ensure cache path exists.
+    makedirs(name = cache_path, exist_ok = True)
+
+    # Match backend selection.
+    match backend:
+
+        # TorchScript.
+        case "torchscript":
+
+            # If module has not been traced...
+            if not exists(f"{cache_path}/{key}.pt"):
+
+                # Log action.
+                _logger_.info(f"Tracing {key} to TorchScript...")
+
+                # Trace & freeze module.
+                with no_grad(): jit.save(jit.freeze(jit.trace(model, example)), f"{cache_path}/{key}.pt")
+
+            # Load traced module.
+            return jit.load(f"{cache_path}/{key}.pt", map_location = example.device)
+
+        # torch.compile (Inductor).
+        case "compile":
+
+            # Keep Inductor's compiled kernels alongside other artifacts.
+            environ["TORCHINDUCTOR_CACHE_DIR"] =    f"{cache_path}/inductor"
+
+            # Compile model (lazily, on first call).
+            return compile(model)
+
+        # ONNX Runtime.
+        case "onnx":
+
+            # If model has not been exported...
+            if not exists(f"{cache_path}/{key}.onnx"):
+
+                # Log action.
+                _logger_.info(f"Exporting {key} to ONNX...")
+
+                # Export model, with dynamic batch & spatial dimensions (native-resolution batches vary in size).
+                onnx.export(
+                    model =         model,
+                    args =          (example,),
+                    f =             f"{cache_path}/{key}.onnx",
+                    input_names =   ["input"],
+                    output_names =  ["output"],
+                    dynamic_axes =  {"input": {0: "batch", 2: "height", 3: "width"}, "output": {0: "batch", 2: "height", 3: "width"}},
+                    dynamo =        False
+                )
+
+            # Load model into ONNX Runtime session.
+            return OnnxModule(path = f"{cache_path}/{key}.onnx")
+
+        # Dynamic INT8 quantization (CPU).
+        case "int8-dynamic":    return _on_host_(quantize_dynamic_int8(model = model))
+
+        # Static INT8 quantization (CPU).
+        case "int8-static":
+
+            # Log action.
+            _logger_.info(f"Calibrating {key} for static quantization...")
+
+            # Quantize model, calibrated on sample batches.
+            return _on_host_(quantize_static_int8(model = model, calibration = calibration))
+
+        # Invalid selection.
+        case _: raise ValueError(f"Invalid backend selection: {backend}")
+
+def restore_weights(
+    model:      Module,
+    key:        str,
+    cache_path: str =   "results/cache/backends"
+) -> Module:
+    """# Restore weights cached artifacts were exported with, or cache current weights for artifacts
+    about to be exported.
+
+    ## Args:
+        * model         (Module):           Eager model, before any optimization pass.
+        * key           (str):              Key of model's weights (i.e., model, classes, and input
+                                            size).
+        * cache_path    (str, optional):    Directory in which artifacts are cached. Defaults to
+                                            "results/cache/backends".
+
+    ## Returns:
+        * Module:   Model, with restored weights.
+    """
+    # Ensure cache path exists.
+    makedirs(name = cache_path, exist_ok = True)
+
+    # Restore cached weights, or cache current weights.
+    if exists(f"{cache_path}/{key}.weights.pt"):    model.load_state_dict(load(f"{cache_path}/{key}.weights.pt", map_location = "cpu", mmap = True, weights_only = True))
+    else:                                           save(model.state_dict(), f"{cache_path}/{key}.weights.pt")
+
+    # Return model.
+    return model
+
+def check_parity(
+    reference:  Callable[[Tensor], Tensor],
+    candidate:  Callable[[Tensor], Tensor],
+    example:    Tensor
+) -> float:
+    """# Compare outputs of a backend against the eager model.
+
+    ## Args:
+        * reference (Callable): Eager model.
+        * candidate (Callable): Model executed by backend.
+        * example   (Tensor):   Example input.
+
+    ## Returns:
+        * float:    Maximum absolute difference between outputs.
+    """
+    # Without calculating gradients, compare outputs.
+    with no_grad(): return float((candidate(example).float() - reference(example).float()).abs().max())
+
+def variant_name(
+    model_name: str,
+    backend:        str,
+    precision:      str =   "fp32",
+    optimization:   str =   "none"
+) -> str:
+    """# Label a model executed by a backend, at a precision, after optimization.
+
+    ## Args:
+        * model_name    (str):              Model selection.
+        * backend       (str):              Backend selection.
+        * precision     (str, optional):    Precision selection. Defaults to "fp32".
+        * optimization  (str, optional):    Optimization selection. Defaults to "none".
+
+    ## Returns:
+        * str:  Model name alone for unoptimized eager FP32 models, followed by backend, precision
+                and/or optimization otherwise (i.e., "u-net (compile, bf16, fuse-bn)").
+    """
+    # Qualify non-default backend, precision & optimization.
+    qualifiers: list =  [qualifier for qualifier, default in ((backend, "eager"), (precision, "fp32"), (optimization, "none")) if qualifier != default]
+
+    # Label variant.
+    return f"{model_name} ({', '.join(qualifiers)})" if qualifiers else model_name
+
+def _on_host_(
+    module: Module
+) -> Callable[[Tensor], Tensor]:
+    """# Execute a CPU-only module on inputs from any device.
+
+    ## Args:
+        * module    (Module):   Module executed on CPU.
+
+    ## Returns:
+        * Callable: Forward pass, returning outputs on device of inputs.
+    """
+    return lambda images: module(images.cpu()).to(images.device)
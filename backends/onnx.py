@@ -0,0 +1,43 @@
+"""ONNX Runtime backend."""
+
+__all__ = ["OnnxModule"]
+
+from torch                          import from_numpy, Tensor
+
+class OnnxModule():
+    """# ONNX model executed by ONNX Runtime (CPU), behaving like a module.
+
+    Inputs are copied to the host and outputs copied back to the device of the inputs, so the
+    wrapper is a drop-in replacement for the model it was exported from.
+    """
+
+    def __init__(self,
+        path:   str
+    ):
+        """# Initialize ONNX Runtime session.
+
+        ## Args:
+            * path  (str):  Path to ONNX model.
+        """
+        # ONNX Runtime is only required by this backend.
+        try:                from onnxruntime import InferenceSession
+        except ImportError: raise ImportError("The ONNX backend requires onnxruntime (pip install onnxruntime)")
+
+        # Initialize session.
+        self.session:       InferenceSession =  InferenceSession(path, providers = ["CPUExecutionProvider"])
+
+        # Define input name.
+        self.input_name:    str =               self.session.get_inputs()[0].name
+
+    def __call__(self,
+        images: Tensor
+    ) -> Tensor:
+        """# Execute forward pass.
+
+        ## Args:
+            * images    (Tensor):   Batch of images.
+
+        ## Returns:
+            * Tensor:   Model outputs, on device of images.
+        """
+        return from_numpy(self.session.run(None, {self.input_name: images.float().cpu().numpy()})[0]).to(images.device)
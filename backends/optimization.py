@@ -0,0 +1,124 @@
+"""Inference graph optimizations."""
+
+__all__ = ["fuse_conv_bn", "optimization_passes", "optimize_model"]
+
+from torch                          import channels_last
+from torch.nn                       import BatchNorm2d, Conv2d, Identity, Module, Sequential
+from torch.nn.utils.fusion          import fuse_conv_bn_eval
+
+def fuse_conv_bn(
+    model:  Module
+) -> int:
+    """# Fold batch normalization layers into the convolutions preceding them, in place.
+
+    Models are not traced (most of them contain data-dependent control flow); instead, execution
+    order is taken from sequential containers, in which a convolution (or a sequential block
+    ending in one, such as a separable convolution) directly followed by batch normalization is
+    fused, and the normalization replaced by an identity.
+
+    ## Args:
+        * model (Module):   Model, in evaluation mode.
+
+    ## Returns:
+        * int:  Number of pairs fused.
+    """
+    # Initialize count.
+    fused:  int =   0
+
+    # For each sequential container in model...
+    for container in [module for module in model.modules() if isinstance(module, Sequential)]:
+
+        # Define children, in execution order.
+        children:   list =  list(container.named_children())
+
+        # For each pair of consecutive children...
+        for (name, child), (next_name, next_child) in zip(children, children[1:]):
+
+            # Locate convolution ending child.
+            parent, conv_name = _last_conv_(container, name)
+
+            # Skip pairs other than convolution & batch normalization.
+            if parent is None or not isinstance(next_child, BatchNorm2d): continue
+
+            # Fold normalization into convolution.
+            setattr(parent, conv_name, fuse_conv_bn_eval(getattr(parent, conv_name), next_child))
+            setattr(container, next_name, Identity())
+            fused += 1
+
+    # Return count.
+    return fused
+
+def optimization_passes(
+    optimization:   str
+) -> set[str]:
+    """# Expand an optimization selection into its passes.
+
+    ## Args:
+        * optimization  (str):  One of "none", "fuse-bn", "channels-last", "inference-mode", or
+                                "all".
+
+    ## Returns:
+        * set[str]: Passes applied.
+    """
+    # Match optimization selection.
+    match optimization:
+
+        # No optimization.
+        case "none":                                                return set()
+
+        # Single pass.
+        case "fuse-bn" | "channels-last" | "inference-mode":       return {optimization}
+
+        # Every pass.
+        case "all":                                                 return {"fuse-bn", "channels-last", "inference-mode"}
+
+        # Invalid selection.
+        case _:                                                     raise ValueError(f"Invalid optimization selection: {optimization}")
+
+def optimize_model(
+    model:  Module,
+    passes: set[str]
+) -> Module:
+    """# Apply graph optimization passes to a model, in place.
+
+    ## Args:
+        * model     (Module):   Model, in evaluation mode.
+        * passes    (set[str]): Passes applied (see `optimization_passes`). Inference mode is not
+                                a property of the model, and is applied around forward passes.
+
+    ## Returns:
+        * Module:   Optimized model.
+    """
+    # Fold batch normalization into convolutions.
+    if "fuse-bn" in passes:         fuse_conv_bn(model = model)
+
+    # Store convolution weights in NHWC layout.
+    if "channels-last" in passes:   model.to(memory_format = channels_last)
+
+    # Return optimized model.
+    return model
+
+def _last_conv_(
+    parent: Module,
+    name:   str
+) -> tuple[Module, str]:
+    """# Locate the convolution computing a module's output, if it ends in one.
+
+    ## Args:
+        * parent    (Module):   Parent of module.
+        * name      (str):      Attribute name of module within parent.
+
+    ## Returns:
+        * tuple[Module, str]:   Parent & attribute name of convolution, or (None, None).
+    """
+    # Define module.
+    module: Module =    getattr(parent, name)
+
+    # Module is a convolution.
+    if isinstance(module, Conv2d):                      return parent, name
+
+    # Sequential block ends with its last child.
+    if isinstance(module, Sequential) and len(module):  return _last_conv_(module, list(module._modules)[-1])
+
+    # Otherwise, module does not end in a convolution.
+    return None, None
@@ -0,0 +1,38 @@
+"""Inference precision modes."""
+
+__all__ = ["AUTOCAST_BACKENDS", "precision_context"]
+
+from contextlib                     import AbstractContextManager, nullcontext
+
+from torch                          import autocast, bfloat16, device as Device, float16
+
+# Backends whose kernels follow autocast (others execute at the precision they were exported in).
+AUTOCAST_BACKENDS:  list =  ["eager", "compile"]
+
+def precision_context(
+    precision:  str,
+    device:     str
+) -> AbstractContextManager:
+    """# Select autocast device type & dtype of a precision mode.
+
+    ## Args:
+        * precision (str):  One of "fp32", "bf16", or "fp16".
+        * device    (str):  Device on which model is executed (i.e., "cuda", "cuda:1", "cpu").
+
+    ## Returns:
+        * AbstractContextManager:   Autocast context (or a no-op context for FP32).
+    """
+    # Match precision selection.
+    match precision:
+
+        # Full precision.
+        case "fp32":    return nullcontext()
+
+        # Brain floating point (i.e., CPUs with AVX-512 BF16/AMX, Ampere GPUs).
+        case "bf16":    return autocast(device_type = Device(device).type, dtype = bfloat16)
+
+        # Half precision.
+        case "fp16":    return autocast(device_type = Device(device).type, dtype = float16)
+
+        # Invalid selection.
+        case _:         raise ValueError(f"Invalid precision selection: {precision}")
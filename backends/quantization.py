@@ -0,0 +1,146 @@
+"""Post-training INT8 quantization."""
+
+__all__ = ["dynamic_layers", "quantize_dynamic_int8", "quantize_static_int8"]
+
+from copy                           import deepcopy
+from typing                         import Iterable
+
+from torch                          import backends, no_grad, qint8, Tensor
+from torch.ao.quantization          import get_default_qconfig_mapping, quantize_dynamic
+from torch.ao.quantization.quantize_fx import convert_fx, prepare_fx
+from torch.fx.proxy                 import TraceError
+from torch.nn                       import Linear, Module, Sequential
+
+# Layers with dynamically quantized kernels.
+DYNAMIC_LAYERS: set[type] = {Linear}
+
+def dynamic_layers(
+    model:  Module
+) -> int:
+    """# Count the layers of a model that dynamic quantization quantizes.
+
+    ## Args:
+        * model (Module):   Model (or its structure alone, on the meta device).
+
+    ## Returns:
+        * int:  Number of layers with dynamically quantized kernels (if none, a dynamically
+                quantized model executes entirely in FP32).
+    """
+    return sum(isinstance(module, tuple(DYNAMIC_LAYERS)) for module in model.modules())
+
+def quantize_dynamic_int8(
+    model:  Module
+) -> Module:
+    """# Quantize a copy of a model dynamically (INT8 weights, activations quantized on the fly).
+
+    Only linear layers have dynamically quantized kernels, so convolutions remain in FP32 (i.e.,
+    this mostly affects transformer blocks & MLP heads).
+
+    ## Args:
+        * model (Module):   FP32 model, on CPU.
+
+    ## Returns:
+        * Module:   Quantized model.
+    """
+    # Select quantized kernels for this CPU.
+    _select_engine_()
+
+    # Quantize linear layers of a copy.
+    return quantize_dynamic(deepcopy(model).cpu().eval(), DYNAMIC_LAYERS, dtype = qint8)
+
+def quantize_static_int8(
+    model:          Module,
+    calibration:    Iterable[Tensor]
+) -> Module:
+    """# Quantize a copy of a model statically (INT8 weights & activations), calibrating activation
+    ranges on sample inputs.
+
+    Models are quantized in FX graph mode. Sub-modules containing data-dependent control flow
+    cannot be traced, so the largest traceable sub-modules are quantized individually (each
+    quantizing its inputs and dequantizing its outputs), and the remaining glue runs in FP32.
+
+    ## Args:
+        * model         (Module):           FP32 model.
+        * calibration   (Iterable[Tensor]): Calibration batches.
+
+    ## Returns:
+        * Module:   Quantized model, on CPU.
+    """
+    # Select quantized kernels for this CPU.
+    engine:     str =       _select_engine_()
+
+    # Prepare a copy (held in a container, so that even the model itself has a parent), inserting
+    # observers into traceable sub-modules.
+    holder:     Sequential =    Sequential(deepcopy(model).cpu().eval())
+    prepared:   list =          _prepare_(parent = holder, name = "0", engine = engine)
+
+    # Observe activation ranges on calibration batches.
+    with no_grad():
+        for images in calibration: holder(images.cpu())
+
+    # For each prepared sub-module...
+    for parent, name, attributes in prepared:
+
+        # Swap in quantized counterpart.
+        setattr(parent, name, convert_fx(getattr(parent, name)))
+
+        # Restore its attributes.
+        for attribute, value in attributes.items(): setattr(getattr(parent, name), attribute, value)
+
+    # Return quantized model.
+    return holder[0]
+
+def _prepare_(
+    parent: Module,
+    name:   str,
+    engine: str
+) -> list[tuple[Module, str, dict]]:
+    """# Insert observers into the largest traceable sub-modules of a module.
+
+    ## Args:
+        * parent    (Module):   Parent of module being prepared.
+        * name      (str):      Attribute name of module within parent.
+        * engine    (str):      Quantized engine.
+
+    ## Returns:
+        * list[tuple[Module, str, dict]]:   Parent, attribute name, and plain attributes of each
+                                            prepared sub-module.
+    """
+    # Define module being prepared.
+    module: Module =    getattr(parent, name)
+
+    # Collect plain attributes & properties read by surrounding code (i.e., an encoder's output
+    # stride), which traced modules would otherwise lose.
+    attributes: dict =  {
+                            attribute: getattr(module, attribute) for attribute in [*vars(module), *dir(type(module))]
+                            if not attribute.startswith("_") and attribute != "training"
+                            and (attribute in vars(module) or isinstance(getattr(type(module), attribute), property))
+                        }
+
+    # Attempt to trace module as a whole.
+    try:    prepared: Module =  prepare_fx(module, get_default_qconfig_mapping(engine), ())
+
+    # Otherwise (i.e., data-dependent control flow, or a container without a forward pass), prepare
+    # each child.
+    except (NotImplementedError, TraceError, TypeError):  return [entry for child in dict(module.named_children()) for entry in _prepare_(parent = module, name = child, engine = engine)]
+
+    # Restore attributes onto prepared module.
+    for attribute, value in attributes.items(): setattr(prepared, attribute, value)
+
+    # Swap in prepared module.
+    setattr(parent, name, prepared)
+
+    # Report prepared module.
+    return [(parent, name, attributes)]
+
+def _select_engine_() -> str:
+    """# Select quantized kernels supported by this CPU.
+
+    ## Returns:
+        * str:  Quantized engine ("x86" or "fbgemm" on x86 CPUs, "qnnpack" on ARM CPUs).
+    """
+    # Prefer x86 kernels, then FBGEMM, then QNNPACK.
+    backends.quantized.engine = next(engine for engine in ["x86", "fbgemm", "qnnpack"] if engine in backends.quantized.supported_engines)
+
+    # Return selection.
+    return backends.quantized.engine
@@ -0,0 +1,156 @@
+"""Sliding-window tiled inference."""
+
+__all__ = ["blend_weights", "TILE_BLENDS", "TiledRunner"]
+
+from typing                         import Callable
+
+from torch                          import arange, device as Device, exp, float32, minimum, stack, Tensor, zeros
+from torch.nn.functional            import pad
+
+# Tiles must be divisible by the models' output stride.
+TILE_MULTIPLE:  int =       32
+
+# Blends of overlapping tiles supported.
+TILE_BLENDS:    list[str] = ["gaussian", "linear"]
+
+def blend_weights(
+    tile_size:  int,
+    blend:      str =   "gaussian",
+    device:     str =   "cpu"
+) -> Tensor:
+    """# Weight map blending overlapping tiles.
+
+    ## Args:
+        * tile_size (int):              Side of (square) tiles.
+        * blend     (str, optional):    "gaussian" (centered, sigma of 1/8 of the tile) or "linear"
+                                        (tent, falling from the center to the edges). Defaults to
+                                        "gaussian".
+        * device    (str, optional):    Device on which weights are placed. Defaults to "cpu".
+
+    ## Returns:
+        * Tensor:   Strictly positive weights, peaking at 1 in the center, shaped [1, 1, T, T].
+    """
+    # Define distance of each pixel center from tile center, along one axis.
+    offsets:    Tensor =    arange(tile_size, dtype = float32, device = Device(device)) - (tile_size - 1) / 2
+
+    # Match blend selection.
+    match blend:
+
+        # Gaussian, so that tile centers dominate their borders.
+        case "gaussian":    profile = exp(-0.5 * (offsets / (tile_size / 8)) ** 2)
+
+        # Tent, falling linearly from center to edges.
+        case "linear":      profile = minimum(arange(1, tile_size + 1, dtype = float32, device = Device(device)), arange(tile_size, 0, -1, dtype = float32, device = Device(device))) / ((tile_size + 1) / 2)
+
+        # Invalid selection.
+        case _:             raise ValueError(f"Invalid tile blend: {blend}")
+
+    # Combine axes, keeping borders above zero so that every pixel is covered.
+    return (profile.view(-1, 1) * profile.view(1, -1)).clamp_(min = 1e-6).view(1, 1, tile_size, tile_size)
+
+class TiledRunner():
+    """# Model executed over overlapping tiles, behaving like the model.
+
+    Each image is covered by square tiles, overlapping by a fraction of their side, and tiles from
+    all images of the batch are forwarded `tile_batch` at a time, so that the device stays busy
+    while activation memory is bounded by the tile batch rather than by the image size. Logits of
+    overlapping tiles are blended by a weight map, accumulating into a single output buffer. Images
+    smaller than a tile are padded up to it, and the padding cropped from the output.
+    """
+
+    def __init__(self,
+        runner:     Callable[[Tensor], Tensor],
+        tile_size:  int =   512,
+        overlap:    float = 0.25,
+        blend:      str =   "gaussian",
+        tile_batch: int =   16
+    ):
+        """# Initialize tiled runner.
+
+        ## Args:
+            * runner        (Callable):         Model (or backend) executing a batch of tiles.
+            * tile_size     (int, optional):    Side of (square) tiles, a multiple of 32. Defaults
+                                                to 512.
+            * overlap       (float, optional):  Fraction of each tile overlapping its neighbours,
+                                                in [0, 1). Defaults to 0.25.
+            * blend         (str, optional):    Blending of overlapping logits ("gaussian" or
+                                                "linear"). Defaults to "gaussian".
+            * tile_batch    (int, optional):    Tiles forwarded at once. Defaults to 16.
+        """
+        # Validate configuration.
+        if tile_size % TILE_MULTIPLE:   raise ValueError(f"Tile size must be a multiple of {TILE_MULTIPLE}, got {tile_size}")
+        if not 0 <= overlap < 1:        raise ValueError(f"Tile overlap must be in [0, 1), got {overlap}")
+        if blend not in TILE_BLENDS:    raise ValueError(f"Invalid tile blend: {blend}")
+
+        # Define configuration.
+        self.runner:        Callable =  runner
+        self.tile_size:     int =       tile_size
+        self.stride:        int =       max(int(tile_size * (1 - overlap)), 1)
+        self.blend:         str =       blend
+        self.tile_batch:    int =       max(tile_batch, 1)
+
+    def __call__(self,
+        images: Tensor
+    ) -> Tensor:
+        """# Execute forward pass, tile by tile.
+
+        ## Args:
+            * images    (Tensor):   Batch of images, shaped [B, C, H, W].
+
+        ## Returns:
+            * Tensor:   Blended logits, shaped [B, K, H, W] (float32).
+        """
+        # Pad images smaller than a tile up to it.
+        height, width = images.shape[-2:]
+        images:     Tensor =    pad(images, (0, max(self.tile_size - width, 0), 0, max(self.tile_size - height, 0)))
+
+        # Define tile positions covering each image (the last tile of each axis is flush with its edge).
+        tiles:      list =      [
+                                    (index, top, left)
+                                    for index in range(len(images))
+                                    for top in self._starts_(images.shape[-2])
+                                    for left in self._starts_(images.shape[-1])
+                                ]
+
+        # Initialize weight map, and output & weight buffers once the number of classes is known.
+        weights:    Tensor =    blend_weights(tile_size = self.tile_size, blend = self.blend, device = images.device)
+        logits:     Tensor =    None
+        coverage:   Tensor =    zeros(len(images), 1, *images.shape[-2:], device = images.device)
+
+        # For each batch of tiles...
+        for start in range(0, len(tiles), self.tile_batch):
+
+            # Forward tiles at once.
+            chunk:      list =      tiles[start:start + self.tile_batch]
+            outputs:    Tensor =    self.runner(stack([images[index, :, top:top + self.tile_size, left:left + self.tile_size] for index, top, left in chunk])).float()
+
+            # Allocate output buffer on first batch.
+            if logits is None: logits = zeros(len(images), outputs.shape[1], *images.shape[-2:], device = images.device)
+
+            # Accumulate weighted logits & weights of each tile.
+            for (index, top, left), output in zip(chunk, outputs):
+                logits[index, :, top:top + self.tile_size, left:left + self.tile_size].add_(output * weights[0])
+                coverage[index, :, top:top + self.tile_size, left:left + self.tile_size].add_(weights[0])
+
+        # Normalize blended logits, cropping padding.
+        return logits.div_(coverage)[..., :height, :width]
+
+    def _starts_(self,
+        extent: int
+    ) -> list[int]:
+        """# Start offsets of tiles along an axis.
+
+        ## Args:
+            * extent    (int):  Length of axis (at least one tile).
+
+        ## Returns:
+            * list[int]:    Offsets, `stride` apart, with the last tile flush with the end of axis.
+        """
+        # Step by stride, until the last tile would overflow.
+        starts: list =  list(range(0, extent - self.tile_size + 1, self.stride))
+
+        # Add a tile flush with the end of axis, if not covered yet.
+        if starts[-1] + self.tile_size < extent: starts.append(extent - self.tile_size)
+
+        # Return offsets.
+        return starts
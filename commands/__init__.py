@@ -1,3 +1,33 @@
-"""Commands package."""
+"""Commands package.
 
-from commands.benchmark import run_benchmark
\ No newline at end of file
+Commands are loaded on first access, so that importing the package (i.e., to dispatch a command)
+only imports the dependencies of the command being run.
+"""
+
+__all__ = ["run_benchmark", "run_startup", "run_sweep"]
+
+from importlib          import import_module
+
+# Module defining each command.
+_COMMANDS_: dict =  {
+                        "run_benchmark":    "commands.benchmark",
+                        "run_startup":      "commands.startup",
+                        "run_sweep":        "commands.sweep"
+                    }
+
+def __getattr__(
+    name:   str
+) -> object:
+    """# Load a command on first access.
+
+    ## Args:
+        * name  (str):  Command being accessed.
+
+    ## Returns:
+        * object:   Command.
+    """
+    # Verify that command exists.
+    if name not in _COMMANDS_: raise AttributeError(f"module 'commands' has no attribute '{name}'")
+
+    # Import command's module.
+    return getattr(import_module(_COMMANDS_[name]), name)
\ No newline at end of file
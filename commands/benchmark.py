@@ -2,46 +2,79 @@
 
 __all__ = ["run_benchmark"]
 
-from json                           import dumps
 from logging                        import Logger
-from time                           import time
 
-from numpy                          import isnan, round
+from numpy                          import nan
 from pandas                         import DataFrame
-from thop                           import profile
-from torch                          import argmax, int64, max, no_grad, randn, Tensor
-from torch.amp                      import autocast, GradScaler
-from torch.cuda                     import empty_cache, is_available, max_memory_allocated, memory_allocated
-from torchvision.datasets           import OxfordIIITPet, VOCSegmentation
-from torch.nn                       import Module
-from torch.nn.functional            import softmax
+from torch                          import device as Device
 from torch.utils.data               import DataLoader
-from tqdm                           import tqdm
 
-from datasets                       import load_dataset
-from metrics                        import calculate_metrics, plot_results
-from models                         import load_model
-from preprocess                     import preprocess_pets_mask, preprocess_voc_mask
+from backends                       import AUTOCAST_BACKENDS, dynamic_layers, variant_name
+from commands.checkpoint            import ResultCache
+from commands.evaluation            import evaluate_model
+from commands.parallel              import run_parallel
+from datasets                       import DevicePrefetcher, load_dataset
+from metrics                        import AsyncMetricEvaluator, plot_results
+from models                         import load_model, weights_version
 from utilities                      import LOGGER, TIMESTAMP
 
 def run_benchmark(
-    dataset_name:   str =           "pets",
-    num_classes:    int =           3,
-    models:         list[str] =     ["deeplab-v3", "fpn", "seg-former", "u-net"],
-    batch_size:     int =           8, 
-    num_workers:    int =           4,
-    device:         str =           "cuda",
-    save_path:      str =           "results",
-    use_amp:        bool =          True,
-    input_size:     tuple[int] =    (512, 512),
+    dataset_name:           str =           "pets",
+    num_classes:            int =           3,
+    models:                 list[str] =     ["deeplab-v3", "fpn", "seg-former", "u-net"],
+    batch_size:             int =           8, 
+    num_workers:            int =           4,
+    device:                 str =           "cuda",
+    save_path:              str =           "results",
+    precisions:             list[str] =     ["fp32"],
+    input_size:             tuple[int] =    (512, 512),
+    hausdorff_backend:      str =           "edt",
+    hausdorff_percentile:   float =         100.0,
+    hausdorff_stride:       int =           1,
+    confidence:             bool =          False,
+    warmup_iterations:      int =           10,
+    cache_dataset:          bool =          False,
+    cache_path:             str =           "data/cache",
+    pin_memory:             bool =          True,
+    persistent_workers:     bool =          True,
+    prefetch_factor:        int =           2,
+    prefetch_depth:         int =           1,
+    async_metrics:          bool =          False,
+    metric_workers:         int =           2,
+    metric_executor:        str =           "thread",
+    max_pending_batches:    int =           4,
+    parallel_models:        int =           1,
+    calibration_batches:    int =           10,
+    interference_tolerance: float =         0.10,
+    result_cache:           str =           "results/cache",
+    resume:                 bool =          True,
+    checkpoint_interval:    int =           50,
+    profile:                bool =          False,
+    profile_iterations:     int =           10,
+    profile_depth:          int =           3,
+    profile_top:            int =           20,
+    backends:               list[str] =     ["eager"],
+    parity_tolerance:       float =         1e-3,
+    quantization_samples:   int =           64,
+    optimizations:          list[str] =     ["none"],
+    weights:                str =           "random",
+    weights_cache:          str =           "models/cache",
+    num_samples:            int =           256,
+    seed:                   int =           0,
+    trace_memory:           bool =          False,
+    native_resolution:      bool =          False,
+    tile_size:              int =           None,
+    tile_overlap:           float =         0.25,
+    tile_blend:             str =           "gaussian",
+    tile_batch:             int =           16,
     **kwargs
 ) -> DataFrame:
     """# Run the benchmark on all models and compile results.
 
     ## Args:
         * dataset_name  (str, optional):        Dataset on which model(s) will be evaluated. 
-                                                Options are "pets", "coco", and "voc". Defaults 
-                                                to "pets".
+                                                Options are "pets", "voc", and "synthetic". 
+                                                Defaults to "pets".
         * models        (list[str], optional):  List of models being evaluated. Options are 
                                                 "unet", "deeplabv3", "fpn". Defaults to None.
         * batch_size    (int, optional):        Dataloader batch size. Defaults to 8.
@@ -50,7 +83,98 @@ def run_benchmark(
         * device        (str, optional):        One of "cuda" or "cpu". Defaults to "cuda".
         * save_path     (str, optional):        Path at which evaluation report(s) will be 
                                                 saved. Defaults to "results".
-        * use_amp       (bool, optional):       Use autocast mixed precision. Defaults to True.
+        * precisions    (list[str], optional):  Precisions at which each model is evaluated, as 
+                                                a separate variant ("fp32", "bf16", or "fp16", 
+                                                autocast on the selected device). Defaults to 
+                                                FP32 only.
+        * hausdorff_backend     (str, optional):    Hausdorff distance backend ("edt", "medpy", 
+                                                    or "none"). Defaults to "edt".
+        * hausdorff_percentile  (float, optional):  Percentile of surface distances reported 
+                                                    (i.e., 95 for HD95). Defaults to 100.
+        * hausdorff_stride      (int, optional):    Hausdorff boundary subsampling cell size. 
+                                                    Defaults to 1 (exact).
+        * confidence            (bool, optional):   Also report mean confidence (maximum softmax 
+                                                    probability) of predictions. Defaults to 
+                                                    False.
+        * warmup_iterations     (int, optional):    Untimed forward passes executed before 
+                                                    measuring each model. Defaults to 10.
+        * cache_dataset         (bool, optional):   Serve samples from a memory-mapped cache of 
+                                                    resized images & masks. Defaults to False.
+        * cache_path            (str, optional):    Directory under which dataset caches are 
+                                                    stored. Defaults to "data/cache".
+        * pin_memory            (bool, optional):   Collate batches into page-locked memory (CUDA 
+                                                    only). Defaults to True.
+        * persistent_workers    (bool, optional):   Keep data loading workers alive across models. 
+                                                    Defaults to True.
+        * prefetch_factor       (int, optional):    Batches loaded in advance by each worker. 
+                                                    Defaults to 2.
+        * prefetch_depth        (int, optional):    Batches kept in flight to the device ahead of 
+                                                    the forward pass. Defaults to 1.
+        * async_metrics         (bool, optional):   Evaluate metrics in a worker pool while 
+                                                    inference continues. Defaults to False.
+        * metric_workers        (int, optional):    Number of metric workers. Defaults to 2.
+        * metric_executor       (str, optional):    One of "thread" or "process". Defaults to 
+                                                    "thread".
+        * max_pending_batches   (int, optional):    Maximum number of batches awaiting metric 
+                                                    evaluation. Defaults to 4.
+        * parallel_models       (int, optional):    Number of models evaluated concurrently, in 
+                                                    core-pinned worker processes. Defaults to 1 
+                                                    (sequential).
+        * calibration_batches   (int, optional):    Batches timed in each solo calibration run when 
+                                                    evaluating in parallel. Defaults to 10.
+        * interference_tolerance    (float, optional):  Relative slowdown over solo calibration 
+                                                        above which interference between parallel 
+                                                        models is reported. Defaults to 0.10.
+        * result_cache          (str, optional):    Directory in which results & checkpoints are 
+                                                    cached. Defaults to "results/cache".
+        * resume                (bool, optional):   Reuse cached results and resume from 
+                                                    checkpoints. Defaults to True.
+        * checkpoint_interval   (int, optional):    Batches between checkpoints of partial model 
+                                                    state. Defaults to 50.
+        * profile               (bool, optional):   Profile time & memory of each model stage, 
+                                                    exporting a Chrome trace and a table of top 
+                                                    stages alongside results. Defaults to False.
+        * profile_iterations    (int, optional):    Profiled forward passes. Defaults to 10.
+        * profile_depth         (int, optional):    Depth of deepest stages profiled. Defaults to 
+                                                    3.
+        * profile_top           (int, optional):    Number of stages reported. Defaults to 20.
+        * backends              (list[str], optional):  Inference backends on which each model is 
+                                                        evaluated, as a separate variant ("eager", 
+                                                        "torchscript", "compile", "onnx", 
+                                                        "int8-dynamic", or "int8-static"). Defaults 
+                                                        to eager only.
+        * parity_tolerance      (float, optional):  Maximum absolute difference from eager outputs 
+                                                    tolerated of other backends. Defaults to 1e-3.
+        * quantization_samples  (int, optional):    Images on which static quantization is 
+                                                    calibrated. Defaults to 64.
+        * optimizations         (list[str], optional):  Graph optimizations applied to each model, 
+                                                        as a separate variant ("none", "fuse-bn", 
+                                                        "channels-last", "inference-mode", or 
+                                                        "all"). Defaults to none.
+        * weights               (str, optional):    Model weights ("random", "imagenet", or 
+                                                    "checkpoint"). Defaults to "random".
+        * weights_cache         (str, optional):    Directory in which pretrained weights & 
+                                                    checkpoints are cached. Defaults to 
+                                                    "models/cache".
+        * num_samples           (int, optional):    Number of samples of synthetic dataset. 
+                                                    Defaults to 256.
+        * seed                  (int, optional):    Seed of synthetic dataset. Defaults to 0.
+        * trace_memory          (bool, optional):   Also trace peak Python heap allocations of 
+                                                    each model (slow). Defaults to False.
+        * native_resolution     (bool, optional):   Evaluate Pets & VOC images at their own 
+                                                    resolution, in aspect-ratio bucketed batches 
+                                                    padded to a multiple of 32, instead of resizing 
+                                                    them to `input_size`. Defaults to False.
+        * tile_size             (int, optional):    Execute models over square tiles of this side 
+                                                    (a multiple of 32), blending their logits, and 
+                                                    compare peak memory with whole-image inference. 
+                                                    Defaults to None (whole images).
+        * tile_overlap          (float, optional):  Fraction of each tile overlapping its 
+                                                    neighbours. Defaults to 0.25.
+        * tile_blend            (str, optional):    Blending of overlapping logits ("gaussian" or 
+                                                    "linear"). Defaults to "gaussian".
+        * tile_batch            (int, optional):    Tiles forwarded at once, across images of a 
+                                                    batch. Defaults to 16.
     
     ## Returns:
         * DataFrame:    Metrics report.
@@ -58,181 +182,205 @@ def run_benchmark(
     # Initialize logger.
     _logger_:   Logger =                            LOGGER.getChild("benchmark")
     
-    # Initialize results array.
-    results:    list =                              []
+    # Define variants, one per model, backend, precision & optimization (reduced precision only applies to backends that follow autocast).
+    variants:   dict =                              {
+                                                        variant_name(model_name, backend, precision, optimization): (model_name, backend, precision, optimization)
+                                                        for model_name in models for backend in backends for precision in precisions for optimization in optimizations
+                                                        if precision == "fp32" or backend in AUTOCAST_BACKENDS
+                                                    }
     
-    # Load dataset.
-    dataloader: DataLoader =                        load_dataset(
-                                                        dataset_name =  dataset_name,
-                                                        batch_size =    batch_size,
-                                                        num_workers =   num_workers,
-                                                        input_size =    input_size
+    # For each model without layers that dynamic quantization quantizes (inspecting its structure alone, on the meta device)...
+    for model_name in [model_name for model_name in models if "int8-dynamic" in backends and not _dynamic_layers_(model_name, num_classes)]:
+        
+        # Log skip (its dynamically quantized variants would execute in FP32, under an INT8 label).
+        _logger_.warning(f"Skipping int8-dynamic variants of {model_name}, which has no linear layers to quantize.")
+        
+        # Drop its dynamically quantized variants.
+        variants:   dict =                          {variant: config for variant, config in variants.items() if config[:2] != (model_name, "int8-dynamic")}
+    
+    # Initialize result cache, keyed by run configuration (and calibration of static INT8 variants, and version of cached weights files).
+    cache:      ResultCache =                       ResultCache(
+                                                        path =                  result_cache,
+                                                        variant_config =        {
+                                                                                    variant: {
+                                                                                        **({"quantization_samples": quantization_samples} if backend == "int8-static" else {}),
+                                                                                        **({"weights_version": weights_version(model_name, num_classes, weights, weights_cache)} if weights != "random" else {})
+                                                                                    }
+                                                                                    for variant, (model_name, backend, _, _) in variants.items()
+                                                                                },
+                                                        dataset_name =          dataset_name,
+                                                        num_classes =           num_classes,
+                                                        input_size =            list(input_size),
+                                                        batch_size =            batch_size,
+                                                        device =                device,
+                                                        hausdorff_backend =     hausdorff_backend,
+                                                        hausdorff_percentile =  hausdorff_percentile,
+                                                        hausdorff_stride =      hausdorff_stride,
+                                                        weights =               weights,
+                                                        **({"confidence": True} if confidence else {}),
+                                                        **({"num_samples": num_samples, "seed": seed} if dataset_name == "synthetic" else {}),
+                                                        **({"native_resolution": True} if native_resolution else {}),
+                                                        **({"tile_size": tile_size, "tile_overlap": tile_overlap, "tile_blend": tile_blend} if tile_size else {})
                                                     )
     
-    # Log dataset info for debugging.
-    _logger_.debug(f"""Dataset:        {dataset_name}
-    Number of samples:  {len(dataloader)}
-    Number of classes:  {num_classes}
-    Batch size:         {batch_size}
-    Device:             {device}
-    Mixed Precision:    {use_amp}""")
+    # Start afresh, if not resuming.
+    if not resume:
+        for variant in variants: cache.clear(variant)
     
-    # For each model in the list...
-    for model_name in models:
-        
-        # Log action.
-        _logger_.info(f"Evaluating {model_name} on {dataset_name}.")
-        
-        # Initialize model.
-        model:                  Module =        load_model(model_name)
-        
-        # Set model to evaluation mode.
-        model.eval()
-        
-        # Calulcate dimensions of input.
-        input:                  Tensor =        randn(
-                                                    batch_size, 
-                                                    3, 
-                                                    input_size[0], 
-                                                    input_size[1]
-                                                ).to(device)
-        
-        # Calculate FLOPs
-        flops, parameters =                     profile(
-                                                    model =         model,
-                                                    inputs =        (input,),
-                                                    verbose =       False
-                                                )
-        
-        _logger_.info(f"FLOPS: {flops}, PARAMETERS: {parameters}")
-        
-        # Initialize metrics map.
-        metrics_sum:            dict =          {
-                                                    "Dice Score":   0.0,
-                                                    "Precision":    0.0,
-                                                    "Recall":       0.0,
-                                                    "Hausdorff":    0.0
-                                                }
-        
-        # Initialize count of iterations.
-        metrics_count:          int =           0
+    # Load results of variants already completed.
+    completed:  dict =                              {variant: cache.load_result(variant) for variant in variants}
+    
+    # For each completed variant, log skip.
+    for variant in [variant for variant in variants if completed[variant] is not None]:
+        _logger_.info(f"Using cached results for {variant}.")
+    
+    # Define variants remaining.
+    pending:    list =                              [variant for variant in variants if completed[variant] is None]
+    
+    # If evaluating models concurrently...
+    if parallel_models > 1 and pending:
         
-        # Track computational costs.
-        total_inference_time:   float =         0
-        start_memory:           int =           memory_allocated(device) if is_available() else 0
+        # Schedule models across core-pinned worker processes.
+        rows:   list =                              run_parallel(
+                                                        variants =                  [variants[variant] for variant in pending],
+                                                        parallel_models =           parallel_models,
+                                                        calibration_batches =       calibration_batches,
+                                                        interference_tolerance =    interference_tolerance,
+                                                        dataset_name =              dataset_name,
+                                                        num_classes =               num_classes,
+                                                        batch_size =                batch_size,
+                                                        device =                    device,
+                                                        input_size =                input_size,
+                                                        hausdorff_backend =         hausdorff_backend,
+                                                        hausdorff_percentile =      hausdorff_percentile,
+                                                        hausdorff_stride =          hausdorff_stride,
+                                                        confidence =                confidence,
+                                                        warmup_iterations =         warmup_iterations,
+                                                        cache_path =                cache_path,
+                                                        pin_memory =                pin_memory,
+                                                        prefetch_factor =           prefetch_factor,
+                                                        prefetch_depth =            prefetch_depth,
+                                                        cache =                     cache,
+                                                        checkpoint_interval =       checkpoint_interval,
+                                                        cost_cache =                f"{result_cache}/costs",
+                                                        profile =                   profile,
+                                                        profile_iterations =        profile_iterations,
+                                                        profile_depth =             profile_depth,
+                                                        profile_top =               profile_top,
+                                                        save_path =                 save_path,
+                                                        backend_cache =             f"{result_cache}/backends",
+                                                        parity_tolerance =          parity_tolerance,
+                                                        quantization_samples =      quantization_samples,
+                                                        weights =                   weights,
+                                                        weights_cache =             weights_cache,
+                                                        num_samples =               num_samples,
+                                                        seed =                      seed,
+                                                        trace_memory =              trace_memory,
+                                                        native_resolution =         native_resolution,
+                                                        tile_size =                 tile_size,
+                                                        tile_overlap =              tile_overlap,
+                                                        tile_blend =                tile_blend,
+                                                        tile_batch =                tile_batch
+                                                    )
         
-        # Initialize gradient scaler.
-        scaler:                 GradScaler =    GradScaler()
+        # Record results.
+        completed.update(zip(pending, rows))
+    
+    # Otherwise, evaluate models one after another.
+    elif pending:
         
-        # Without calculating gradients...
-        with no_grad():
+        # Load dataset.
+        dataloader: DataLoader =                        load_dataset(
+                                                            dataset_name =          dataset_name,
+                                                            batch_size =            batch_size,
+                                                            num_workers =           num_workers,
+                                                            input_size =            input_size,
+                                                            cache_dataset =         cache_dataset,
+                                                            cache_path =            cache_path,
+                                                            pin_memory =            pin_memory,
+                                                            persistent_workers =    persistent_workers,
+                                                            prefetch_factor =       prefetch_factor,
+                                                            num_classes =           num_classes,
+                                                            num_samples =           num_samples,
+                                                            seed =                  seed,
+                                                            native_resolution =     native_resolution
+                                                        )
+    
+        # Keep upcoming batches resident on device ahead of the forward pass.
+        prefetcher: DevicePrefetcher =                  DevicePrefetcher(
+                                                            loader =    dataloader,
+                                                            device =    device,
+                                                            depth =     prefetch_depth
+                                                        )
+    
+        # Initialize asynchronous metric evaluator, if requested.
+        evaluator:  AsyncMetricEvaluator =              AsyncMetricEvaluator(
+                                                            workers =       metric_workers,
+                                                            max_pending =   max_pending_batches,
+                                                            executor =      metric_executor
+                                                        ) if async_metrics else None
+    
+        # Log dataset info for debugging.
+        _logger_.debug(f"""Dataset:        {dataset_name}
+        Number of samples:  {len(dataloader)}
+        Number of classes:  {num_classes}
+        Batch size:         {batch_size}
+        Device:             {device}
+        Precisions:         {precisions}
+        Optimizations:      {optimizations}""")
+    
+        # For each variant remaining...
+        for variant in pending:
             
-            # For each sample...
-            for i, data in enumerate(tqdm(iterable = dataloader, desc = f"{model_name} on {dataset_name}", colour = "magenta")):
-                
-                # If working on VOC dataset...
-                if dataset_name.lower() == "voc":
-                    
-                    # Extract image and mask.
-                    images, masks = data
-                    
-                    # Preprocess mask.
-                    masks:  Tensor =    preprocess_voc_mask(masks)
-                    
-                # Otherwise, for pets dataset...
-                elif dataset_name.lower() == "pets":
-                    
-                    # Extract image and mask.
-                    images, masks = data
-                    
-                    # Don"t preprocess if our target_transform already gives proper masks.
-                    if max(masks) <= 1.0: masks = preprocess_pets_mask(masks)
-                    
-                # Set image & mask to device.
-                images:     Tensor =    images.to(device)
-                masks:      Tensor =    masks.to(device)
-                
-                # Record starting time to record inference.
-                start_time: float =     time()
-                
-                # If using mixed precision...
-                if use_amp:
-                    
-                    # Forward pass with autocast.
-                    with autocast("cuda"):  outputs = model(images)
-                    
-                # Regular forward pass otherwise.
-                else: outputs = model(images)
-                
-                # Record final inference time.
-                inference_time: float =     time() - start_time
-                
-                # Accumulate.
-                total_inference_time +=     inference_time
-                
-                # Apply softmax to get probabilities
-                outputs:        Tensor =    softmax(outputs, dim=1)
-                
-                # Get predictions
-                preds:          Tensor =    argmax(outputs, dim=1)
-                
-                # Adjust predictions to match target numbering for Pet dataset.
-                if dataset_name.lower() == "pets": preds = preds + 1
-                
-                # Calculate metrics.
-                batch_metrics:  dict =      calculate_metrics(
-                                                prediction =    preds,
-                                                target =        masks,
-                                                dataset_name =  dataset_name,
-                                                num_classes =   num_classes
-                                            )
-                
-                # Update metrics sum.
-                for metric, value in batch_metrics.items():
-                    if not isnan(value): metrics_sum[metric] += value
-                
-                # Accumulate iterations count.
-                metrics_count += 1
-        
-        # Calculate average metrics.
-        avg_metrics:        dict =  {k: v / metrics_count for k, v in metrics_sum.items()}
-        
-        # Calculate memory usage.
-        peak_memory:        int =   (max_memory_allocated(device) - start_memory) / (1024 * 1024)
+            # Evaluate variant.
+            completed[variant] =    evaluate_model(
+                                        model_name =            variants[variant][0],
+                                        backend =               variants[variant][1],
+                                        batches =               prefetcher,
+                                        dataset_name =          dataset_name,
+                                        num_classes =           num_classes,
+                                        batch_size =            batch_size,
+                                        device =                device,
+                                        precision =             variants[variant][2],
+                                        optimization =          variants[variant][3],
+                                        input_size =            input_size,
+                                        hausdorff_backend =     hausdorff_backend,
+                                        hausdorff_percentile =  hausdorff_percentile,
+                                        hausdorff_stride =      hausdorff_stride,
+                                        confidence =            confidence,
+                                        warmup_iterations =     warmup_iterations,
+                                        evaluator =             evaluator,
+                                        cache =                 cache,
+                                        checkpoint_interval =   checkpoint_interval,
+                                        cost_cache =            f"{result_cache}/costs",
+                                        profile =               profile,
+                                        profile_iterations =    profile_iterations,
+                                        profile_depth =         profile_depth,
+                                        profile_top =           profile_top,
+                                        save_path =             save_path,
+                                        backend_cache =         f"{result_cache}/backends",
+                                        parity_tolerance =      parity_tolerance,
+                                        quantization_samples =  quantization_samples,
+                                        weights =               weights,
+                                        weights_cache =         weights_cache,
+                                        trace_memory =          trace_memory,
+                                        tile_size =             tile_size,
+                                        tile_overlap =          tile_overlap,
+                                        tile_blend =            tile_blend,
+                                        tile_batch =            tile_batch
+                                    )
             
-        # Calculate average inference time.
-        avg_inference_time: float = total_inference_time / metrics_count
-        
-        # Record results
-        model_results:      dict =  {
-                                        "Model":                model_name,
-                                        "Dice Score":           avg_metrics["Dice Score"],
-                                        "Precision":            avg_metrics["Precision"],
-                                        "Recall":               avg_metrics["Recall"],
-                                        "Hausdorff":            avg_metrics["Hausdorff"],
-                                        "Inference Time MS":    avg_inference_time * 1000,
-                                        "Peak Memory MB":       peak_memory,
-                                        "FLOPS":                flops,
-                                        "Parameters":           parameters
-                                    }
-        
-        # Append results to report.
-        results.append(model_results)
-        
-        # Log final results.
-        _logger_.info(f"Results for {model_name}: {dumps(model_results, indent = 2, default = str)}")
-        
-        # Clear GPU memory.
-        if is_available(): empty_cache()
+            # Save report so far, so that completed models survive interruption.
+            _save_report_(results = [row for row in completed.values() if row is not None], save_path = save_path, dataset_name = dataset_name)
     
-    # Create a pandas DataFrame for easy analysis.
-    results_df: DataFrame = DataFrame(results)
+        # Release metric workers.
+        if evaluator is not None: evaluator.shutdown()
     
-    # Save report to CSV.
-    results_df.to_csv(
-        path_or_buf =   f"{save_path}/{dataset_name}_benchmark_results_{TIMESTAMP}.csv",
-        index =         False
-    )
+    # Compare each variant against its unoptimized eager FP32 model.
+    _compare_to_eager_(variants = variants, completed = completed)
+    
+    # Save report, in order of variants.
+    results_df: DataFrame = _save_report_(results = list(completed.values()), save_path = save_path, dataset_name = dataset_name)
     
     # Generate plots.
     plot_results(
@@ -242,4 +390,75 @@ def run_benchmark(
     )
     
     # Return results.
-    return results_df
\ No newline at end of file
+    return results_df
+
+def _compare_to_eager_(
+    variants:   dict[str, tuple],
+    completed:  dict[str, dict]
+) -> None:
+    """# Add accuracy & latency deltas against each model's unoptimized eager FP32 row, in place.
+
+    ## Args:
+        * variants  (dict[str, tuple]): Model, backend, precision & optimization of each variant.
+        * completed (dict[str, dict]):  Result row of each variant.
+    """
+    # For each variant...
+    for variant, (model_name, _, _, _) in variants.items():
+
+        # Define eager counterpart, if evaluated.
+        eager:      dict =  completed.get(variant_name(model_name, "eager"))
+        if eager is None: continue
+
+        # Compare accuracy.
+        completed[variant]["Dice Delta"] =  completed[variant]["Dice Score"] - eager["Dice Score"]
+
+        # Compare latency on the same device (quantized variants executed on host carry their own
+        # host baseline), if any was measured.
+        baseline:   float = completed[variant].get("Host FP32 P50 MS", eager["Latency P50 MS"])
+        completed[variant]["Speedup"] =     baseline / completed[variant]["Latency P50 MS"] if completed[variant]["Latency P50 MS"] else nan
+
+def _dynamic_layers_(
+    model_name:     str,
+    num_classes:    int
+) -> int:
+    """# Count the layers of a model that dynamic quantization quantizes.
+
+    ## Args:
+        * model_name    (str):  Model selection.
+        * num_classes   (int):  Number of output classes.
+
+    ## Returns:
+        * int:  Number of layers with dynamically quantized kernels.
+    """
+    # Build model structure on the meta device, without allocating or initializing weights.
+    with Device("meta"): model = load_model(model_name = model_name, num_classes = num_classes, device = "meta")
+
+    # Count layers.
+    return dynamic_layers(model = model)
+
+def _save_report_(
+    results:        list[dict],
+    save_path:      str,
+    dataset_name:   str
+) -> DataFrame:
+    """# Save result rows to CSV.
+
+    ## Args:
+        * results       (list[dict]):   Result rows.
+        * save_path     (str):          Path at which report will be saved.
+        * dataset_name  (str):          Dataset evaluated.
+
+    ## Returns:
+        * DataFrame:    Metrics report.
+    """
+    # Create a pandas DataFrame for easy analysis.
+    results_df: DataFrame = DataFrame(results)
+    
+    # Save report to CSV.
+    results_df.to_csv(
+        path_or_buf =   f"{save_path}/{dataset_name}_benchmark_results_{TIMESTAMP}.csv",
+        index =         False
+    )
+    
+    # Return report.
+    return results_df
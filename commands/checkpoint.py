@@ -0,0 +1,178 @@
+"""Resumable result cache."""
+
+__all__ = ["ResultCache"]
+
+from functools                      import cache
+from glob                           import glob
+from hashlib                        import sha1
+from json                           import dump, dumps, load
+from os                             import makedirs, remove, replace
+from os.path                        import dirname, exists
+
+# Project sources on which results depend (tests, environments & scripts are not hashed).
+SOURCES:    list[str] = ["backends", "commands", "datasets", "metrics", "profiling", "utilities", "models.py"]
+
+class ResultCache():
+    """# On-disk cache of benchmark results & partial evaluation state.
+
+    Entries are keyed by model and run configuration (dataset, input size, batch size, precision
+    mode, metric settings), any configuration specific to the model's variant (i.e., calibration
+    of statically quantized variants), and a hash of the source code, so results are reused only
+    when they would be reproduced exactly. Each completed model is stored as a result row, and an
+    in-progress model as a checkpoint of its running metric & latency state, from which evaluation
+    resumes mid-dataset. Files are replaced atomically, so an interrupted write never corrupts an
+    entry.
+    """
+
+    def __init__(self,
+        path:           str =   "results/cache",
+        variant_config: dict =  None,
+        **config
+    ):
+        """# Initialize result cache.
+
+        ## Args:
+            * path              (str, optional):    Directory in which entries are stored.
+                                                    Defaults to "results/cache".
+            * variant_config    (dict, optional):   Configuration by which the entries of specific
+                                                    models are also keyed, by model. Defaults to
+                                                    None.
+            * **config:                             Run configuration by which entries are keyed.
+        """
+        # Define path & configuration.
+        self.path:              str =   path
+        self.variant_config:    dict =  variant_config or {}
+        self.config:            dict =  {**config, "code_version": _code_version_()}
+
+        # Ensure cache path exists.
+        makedirs(name = path, exist_ok = True)
+
+    def key(self,
+        model_name: str
+    ) -> str:
+        """# Derive key of a model's entries.
+
+        ## Args:
+            * model_name    (str):  Model being evaluated.
+
+        ## Returns:
+            * str:  Digest of model & run configuration.
+        """
+        return sha1(dumps({**self.config, **self.variant_config.get(model_name, {}), "model": model_name}, sort_keys = True, default = str).encode()).hexdigest()
+
+    def load_result(self,
+        model_name: str
+    ) -> dict | None:
+        """# Load a model's completed result row.
+
+        ## Args:
+            * model_name    (str):  Model being evaluated.
+
+        ## Returns:
+            * dict | None:  Result row, or None if model has not completed.
+        """
+        return self._read_(f"{self.path}/{self.key(model_name)}.json")
+
+    def save_result(self,
+        model_name: str,
+        result:     dict
+    ) -> None:
+        """# Store a model's completed result row, discarding its checkpoint.
+
+        ## Args:
+            * model_name    (str):  Model being evaluated.
+            * result        (dict): Result row.
+        """
+        # Store result.
+        self._write_(f"{self.path}/{self.key(model_name)}.json", result)
+
+        # Checkpoint is no longer needed.
+        if exists(f"{self.path}/{self.key(model_name)}.partial.json"): remove(f"{self.path}/{self.key(model_name)}.partial.json")
+
+    def load_checkpoint(self,
+        model_name: str
+    ) -> dict | None:
+        """# Load a model's partial evaluation state.
+
+        ## Args:
+            * model_name    (str):  Model being evaluated.
+
+        ## Returns:
+            * dict | None:  Partial state, or None if model has not been checkpointed.
+        """
+        return self._read_(f"{self.path}/{self.key(model_name)}.partial.json")
+
+    def save_checkpoint(self,
+        model_name: str,
+        state:      dict
+    ) -> None:
+        """# Store a model's partial evaluation state.
+
+        ## Args:
+            * model_name    (str):  Model being evaluated.
+            * state         (dict): Partial state.
+        """
+        self._write_(f"{self.path}/{self.key(model_name)}.partial.json", state)
+
+    def clear(self,
+        model_name: str
+    ) -> None:
+        """# Discard a model's result & checkpoint.
+
+        ## Args:
+            * model_name    (str):  Model being evaluated.
+        """
+        for file in glob(f"{self.path}/{self.key(model_name)}*.json"): remove(file)
+
+    def _read_(self,
+        file:   str
+    ) -> dict | None:
+        """# Read an entry, if present.
+
+        ## Args:
+            * file  (str):  Entry file.
+
+        ## Returns:
+            * dict | None:  Entry, or None if absent.
+        """
+        # Entry is absent.
+        if not exists(file): return None
+
+        # Read entry.
+        with open(file) as entry: return load(entry)
+
+    def _write_(self,
+        file:   str,
+        entry:  dict
+    ) -> None:
+        """# Write an entry atomically.
+
+        ## Args:
+            * file  (str):  Entry file.
+            * entry (dict): Entry being written.
+        """
+        # Write to temporary file.
+        with open(f"{file}.tmp", "w") as temporary: dump(entry, temporary, default = str)
+
+        # Swap into place.
+        replace(f"{file}.tmp", file)
+
+@cache
+def _code_version_() -> str:
+    """# Hash source code of the project, so that cached results are invalidated by code changes.
+
+    ## Returns:
+        * str:  Digest of every Python source file of the project's packages & modules.
+    """
+    # Define project root.
+    root:   str =   dirname(dirname(__file__))
+
+    # Initialize digest.
+    digest: sha1 =  sha1()
+
+    # Fold in each source file, in a stable order.
+    for file in sorted(file for source in SOURCES for file in glob(f"{root}/{source}" if source.endswith(".py") else f"{root}/{source}/**/*.py", recursive = True)):
+        with open(file, "rb") as source: digest.update(source.read())
+
+    # Return digest.
+    return digest.hexdigest()
@@ -0,0 +1,508 @@
+"""Single-model evaluation."""
+
+__all__ = ["evaluate_model"]
+
+from copy                           import deepcopy
+from json                           import dumps
+from logging                        import Logger
+from re                             import sub
+from time                           import perf_counter
+from typing                         import Callable, Iterable
+
+from pandas                         import DataFrame
+from torch                          import channels_last, inference_mode, no_grad, randn, Tensor
+from torch.cuda                     import empty_cache, is_available, OutOfMemoryError, synchronize
+from torch.nn                       import Module
+from tqdm                           import tqdm
+
+from backends                       import check_parity, load_backend, optimization_passes, optimize_model, precision_context, restore_weights, TiledRunner, variant_name
+from commands.checkpoint            import ResultCache
+from datasets                       import IGNORE_INDEX, valid_region
+from metrics                        import AsyncMetricEvaluator, MetricAccumulator, predict_labels, prediction_confidence
+from models                         import load_model, weights_version
+from profiling                      import LatencyRecorder, MemoryMonitor, profile_cost, profile_stages
+from utilities                      import LOGGER, TIMESTAMP
+
+def evaluate_model(
+    model_name:             str,
+    batches:                Iterable,
+    backend:                str =                   "eager",
+    dataset_name:           str =                   "pets",
+    num_classes:            int =                   3,
+    batch_size:             int =                   8,
+    device:                 str =                   "cuda",
+    precision:              str =                   "fp32",
+    input_size:             tuple[int] =            (512, 512),
+    hausdorff_backend:      str =                   "edt",
+    hausdorff_percentile:   float =                 100.0,
+    hausdorff_stride:       int =                   1,
+    confidence:             bool =                  False,
+    warmup_iterations:      int =                   10,
+    evaluator:              AsyncMetricEvaluator =  None,
+    max_batches:            int =                   None,
+    cache:                  ResultCache =           None,
+    checkpoint_interval:    int =                   50,
+    cost_cache:             str =                   "results/cache/costs",
+    profile:                bool =                  False,
+    profile_iterations:     int =                   10,
+    profile_depth:          int =                   3,
+    profile_top:            int =                   20,
+    save_path:              str =                   "results",
+    backend_cache:          str =                   "results/cache/backends",
+    parity_tolerance:       float =                 1e-3,
+    quantization_samples:   int =                   64,
+    optimization:           str =                   "none",
+    weights:                str =                   "random",
+    weights_cache:          str =                   "models/cache",
+    trace_memory:           bool =                  False,
+    tile_size:              int =                   None,
+    tile_overlap:           float =                 0.25,
+    tile_blend:             str =                   "gaussian",
+    tile_batch:             int =                   16,
+    **kwargs
+) -> dict:
+    """# Evaluate a single model on a dataset.
+
+    ## Args:
+        * model_name            (str):                              Model being evaluated.
+        * batches               (Iterable):                         Batches of images & masks, 
+                                                                    resident on device.
+        * backend               (str, optional):                    Inference backend ("eager", 
+                                                                    "torchscript", "compile", 
+                                                                    "onnx", "int8-dynamic", or 
+                                                                    "int8-static"). Defaults to 
+                                                                    "eager".
+        * dataset_name          (str, optional):                    Dataset being evaluated. 
+                                                                    Defaults to "pets".
+        * num_classes           (int, optional):                    Number of classes in dataset. 
+                                                                    Defaults to 3.
+        * batch_size            (int, optional):                    Batch size. Defaults to 8.
+        * device                (str, optional):                    Device on which model is 
+                                                                    executed. Defaults to "cuda".
+        * precision             (str, optional):                    Inference precision ("fp32", 
+                                                                    "bf16", or "fp16"). Defaults to 
+                                                                    "fp32".
+        * input_size            (tuple[int], optional):             Input size. Defaults to (512, 
+                                                                    512).
+        * hausdorff_backend     (str, optional):                    Hausdorff distance backend. 
+                                                                    Defaults to "edt".
+        * hausdorff_percentile  (float, optional):                  Percentile of surface 
+                                                                    distances reported. Defaults 
+                                                                    to 100.
+        * hausdorff_stride      (int, optional):                    Hausdorff boundary subsampling 
+                                                                    cell size. Defaults to 1.
+        * confidence            (bool, optional):                   Also report mean confidence 
+                                                                    (maximum softmax probability) 
+                                                                    of predictions. Defaults to 
+                                                                    False.
+        * warmup_iterations     (int, optional):                    Untimed forward passes 
+                                                                    executed before measuring. 
+                                                                    Defaults to 10.
+        * evaluator             (AsyncMetricEvaluator, optional):   Asynchronous metric evaluator. 
+                                                                    Defaults to None (metrics are 
+                                                                    evaluated inline).
+        * max_batches           (int, optional):                    Stop after this many batches. 
+                                                                    Defaults to None (all).
+        * cache                 (ResultCache, optional):            Cache in which partial state 
+                                                                    is checkpointed and the result 
+                                                                    stored. Defaults to None.
+        * checkpoint_interval   (int, optional):                    Batches between checkpoints. 
+                                                                    Defaults to 50.
+        * cost_cache            (str, optional):                    Directory in which operation & 
+                                                                    parameter counts are cached. 
+                                                                    Defaults to 
+                                                                    "results/cache/costs".
+        * profile               (bool, optional):                   Profile time & memory of each 
+                                                                    model stage. Defaults to False.
+        * profile_iterations    (int, optional):                    Profiled forward passes. 
+                                                                    Defaults to 10.
+        * profile_depth         (int, optional):                    Depth of deepest stages 
+                                                                    profiled. Defaults to 3.
+        * profile_top           (int, optional):                    Number of stages reported. 
+                                                                    Defaults to 20.
+        * save_path             (str, optional):                    Path at which profiling 
+                                                                    report(s) will be saved. 
+                                                                    Defaults to "results".
+        * backend_cache         (str, optional):                    Directory in which backend 
+                                                                    artifacts are cached. Defaults 
+                                                                    to "results/cache/backends".
+        * parity_tolerance      (float, optional):                  Maximum absolute difference 
+                                                                    from eager outputs tolerated. 
+                                                                    Defaults to 1e-3.
+        * quantization_samples  (int, optional):                    Images on which static 
+                                                                    quantization is calibrated. 
+                                                                    Defaults to 64.
+        * optimization          (str, optional):                    Graph optimization ("none", 
+                                                                    "fuse-bn", "channels-last", 
+                                                                    "inference-mode", or "all"). 
+                                                                    Defaults to "none".
+        * weights               (str, optional):                    Model weights ("random", 
+                                                                    "imagenet", or "checkpoint"). 
+                                                                    Defaults to "random".
+        * weights_cache         (str, optional):                    Directory in which pretrained 
+                                                                    weights & checkpoints are 
+                                                                    cached. Defaults to 
+                                                                    "models/cache".
+        * trace_memory          (bool, optional):                   Also trace peak Python heap 
+                                                                    allocations (slow). Defaults 
+                                                                    to False.
+        * tile_size             (int, optional):                    Execute models over square 
+                                                                    tiles of this side (a multiple 
+                                                                    of 32), blending their logits, 
+                                                                    and compare peak memory with 
+                                                                    whole-image inference. Defaults 
+                                                                    to None (whole images).
+        * tile_overlap          (float, optional):                  Fraction of each tile 
+                                                                    overlapping its neighbours. 
+                                                                    Defaults to 0.25.
+        * tile_blend            (str, optional):                    Blending of overlapping logits 
+                                                                    ("gaussian" or "linear"). 
+                                                                    Defaults to "gaussian".
+        * tile_batch            (int, optional):                    Tiles forwarded at once, across 
+                                                                    images of a batch. Defaults to 
+                                                                    16.
+
+    ## Returns:
+        * dict: Result row of model.
+    """
+    # Initialize logger.
+    _logger_:               Logger =        LOGGER.getChild("benchmark")
+    
+    # Label variant.
+    variant:                str =           variant_name(model_name, backend, precision, optimization)
+    
+    # Expand optimization selection into its passes.
+    passes:                 set[str] =      optimization_passes(optimization)
+    
+    # Log action.
+    _logger_.info(f"Evaluating {variant} on {dataset_name}.")
+    
+    # Monitor memory of model, from its setup onwards.
+    memory:                 MemoryMonitor = MemoryMonitor(device = device, trace_python = trace_memory)
+    memory.start()
+    
+    # Attribute model construction, weights & backend preparation to setup.
+    with memory.phase("setup"):
+        
+        # Start timing model setup.
+        setup_start:            float =         perf_counter()
+        
+        # Initialize model.
+        model:                  Module =        load_model(
+                                                    model_name =    model_name,
+                                                    num_classes =   num_classes,
+                                                    device =        device,
+                                                    weights =       weights,
+                                                    weights_cache = weights_cache
+                                                )
+        
+        # Set model to evaluation mode.
+        model.eval()
+        
+        # Wait for weights to reach device.
+        if is_available(): synchronize()
+        
+        # Measure model setup time.
+        setup_time:             float =         (perf_counter() - setup_start) * 1000
+        
+        # Calulcate dimensions of input.
+        input:                  Tensor =        randn(
+                                                    batch_size, 
+                                                    3, 
+                                                    input_size[0], 
+                                                    input_size[1]
+                                                ).to(device)
+        
+        # Count operations & parameters on an isolated copy of model.
+        costs:                  dict =          profile_cost(
+                                                    model =         model,
+                                                    num_classes =   num_classes,
+                                                    input_size =    input_size,
+                                                    batch_size =    batch_size,
+                                                    cache_path =    cost_cache
+                                                )
+        
+        _logger_.info(f"FLOPS: {costs['FLOPS']}, PARAMETERS: {costs['Parameters']}")
+        
+        # Define key of model's cached weights & artifacts.
+        key:                    str =           f"{model_name}_{num_classes}_{input_size[0]}x{input_size[1]}" + (f"_{weights}_{weights_version(model_name, num_classes, weights, weights_cache)}" if weights != "random" else "")
+        
+        # Share random weights among all variants of model, so that all compute the same function.
+        if weights == "random": restore_weights(model = model, key = key, cache_path = backend_cache)
+        
+        # Keep unoptimized model as reference, optimizing a copy of it.
+        reference:              Module =        model
+        model:                  Module =        optimize_model(model = deepcopy(reference), passes = passes) if passes - {"inference-mode"} else reference
+        
+        # Prepare model for backend.
+        runner:                 Callable =      load_backend(
+                                                    model =         model,
+                                                    backend =       backend,
+                                                    example =       input.contiguous(memory_format = channels_last) if "channels-last" in passes else input,
+                                                    key =           f"{key}_{optimization}" if passes - {"inference-mode"} else key,
+                                                    cache_path =    backend_cache,
+                                                    calibration =   _calibration_batches_(batches = batches, samples = quantization_samples) if backend == "int8-static" else None
+                                                )
+    
+    # Initialize metric accumulator.
+    accumulator:            MetricAccumulator = MetricAccumulator(
+                                                    dataset_name =          dataset_name,
+                                                    num_classes =           num_classes,
+                                                    hausdorff_backend =     hausdorff_backend,
+                                                    hausdorff_percentile =  hausdorff_percentile,
+                                                    hausdorff_stride =      hausdorff_stride,
+                                                    confidence =            confidence
+                                                )
+    
+    # Initialize latency recorder.
+    latency:                LatencyRecorder =   LatencyRecorder(device = device)
+    
+    # Initialize counts of padded images, pixels processed, and valid (unpadded) pixels.
+    pixels:                 dict =          {"images": 0, "processed": 0, "valid": 0}
+    
+    # Resume from checkpoint, if one exists.
+    checkpoint:             dict =          cache.load_checkpoint(variant) if cache is not None else None
+    
+    # If resuming...
+    if checkpoint is not None:
+        
+        # Restore running metrics, latency samples & pixel counts.
+        accumulator.load_state_dict(state = checkpoint["metrics"], device = device)
+        latency.load_state_dict(state = checkpoint["latency"])
+        pixels.update(checkpoint.get("pixels", {}))
+        
+        # Log action.
+        _logger_.info(f"Resuming {variant} after {checkpoint['batches']} batches.")
+    
+    # Define number of batches already evaluated.
+    completed:              int =           checkpoint["batches"] if checkpoint is not None else 0
+    
+    def infer(images: Tensor) -> Tensor:
+        """# Execute forward pass, in NHWC layout and/or autocasting to reduced precision if selected."""
+        with precision_context(precision = precision, device = device): return runner(images.contiguous(memory_format = channels_last) if "channels-last" in passes else images)
+    
+    # Execute forward passes over tiles, if requested, or whole images.
+    forward:                Callable =      TiledRunner(
+                                                runner =        infer,
+                                                tile_size =     tile_size,
+                                                overlap =       tile_overlap,
+                                                blend =         tile_blend,
+                                                tile_batch =    tile_batch
+                                            ) if tile_size else infer
+    
+    # Compare outputs of variant (or tiled model) against unoptimized eager FP32 model.
+    deviation:              float =         check_parity(reference = reference, candidate = forward, example = input) if variant != model_name or tile_size else 0.0
+    
+    # Report deviation beyond tolerance (quantized, reduced precision & tiled variants are expected to deviate).
+    if deviation > parity_tolerance and precision == "fp32" and not backend.startswith("int8") and not tile_size: _logger_.warning(f"{variant} outputs deviate from eager outputs by up to {deviation:.2e} (tolerance {parity_tolerance:.0e}).")
+    
+    # Quantized models execute on host, so off host, also time the FP32 model on host as their baseline.
+    host_baseline:          dict =          {}
+    if backend.startswith("int8") and input.device.type != "cpu":
+        with memory.paused(): host_baseline["Host FP32 P50 MS"] = _host_latency_(model = reference, images = input, warmup_iterations = warmup_iterations)
+    
+    # Without calculating gradients (nor tracking tensor versions & views, in inference mode)...
+    with (inference_mode() if "inference-mode" in passes else no_grad()):
+        
+        # Warm up model on profiling input before measuring.
+        with memory.phase("inference"): latency.warmup(forward = lambda: forward(input), iterations = warmup_iterations)
+        
+        # If profiling (stages are only visible in eager models)...
+        if profile and backend == "eager":
+            
+            # Key reports by variant, so that variants of a model do not overwrite each other's (i.e., "u-net_bf16_fuse-bn").
+            report:     str =       sub(r"[^\w.-]+", "_", variant).strip("_")
+            
+            # Profile model stages on profiling input.
+            stages: DataFrame =     profile_stages(
+                                        model =         model,
+                                        forward =       lambda: forward(input),
+                                        device =        device,
+                                        iterations =    profile_iterations,
+                                        depth =         profile_depth,
+                                        top =           profile_top,
+                                        trace_path =    f"{save_path}/{dataset_name}_{report}_trace_{TIMESTAMP}.json"
+                                    )
+            
+            # Save top stages alongside results.
+            stages.to_csv(path_or_buf = f"{save_path}/{dataset_name}_{report}_stages_{TIMESTAMP}.csv", index = False)
+            
+            # Log top stages.
+            _logger_.info(f"Top stages of {variant}:\n{stages.to_string(index = False)}")
+        
+        # For each sample (attributing its loading to data)...
+        for i, data in enumerate(memory.iterate(tqdm(iterable = batches, desc = f"{variant} on {dataset_name}", colour = "magenta", total = max_batches), name = "data")):
+            
+            # Stop once batch limit is reached.
+            if max_batches is not None and i >= max_batches: break
+            
+            # Skip batches evaluated before checkpoint.
+            if i < completed: continue
+            
+            # Extract images & masks (already uint8 class indices), and valid sizes of padded
+            # native-resolution batches.
+            images, masks, *sizes = data
+            
+            # If batch is padded, count pixels processed and valid pixels.
+            if sizes:
+                pixels["images"] +=     len(images)
+                pixels["processed"] +=  images[:, 0].numel()
+                pixels["valid"] +=      int(sizes[0].prod(dim = 1).sum())
+            
+            # Measure forward pass (without sampling memory, which was measured during warm-up).
+            with memory.phase("inference"), memory.paused(), latency.measure(batch_size = len(images)): outputs = forward(images)
+            
+            # Attribute post-processing & metric evaluation to metrics.
+            with memory.phase("metrics"):
+                
+                # Predict uint8 class labels directly from logits (without materializing probabilities).
+                preds:          Tensor =    predict_labels(logits = outputs)
+                
+                # Crop predictions to valid region of padded batches (padding is ignored, like its target).
+                if sizes: preds = preds.masked_fill(~valid_region(sizes = sizes[0], height = preds.shape[1], width = preds.shape[2]), IGNORE_INDEX)
+                
+                # Compute confidence of predictions, if reported.
+                scores:         Tensor =    prediction_confidence(logits = outputs) if confidence else None
+                
+                # Fold batch into running metrics, in background if evaluating asynchronously.
+                if evaluator is not None:   evaluator.submit(accumulator = accumulator, prediction = preds, target = masks, confidence = scores)
+                else:                       accumulator.update(prediction = preds, target = masks, confidence = scores)
+            
+            # Periodically checkpoint partial state.
+            if cache is not None and (i + 1) % checkpoint_interval == 0:
+                
+                # Wait for pending metric evaluations, so that state covers every batch so far.
+                if evaluator is not None: evaluator.join()
+                
+                # Store state.
+                cache.save_checkpoint(variant, {"batches": i + 1, "metrics": accumulator.state_dict(), "latency": latency.state_dict(), "pixels": pixels})
+        
+        # If tiling, compare peak memory of tiled & whole-image inference on profiling input.
+        if tile_size:
+            
+            # Execute a single tiled forward pass (releasing memory freed so far, so that it is not reused).
+            with memory.phase("tiled", release = True): forward(input)
+            
+            try:# Execute a single whole-image forward pass.
+                with memory.phase("whole-image", release = True): infer(input)
+            
+            # Whole images may not fit at all, which is what tiling is for.
+            except OutOfMemoryError:    _logger_.warning(f"Whole-image inference of {variant} ran out of memory at {input_size[0]}x{input_size[1]}; only tiled inference fits.")
+    
+    # Attribute pending metric evaluations & their reduction to metrics.
+    with memory.phase("metrics"):
+        
+        # Wait for pending metric evaluations.
+        if evaluator is not None: evaluator.join()
+        
+        # Reduce dataset-level metrics.
+        avg_metrics:    dict =  accumulator.compute()
+    
+    # Summarize memory usage.
+    memory_summary:     dict =  memory.stop()
+        
+    # Summarize latency samples.
+    latency_summary:    dict =  latency.summary()
+    
+    # Summarize padding, and pixels (hence compute) saved over resizing every image to input size, if padded.
+    padding_summary:    dict =  {
+                                    "Padding %":            100 * (pixels["processed"] - pixels["valid"]) / pixels["processed"],
+                                    "Compute Saved %":      100 * (1 - pixels["processed"] / (pixels["images"] * input_size[0] * input_size[1]))
+                                } if pixels["images"] else {}
+    
+    # Record results
+    model_results:      dict =  {
+                                    "Model":                variant,
+                                    "Backend":              backend,
+                                    "Precision Mode":       precision,
+                                    "Optimization":         optimization,
+                                    "Weights":              weights,
+                                    "Dice Score":           avg_metrics["Dice Score"],
+                                    "Precision":            avg_metrics["Precision"],
+                                    "Recall":               avg_metrics["Recall"],
+                                    "Hausdorff":            avg_metrics["Hausdorff"],
+                                    **({"Confidence": avg_metrics["Confidence"]} if confidence else {}),
+                                    **latency_summary,
+                                    **host_baseline,
+                                    "Setup MS":             setup_time,
+                                    **memory_summary,
+                                    **padding_summary,
+                                    **costs,
+                                    "Max Abs Diff":         deviation
+                                }
+    
+    # Log final results.
+    _logger_.info(f"Results for {variant}: {dumps(model_results, indent = 2, default = str)}")
+    
+    # Store result, replacing checkpoint.
+    if cache is not None: cache.save_result(variant, model_results)
+    
+    # Clear GPU memory.
+    if is_available(): empty_cache()
+    
+    # Return results.
+    return model_results
+
+def _calibration_batches_(
+    batches:    Iterable,
+    samples:    int
+) -> list[Tensor]:
+    """# Take the first images of a dataset for calibration.
+
+    ## Args:
+        * batches   (Iterable): Batches of images & masks (and valid sizes, if padded).
+        * samples   (int):      Number of images taken.
+
+    ## Returns:
+        * list[Tensor]: Batches of images, totalling `samples` images (or the whole dataset).
+    """
+    # Initialize calibration batches.
+    calibration:    list =  []
+
+    # For each batch, until enough images are taken...
+    for images, *_ in batches:
+
+        # Take images still needed.
+        calibration.append(images[:samples - sum(len(batch) for batch in calibration)])
+
+        # Stop once enough images are taken.
+        if sum(len(batch) for batch in calibration) >= samples: break
+
+    # Return calibration batches.
+    return calibration
+
+def _host_latency_(
+    model:              Module,
+    images:             Tensor,
+    warmup_iterations:  int,
+    iterations:         int =   10
+) -> float:
+    """# Measure median latency of a model executed on host.
+
+    ## Args:
+        * model             (Module):           Model, on any device.
+        * images            (Tensor):           Batch of images, on any device.
+        * warmup_iterations (int):              Untimed forward passes.
+        * iterations        (int, optional):    Timed forward passes. Defaults to 10.
+
+    ## Returns:
+        * float:    Median batch latency, in milliseconds.
+    """
+    # Copy model & images to host.
+    model, images =                 deepcopy(model).cpu(), images.cpu()
+
+    # Initialize latency recorder.
+    latency:        LatencyRecorder =   LatencyRecorder(device = "cpu")
+
+    # Without calculating gradients...
+    with no_grad():
+
+        # Warm up model.
+        latency.warmup(forward = lambda: model(images), iterations = warmup_iterations)
+
+        # Time forward passes.
+        for _ in range(iterations):
+            with latency.measure(batch_size = len(images)): model(images)
+
+    # Return median.
+    return latency.summary()["Latency P50 MS"]
@@ -0,0 +1,206 @@
+"""Parallel multi-model scheduling."""
+
+__all__ = ["run_parallel"]
+
+from concurrent.futures             import Future, ProcessPoolExecutor
+from logging                        import getLevelName, Logger
+from multiprocessing                import get_context
+from multiprocessing.context        import SpawnContext
+from multiprocessing.queues         import Queue
+from os                             import cpu_count
+
+from numpy                          import array_split
+from torch                          import set_num_threads
+
+from commands.evaluation            import evaluate_model
+from datasets                       import DevicePrefetcher, load_dataset
+from utilities                      import configure_logging, LOGGER
+
+def run_parallel(
+    variants:               list[tuple[str, str, str, str]],
+    parallel_models:        int =       2,
+    calibration_batches:    int =       10,
+    interference_tolerance: float =     0.10,
+    **kwargs
+) -> list[dict]:
+    """# Evaluate several model variants concurrently, in core-pinned worker processes.
+
+    Available cores are split into `parallel_models` disjoint sets. Each worker process is pinned to
+    one set (where the platform supports affinity masks) and limited to as many intra-op threads as
+    it has cores. Workers read the dataset from the shared, read-only memory-mapped cache, and load
+    it in-process so that they stay within their core budget.
+
+    Before the concurrent run, each model is calibrated alone on the same core budget. A model whose
+    median latency under concurrency exceeds its solo median by more than `interference_tolerance`
+    is reported, since its timings are then distorted by contention (i.e., for memory bandwidth or
+    shared caches). With a single core budget (i.e., one model at a time, or a single core), no
+    model runs concurrently, so calibration and interference columns are skipped.
+
+    ## Args:
+        * variants                  (list[tuple]):      Models, backends, precisions &
+                                                        optimizations being evaluated.
+        * parallel_models           (int, optional):    Number of models evaluated concurrently.
+                                                        Defaults to 2.
+        * calibration_batches       (int, optional):    Batches timed in each solo calibration run.
+                                                        Defaults to 10.
+        * interference_tolerance    (float, optional):  Relative slowdown of median latency over
+                                                        solo calibration above which interference
+                                                        is reported. Defaults to 0.10.
+        * **kwargs:                                     Benchmark settings, passed to
+                                                        `load_dataset` & `evaluate_model`.
+
+    ## Returns:
+        * list[dict]:   Result rows, in order of `variants`.
+    """
+    # Initialize logger.
+    _logger_:   Logger =        LOGGER.getChild("parallel")
+
+    # Workers share the memory-mapped cache, read in-process, and evaluate metrics inline.
+    settings:   dict =          {**kwargs, "cache_dataset": True, "num_workers": 0, "persistent_workers": False, "evaluator": None}
+
+    # Build cache once, before workers map it.
+    load_dataset(**settings)
+
+    # Partition cores available to this process into one contiguous set per worker.
+    cores:      list =          sorted(_available_cores_())
+    budgets:    list =          [chunk.tolist() for chunk in array_split(cores, min(parallel_models, len(cores)))]
+
+    # Log schedule.
+    _logger_.info(f"Evaluating {len(variants)} variant(s), {len(budgets)} at a time, on cores {budgets}.")
+
+    # Without concurrency, there is no interference to measure.
+    if len(budgets) == 1: return _schedule_(variants = variants, budgets = budgets, settings = settings)
+
+    # Calibrate each model alone, on a single core budget (without touching result cache or profiling).
+    solo:       dict =          {
+                                    row["Model"]: row["Latency P50 MS"]
+                                    for row in _schedule_(variants = variants, budgets = budgets[:1], settings = {**settings, "cache": None, "profile": False}, max_batches = calibration_batches)
+                                }
+
+    # Evaluate models concurrently.
+    results:    list =          _schedule_(variants = variants, budgets = budgets, settings = settings)
+
+    # For each result row...
+    for row in results:
+
+        # Compare median latency against solo calibration.
+        row["Solo P50 MS"] =    solo[row["Model"]]
+        row["Interference"] =   row["Latency P50 MS"] / solo[row["Model"]]
+
+        # Report contention beyond tolerance.
+        if row["Interference"] > 1 + interference_tolerance:
+            _logger_.warning(f"{row['Model']} median latency is {row['Interference']:.2f}x its solo calibration; timings are affected by concurrent models.")
+
+        # Cache row along with its interference measurement.
+        if settings.get("cache") is not None: settings["cache"].save_result(row["Model"], row)
+
+    # Return results.
+    return results
+
+def _available_cores_() -> set[int]:
+    """# Cores on which this process may run.
+
+    ## Returns:
+        * set[int]: Core indices.
+    """
+    # Respect affinity mask, where supported.
+    try:                    from os import sched_getaffinity;   return sched_getaffinity(0)
+
+    # Otherwise, assume all cores are available.
+    except ImportError:     return set(range(cpu_count()))
+
+def _benchmark_(
+    model_name:     str,
+    backend:        str,
+    precision:      str,
+    optimization:   str,
+    settings:       dict,
+    max_batches:    int =   None
+) -> dict:
+    """# Evaluate one model inside a worker process.
+
+    ## Args:
+        * model_name    (str):              Model being evaluated.
+        * backend       (str):              Backend on which model is executed.
+        * precision     (str):              Precision at which model is executed.
+        * optimization  (str):              Graph optimization applied to model.
+        * settings      (dict):             Benchmark settings.
+        * max_batches   (int, optional):    Stop after this many batches. Defaults to None (all).
+
+    ## Returns:
+        * dict: Result row of model.
+    """
+    # Map dataset cache.
+    prefetcher: DevicePrefetcher =  DevicePrefetcher(
+                                        loader =    load_dataset(**settings),
+                                        device =    settings["device"],
+                                        depth =     settings.get("prefetch_depth", 1)
+                                    )
+
+    # Evaluate model.
+    return  evaluate_model(
+                model_name =    model_name,
+                backend =       backend,
+                precision =     precision,
+                optimization =  optimization,
+                batches =       prefetcher,
+                max_batches =   max_batches,
+                **settings
+            )
+
+def _pin_(
+    budgets:    Queue,
+    level:      str
+) -> None:
+    """# Pin worker process to the next unclaimed core budget.
+
+    ## Args:
+        * budgets   (Queue):    Core budgets not yet claimed by a worker.
+        * level     (str):      Logging level of parent process.
+    """
+    # Log to console, at parent's level (parent alone writes log files).
+    configure_logging(level = level, path = None)
+
+    # Claim core budget.
+    cores:  list =  budgets.get()
+
+    # Restrict process to its cores, where supported.
+    try:                    from os import sched_setaffinity;   sched_setaffinity(0, cores)
+    except ImportError:     pass
+
+    # Limit intra-op parallelism to core budget.
+    set_num_threads(len(cores))
+
+def _schedule_(
+    variants:       list[tuple[str, str, str, str]],
+    budgets:        list[list[int]],
+    settings:       dict,
+    max_batches:    int =   None
+) -> list[dict]:
+    """# Evaluate variants in a pool of one pinned worker process per core budget.
+
+    ## Args:
+        * variants      (list[tuple]):      Models, backends, precisions & optimizations being
+                                            evaluated.
+        * budgets       (list[list[int]]):  Core budget of each worker.
+        * settings      (dict):             Benchmark settings.
+        * max_batches   (int, optional):    Stop after this many batches. Defaults to None (all).
+
+    ## Returns:
+        * list[dict]:   Result rows, in order of `variants`.
+    """
+    # Spawn fresh interpreters, so that workers do not inherit thread pools or CUDA state.
+    context:    SpawnContext =  get_context("spawn")
+
+    # Queue core budgets for workers to claim.
+    queue:      Queue =         context.Queue()
+    for cores in budgets: queue.put(cores)
+
+    # Within worker pool...
+    with ProcessPoolExecutor(max_workers = len(budgets), mp_context = context, initializer = _pin_, initargs = (queue, getLevelName(LOGGER.getEffectiveLevel()))) as pool:
+
+        # Submit one job per variant.
+        futures:    list[Future] =  [pool.submit(_benchmark_, *variant, settings, max_batches) for variant in variants]
+
+        # Collect rows in submission order.
+        return [future.result() for future in futures]
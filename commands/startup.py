@@ -0,0 +1,101 @@
+"""CLI startup-time benchmark."""
+
+__all__ = ["run_startup"]
+
+from logging                        import Logger
+from os.path                        import abspath, dirname
+from statistics                     import median
+from subprocess                     import CompletedProcess, run
+from sys                            import executable
+from time                           import perf_counter
+
+from utilities                      import LOGGER
+
+# Modules that must only be imported by the command that needs them.
+HEAVY_MODULES:  list[str] =         ["matplotlib", "medpy", "onnxruntime", "pandas", "scipy", "segmentation_models_pytorch", "thop", "timm", "torch", "torchvision"]
+
+# Invocations probed: library import, help, and argument validation (arguments of entry point, or
+# none to import the packages alone).
+PROBES:         dict[str, list] =   {
+                                        "import":               [],
+                                        "--help":               ["--help"],
+                                        "benchmark --help":     ["benchmark", "--help"],
+                                        "invalid arguments":    ["benchmark", "--backends", "invalid", "pets"]
+                                    }
+
+# Script executed by each probe, reporting heavy modules loaded on its last line of output.
+_PROBE_:        str =               """
+import runpy, sys
+sys.argv = ["main", *{arguments!r}]
+try:
+    if {arguments!r}:   runpy.run_module("main", run_name = "__main__")
+    else:               import commands, utilities
+except SystemExit:      pass
+print("\\n" + ",".join(name for name in {heavy!r} if name in sys.modules))
+"""
+
+def run_startup(
+    repeats:    int =   5,
+    budget_ms:  float = 500.0,
+    **kwargs
+) -> list[dict]:
+    """# Measure CLI startup time, checking for regressions.
+
+    Each probe is executed in a fresh interpreter, as a user would invoke it, and timed from
+    process launch to exit. A probe regresses when its median time exceeds the budget, or when it
+    imports any of the heavy modules (which only the command being run should import).
+
+    ## Args:
+        * repeats   (int, optional):    Executions of each probe. Defaults to 5.
+        * budget_ms (float, optional):  Median time allowed per probe, in milliseconds. Defaults
+                                        to 500.
+
+    ## Returns:
+        * list[dict]:   Median & maximum time, heavy modules loaded, and failure of each probe.
+    """
+    # Initialize logger.
+    _logger_:   Logger =    LOGGER.getChild("startup")
+
+    # Initialize results array.
+    results:    list =      []
+
+    # For each probe...
+    for probe, arguments in PROBES.items():
+
+        # Initialize samples.
+        samples:    list =  []
+
+        # For each repetition...
+        for _ in range(repeats):
+
+            # Time probe in a fresh interpreter, from project root.
+            start:      float =             perf_counter()
+            process:    CompletedProcess =  run([executable, "-c", _PROBE_.format(arguments = arguments, heavy = HEAVY_MODULES)], cwd = dirname(dirname(abspath(__file__))), capture_output = True, text = True)
+            samples.append((perf_counter() - start) * 1000)
+
+        # Record results.
+        results.append({
+            "Probe":            probe,
+            "Median MS":        median(samples),
+            "Max MS":           max(samples),
+            "Heavy Modules":    process.stdout.splitlines()[-1] if process.returncode == 0 else "",
+            "Failed":           process.returncode != 0
+        })
+
+    # Log results.
+    _logger_.info("Startup times:\n" + "\n".join(f"{row['Probe']:<20} {row['Median MS']:>8.1f} ms (max {row['Max MS']:>8.1f} ms)  {'FAILED' if row['Failed'] else row['Heavy Modules'] or '-'}" for row in results))
+
+    # Define regressions.
+    regressions:    list =  [row["Probe"] for row in results if row["Failed"] or row["Median MS"] > budget_ms or row["Heavy Modules"]]
+
+    # Fail on regressions, so that checks can gate on exit status.
+    if regressions:
+
+        # Log regressions.
+        _logger_.error(f"Startup regressed (budget {budget_ms:.0f} ms, no heavy modules) for: {', '.join(regressions)}")
+
+        # Exit with failure.
+        raise SystemExit(1)
+
+    # Return results.
+    return results
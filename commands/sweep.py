@@ -0,0 +1,233 @@
+"""Batch-size & resolution sweep process."""
+
+__all__ = ["run_sweep"]
+
+from logging                        import Logger
+from time                           import perf_counter
+
+from numpy                          import log, nan, polyfit
+from pandas                         import DataFrame
+from torch                          import no_grad, randn, Tensor
+from torch.cuda                     import empty_cache, is_available, OutOfMemoryError, synchronize
+from torch.nn                       import Module
+from tqdm                           import tqdm
+
+from metrics                        import plot_sweep
+from models                         import load_model
+from profiling                      import LatencyRecorder, MemoryMonitor
+from utilities                      import LOGGER, TIMESTAMP
+
+def run_sweep(
+    models:                 list[str] =     ["deeplab-v3", "fpn", "seg-former", "u-net"],
+    batch_sizes:            list[int] =     [1, 2, 4, 8, 16, 32],
+    input_sizes:            list[int] =     [256, 384, 512],
+    num_classes:            int =           3,
+    device:                 str =           "cuda",
+    iterations:             int =           20,
+    warmup_iterations:      int =           10,
+    saturation_threshold:   float =         0.05,
+    save_path:              str =           "results",
+    weights:                str =           "random",
+    weights_cache:          str =           "models/cache",
+    **kwargs
+) -> DataFrame:
+    """# Sweep model(s) over a grid of batch sizes and input resolutions.
+
+    Synthetic inputs are used, so no dataset is required. Each model is constructed once and
+    reused across the whole grid.
+
+    ## Args:
+        * models                (list[str], optional):  Models being swept. Defaults to all
+                                                        models.
+        * batch_sizes           (list[int], optional):  Batch sizes being swept. Defaults to 1, 2,
+                                                        4, 8, 16, 32.
+        * input_sizes           (list[int], optional):  (Square) input resolutions being swept.
+                                                        Defaults to 256, 384, 512.
+        * num_classes           (int, optional):        Number of output classes. Defaults to 3.
+        * device                (str, optional):        Device on which models are executed.
+                                                        Defaults to "cuda".
+        * iterations            (int, optional):        Timed forward passes at each grid point.
+                                                        Defaults to 20.
+        * warmup_iterations     (int, optional):        Untimed forward passes executed before
+                                                        each grid point. Defaults to 10.
+        * saturation_threshold  (float, optional):      Relative throughput gain below which a
+                                                        larger batch size is considered to no
+                                                        longer improve throughput. Defaults to
+                                                        0.05.
+        * save_path             (str, optional):        Path at which report(s) will be saved.
+                                                        Defaults to "results".
+        * weights               (str, optional):        Model weights ("random", "imagenet", or
+                                                        "checkpoint"). Defaults to "random".
+        * weights_cache         (str, optional):        Directory in which pretrained weights &
+                                                        checkpoints are cached. Defaults to
+                                                        "models/cache".
+
+    ## Returns:
+        * DataFrame:    Measurements at each grid point.
+    """
+    # Initialize logger.
+    _logger_:   Logger =    LOGGER.getChild("sweep")
+
+    # Initialize results array.
+    results:    list =      []
+
+    # For each model in the list...
+    for model_name in models:
+
+        # Log action.
+        _logger_.info(f"Sweeping {model_name} on {device}.")
+
+        # Start timing model setup.
+        setup_start:    float =     perf_counter()
+
+        # Initialize model once for the whole grid.
+        model:          Module =    load_model(model_name = model_name, num_classes = num_classes, device = device, weights = weights, weights_cache = weights_cache)
+
+        # Set model to evaluation mode.
+        model.eval()
+
+        # Measure model setup time, once weights reach device.
+        if is_available(): synchronize()
+        setup_time:     float =     (perf_counter() - setup_start) * 1000
+
+        # Without calculating gradients...
+        with no_grad():
+
+            # For each input resolution...
+            for input_size in tqdm(iterable = sorted(input_sizes), desc = f"{model_name} sweep", colour = "magenta"):
+
+                # For each batch size...
+                for batch_size in sorted(batch_sizes):
+
+                    # Initialize latency recorder.
+                    latency:    LatencyRecorder =   LatencyRecorder(device = device)
+
+                    # Monitor memory at this grid point alone.
+                    memory:     MemoryMonitor =     MemoryMonitor(device = device)
+                    memory.start()
+
+                    try:# Generate synthetic input.
+                        input:  Tensor =    randn(batch_size, 3, input_size, input_size, device = device)
+
+                        # Warm up model at this grid point.
+                        latency.warmup(forward = lambda: model(input), iterations = warmup_iterations)
+
+                        # Measure forward passes (without sampling memory, which was measured during warm-up).
+                        for _ in range(iterations):
+                            with memory.paused(), latency.measure(batch_size = batch_size): model(input)
+
+                    # Larger batches will not fit either, so move on to next resolution.
+                    except OutOfMemoryError:
+
+                        # Log skip.
+                        _logger_.warning(f"{model_name} ran out of memory at batch size {batch_size}, input size {input_size}; skipping larger batch sizes.")
+
+                        # Release memory.
+                        memory.stop()
+                        input = None
+                        empty_cache()
+                        break
+
+                    # Summarize memory usage.
+                    memory_summary: dict =          memory.stop()
+
+                    # Record results.
+                    results.append({
+                        "Model":            model_name,
+                        "Batch Size":       batch_size,
+                        "Input Size":       input_size,
+                        **latency.summary(),
+                        "Setup MS":         setup_time,
+                        "Peak Memory MB":   memory_summary["Peak Memory MB"],
+                        "Peak RSS MB":      memory_summary["Peak RSS MB"]
+                    })
+
+        # Release model.
+        del model
+
+        # Clear GPU memory.
+        if is_available(): empty_cache()
+
+    # Create a pandas DataFrame for easy analysis.
+    results_df: DataFrame = DataFrame(results)
+
+    # Summarize saturation & resolution scaling.
+    summary_df: DataFrame = _summarize_sweep_(
+                                results_df =            results_df,
+                                saturation_threshold =  saturation_threshold
+                            )
+
+    # Log summary.
+    _logger_.info(f"Sweep summary:\n{summary_df.to_string(index = False)}")
+
+    # Save reports to CSV.
+    results_df.to_csv(path_or_buf = f"{save_path}/sweep_results_{TIMESTAMP}.csv", index = False)
+    summary_df.to_csv(path_or_buf = f"{save_path}/sweep_summary_{TIMESTAMP}.csv", index = False)
+
+    # Generate plots, if anything was measured.
+    if not results_df.empty: plot_sweep(results_df = results_df, save_path = save_path)
+
+    # Return results.
+    return results_df
+
+def _summarize_sweep_(
+    results_df:             DataFrame,
+    saturation_threshold:   float
+) -> DataFrame:
+    """# Summarize throughput saturation and resolution scaling of sweep results.
+
+    ## Args:
+        * results_df            (DataFrame):    Measurements at each grid point.
+        * saturation_threshold  (float):        Relative throughput gain below which a larger
+                                                batch size no longer improves throughput.
+
+    ## Returns:
+        * DataFrame:    For each model & resolution, the batch size at which throughput
+                        saturates, peak throughput, per-image latency at saturation, cost relative
+                        to the model's smallest resolution, and the model's scaling exponent (slope
+                        of log per-image latency over log pixel count).
+    """
+    # Define summary columns.
+    columns:    list =  ["Model", "Input Size", "Saturation Batch Size", "Peak Throughput IMG/S", "MS Per Image", "Relative Cost", "Scaling Exponent"]
+
+    # Nothing to summarize when no grid point was measured (i.e., every point was skipped).
+    if results_df.empty: return DataFrame(columns = columns)
+
+    # Initialize summary array.
+    summary:    list =  []
+
+    # For each model & resolution...
+    for (model_name, input_size), group in results_df.groupby(["Model", "Input Size"], sort = True):
+
+        # Order by batch size.
+        group:      DataFrame = group.sort_values("Batch Size")
+        throughput: list =      group["Throughput IMG/S"].tolist()
+
+        # Saturation is the first batch size after which throughput gains fall below threshold.
+        saturation: int =       next(
+                                    (i for i in range(len(throughput) - 1) if throughput[i + 1] < throughput[i] * (1 + saturation_threshold)),
+                                    len(throughput) - 1
+                                )
+
+        # Record summary.
+        summary.append({
+            "Model":                    model_name,
+            "Input Size":               input_size,
+            "Saturation Batch Size":    group["Batch Size"].iloc[saturation],
+            "Peak Throughput IMG/S":    max(throughput),
+            "MS Per Image":             1000 / throughput[saturation]
+        })
+
+    # Create summary DataFrame.
+    summary_df: DataFrame = DataFrame(summary, columns = columns[:5])
+
+    # Cost relative to each model's smallest resolution.
+    summary_df["Relative Cost"] =       summary_df["MS Per Image"] / summary_df.groupby("Model")["MS Per Image"].transform("first")
+
+    # Fit per-image latency against pixel count on a log-log scale (cost ~ pixels^exponent).
+    summary_df["Scaling Exponent"] =    summary_df.groupby("Model")["MS Per Image"].transform(
+                                            lambda ms: polyfit(log(summary_df.loc[ms.index, "Input Size"] ** 2), log(ms), 1)[0] if len(ms) > 1 else nan
+                                        )
+
+    # Return summary.
+    return summary_df
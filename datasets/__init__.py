@@ -0,0 +1,11 @@
+"""Datasets package."""
+
+__all__ = ["BucketBatchSampler", "build_cache", "CachedDataset", "DevicePrefetcher", "IGNORE_INDEX", "is_cached", "label_table", "load_dataset", "MEAN", "normalization_constants", "normalize_images", "PAD_MULTIPLE", "PaddedCollator", "remap_mask", "STD", "SyntheticDataset", "valid_region"]
+
+from datasets.bucketing     import BucketBatchSampler, PAD_MULTIPLE, PaddedCollator, valid_region
+from datasets.cache         import build_cache, CachedDataset, is_cached
+from datasets.labels        import IGNORE_INDEX, label_table, remap_mask
+from datasets.loader        import load_dataset
+from datasets.normalization import MEAN, normalization_constants, normalize_images, STD
+from datasets.prefetch      import DevicePrefetcher
+from datasets.synthetic     import SyntheticDataset
@@ -0,0 +1,123 @@
+"""Aspect-ratio bucketing for native-resolution evaluation."""
+
+__all__ = ["BucketBatchSampler", "PAD_MULTIPLE", "PaddedCollator", "valid_region"]
+
+from math                   import ceil
+from typing                 import Iterator
+
+from torch                  import arange, full, int64, tensor, Tensor, zeros
+from torch.utils.data       import Sampler
+
+from datasets.labels        import IGNORE_INDEX
+
+# Batches are padded to a multiple of the models' output stride.
+PAD_MULTIPLE:   int =   32
+
+class BucketBatchSampler(Sampler):
+    """# Batch samples of similar shape together.
+
+    Samples are ordered by aspect ratio, then by area, and cut into consecutive batches, so that
+    each batch holds images of similar shape and needs little padding. The order only depends on
+    sample sizes, so batches are identical across runs.
+    """
+
+    def __init__(self,
+        sizes:      list[tuple[int, int]],
+        batch_size: int =   8
+    ):
+        """# Initialize bucket batch sampler.
+
+        ## Args:
+            * sizes         (list[tuple[int, int]]):    Height & width of each sample.
+            * batch_size    (int, optional):            Batch size. Defaults to 8.
+        """
+        # Define configuration.
+        self.sizes:         list =  sizes
+        self.batch_size:    int =   batch_size
+
+        # Order samples by aspect ratio, then by area.
+        order:              list =  sorted(range(len(sizes)), key = lambda index: (sizes[index][1] / sizes[index][0], sizes[index][0] * sizes[index][1]))
+
+        # Cut ordered samples into batches.
+        self.batches:       list =  [order[start:start + batch_size] for start in range(0, len(order), batch_size)]
+
+    def __len__(self) -> int:
+        """# Number of batches."""
+        return len(self.batches)
+
+    def __iter__(self) -> Iterator[list[int]]:
+        """# Iterate over batches of sample indices."""
+        yield from self.batches
+
+class PaddedCollator():
+    """# Collate samples of different sizes into a padded batch.
+
+    Images are padded with zeros and masks with the ignore index, at their bottom & right edges, up
+    to the largest height & width in the batch rounded up to a multiple of the models' output
+    stride. The valid size of each sample is returned alongside, so that predictions can be cropped
+    back to it.
+    """
+
+    def __init__(self,
+        multiple:   int =   PAD_MULTIPLE
+    ):
+        """# Initialize padded collator.
+
+        ## Args:
+            * multiple  (int, optional):    Multiple to which batches are padded. Defaults to
+                                            PAD_MULTIPLE.
+        """
+        # Define configuration.
+        self.multiple:  int =   multiple
+
+    def __call__(self,
+        samples:    list[tuple[Tensor, Tensor]]
+    ) -> tuple[Tensor, Tensor, Tensor]:
+        """# Collate samples.
+
+        ## Args:
+            * samples   (list[tuple[Tensor, Tensor]]):  uint8 images [3, H, W] & masks [H, W].
+
+        ## Returns:
+            * tuple[Tensor, Tensor, Tensor]:    Padded uint8 images & masks, and valid height &
+                                                width of each sample, shaped [B, 2].
+        """
+        # Define valid size of each sample.
+        sizes:          Tensor =    tensor([mask.shape for _, mask in samples], dtype = int64)
+
+        # Round largest height & width up to padding multiple.
+        height, width = (ceil(int(extent) / self.multiple) * self.multiple for extent in sizes.max(dim = 0).values)
+
+        # Allocate padded batch.
+        images:         Tensor =    zeros(len(samples), 3, height, width, dtype = samples[0][0].dtype)
+        masks:          Tensor =    full((len(samples), height, width), IGNORE_INDEX, dtype = samples[0][1].dtype)
+
+        # Copy each sample into the top-left corner of its slot.
+        for index, (image, mask) in enumerate(samples):
+            images[index, :, :image.shape[1], :image.shape[2]] =    image
+            masks[index, :mask.shape[0], :mask.shape[1]] =          mask
+
+        # Return batch.
+        return images, masks, sizes
+
+def valid_region(
+    sizes:  Tensor,
+    height: int,
+    width:  int
+) -> Tensor:
+    """# Mark the valid (unpadded) pixels of a padded batch.
+
+    ## Args:
+        * sizes     (Tensor):   Valid height & width of each sample, shaped [B, 2].
+        * height    (int):      Padded height of batch.
+        * width     (int):      Padded width of batch.
+
+    ## Returns:
+        * Tensor:   Boolean mask, shaped [B, H, W], on the device of `sizes`.
+    """
+    # Compare pixel coordinates against each sample's extent.
+    rows:       Tensor =    arange(height, device = sizes.device).view(1, -1, 1) < sizes[:, 0].view(-1, 1, 1)
+    columns:    Tensor =    arange(width,  device = sizes.device).view(1, 1, -1) < sizes[:, 1].view(-1, 1, 1)
+
+    # Return valid region.
+    return rows & columns
@@ -0,0 +1,154 @@
+"""Memory-mapped dataset cache."""
+
+__all__ = ["build_cache", "CachedDataset", "is_cached"]
+
+from json                   import dump, load as load_json
+from logging                import Logger
+from os                     import makedirs
+from os.path                import exists
+
+from numpy                  import load, ndarray, uint8
+from numpy.lib.format       import open_memmap
+from torch                  import from_numpy, Tensor
+from torch.utils.data       import DataLoader, Dataset
+from tqdm                   import tqdm
+
+from datasets.labels        import remap_mask
+from utilities              import LOGGER
+
+# Version of cache layout (bumped whenever stored contents change, so that stale caches are rebuilt).
+CACHE_VERSION:  int =   2
+
+def build_cache(
+    dataset:        Dataset,
+    path:           str,
+    table:          Tensor,
+    num_workers:    int =   4
+) -> None:
+    """# Decode & resize a dataset once, storing it in memory-mapped arrays.
+
+    Images are stored as uint8 [N, 3, H, W] and masks as uint8 class indices [N, H, W], remapped
+    from raw labels once, at build time. The metadata file is written last, so an interrupted build
+    is never mistaken for a complete one.
+
+    ## Args:
+        * dataset       (Dataset):          Dataset yielding resized uint8 image & raw mask tensors.
+        * path          (str):              Directory in which cache will be written.
+        * table         (Tensor):           Lookup table remapping raw mask labels to class indices
+                                            (see `label_table`).
+        * num_workers   (int, optional):    Number of threads to use for decoding. Defaults to 4.
+    """
+    # Initialize logger.
+    _logger_:   Logger =        LOGGER.getChild("dataset-cache")
+
+    # Ensure cache path exists.
+    makedirs(name = path, exist_ok = True)
+
+    # Decode samples in parallel.
+    loader:     DataLoader =    DataLoader(dataset = dataset, batch_size = 32, num_workers = num_workers)
+
+    # Initialize arrays once shape of samples is known.
+    images:     ndarray =       None
+    masks:      ndarray =       None
+    offset:     int =           0
+
+    # For each batch of samples...
+    for image, mask in tqdm(iterable = loader, desc = f"Caching {path}", colour = "cyan"):
+
+        # Allocate arrays on first batch.
+        if images is None:
+            images: ndarray =   open_memmap(f"{path}/images.npy", mode = "w+", dtype = uint8, shape = (len(dataset), *image.shape[1:]))
+            masks:  ndarray =   open_memmap(f"{path}/masks.npy",  mode = "w+", dtype = uint8, shape = (len(dataset), *mask.shape[-2:]))
+
+        # Write batch.
+        images[offset:offset + len(image)] =    image.numpy()
+        masks[offset:offset + len(mask)] =      remap_mask(mask = mask.reshape(len(mask), *mask.shape[-2:]), table = table).numpy()
+        offset +=                               len(image)
+
+    # Flush arrays to disk.
+    images.flush()
+    masks.flush()
+
+    # Mark cache as complete.
+    with open(f"{path}/meta.json", "w") as file: dump({"length": offset, "image_shape": list(images.shape[1:]), "version": CACHE_VERSION}, file)
+
+    # Log completion.
+    _logger_.info(f"Cached {offset} samples to {path}")
+
+def is_cached(
+    path:   str
+) -> bool:
+    """# Whether a complete cache, of the current layout, exists at a path.
+
+    ## Args:
+        * path  (str):  Directory of cache.
+
+    ## Returns:
+        * bool: True if cache can be served as is, False if it must be (re)built.
+    """
+    # Caches are complete once their metadata is written.
+    if not exists(f"{path}/meta.json"): return False
+
+    # Reject caches of older layouts (i.e., storing raw mask labels).
+    with open(f"{path}/meta.json") as file: return load_json(file).get("version") == CACHE_VERSION
+
+class CachedDataset(Dataset):
+    """# Dataset served from a memory-mapped cache.
+
+    Indexing with a list of indices returns a whole batch: contiguous indices are read as one
+    sequential, zero-copy slice of the arrays. Images stay uint8, to be normalized on device (see
+    `DevicePrefetcher`). Use with a `BatchSampler` and `batch_size = None`.
+    """
+
+    def __init__(self,
+        path:   str
+    ):
+        """# Initialize cached dataset.
+
+        ## Args:
+            * path  (str):  Directory containing cache.
+        """
+        # Define path.
+        self.path:      str =       path
+
+        # Read metadata.
+        with open(f"{path}/meta.json") as file: self.length: int = load_json(file)["length"]
+
+        # Arrays are mapped lazily, so that each worker maps its own view.
+        self._images_:  ndarray =   None
+        self._masks_:   ndarray =   None
+
+    def __len__(self) -> int:
+        """# Number of samples in dataset."""
+        return self.length
+
+    def __getitem__(self,
+        indices:    int | list[int]
+    ) -> tuple[Tensor, Tensor]:
+        """# Fetch a sample, or a batch of samples.
+
+        ## Args:
+            * indices   (int | list[int]):  Sample index, or list of sample indices.
+
+        ## Returns:
+            * tuple[Tensor, Tensor]:    uint8 image(s) and mask(s).
+        """
+        # Serve single sample as a batch of one.
+        if isinstance(indices, int):
+            images, masks = self[[indices]]
+            return images[0], masks[0]
+
+        # Map arrays on first access (copy-on-write, so that tensors can share their memory).
+        if self._images_ is None:
+            self._images_:  ndarray =   load(f"{self.path}/images.npy", mmap_mode = "c")
+            self._masks_:   ndarray =   load(f"{self.path}/masks.npy",  mmap_mode = "c")
+
+        # Read contiguous indices as a single slice.
+        window: slice | list =  (
+                                    slice(indices[0], indices[-1] + 1)
+                                    if indices == list(range(indices[0], indices[-1] + 1))
+                                    else indices
+                                )
+
+        # Wrap arrays without copying.
+        return from_numpy(self._images_[window]), from_numpy(self._masks_[window])
@@ -0,0 +1,57 @@
+"""Mask label canonicalization."""
+
+__all__ = ["IGNORE_INDEX", "label_table", "remap_mask"]
+
+from torch                  import full, int64, Tensor, uint8
+
+# Label of pixels excluded from evaluation (i.e., VOC's "void" border).
+IGNORE_INDEX:   int =               255
+
+# Class index of each raw label stored by dataset (raw labels not listed are ignored).
+LABEL_MAPS:     dict[str, dict] =   {
+                                        # Oxford-IIIT Pet trimaps: 1 = pet, 2 = background, 3 = border.
+                                        "pets": {1: 0, 2: 1, 3: 2},
+
+                                        # Pascal VOC: background & 20 object classes (255 = void).
+                                        "voc":  {label: label for label in range(21)}
+                                    }
+
+def label_table(
+    dataset_name:   str
+) -> Tensor:
+    """# Build the lookup table remapping a dataset's raw mask labels to class indices.
+
+    ## Args:
+        * dataset_name  (str):  Dataset selection.
+
+    ## Returns:
+        * Tensor:   uint8 table of 256 entries, mapping each raw label to its class index (in
+                    [0, num_classes)), or to IGNORE_INDEX.
+    """
+    # Validate dataset selection.
+    if dataset_name not in LABEL_MAPS: raise ValueError(f"Invalid dataset selection: {dataset_name}")
+
+    # Ignore every raw label by default.
+    table:  Tensor =    full((256,), IGNORE_INDEX, dtype = uint8)
+
+    # Map dataset's raw labels to their class indices.
+    for raw, index in LABEL_MAPS[dataset_name].items(): table[raw] = index
+
+    # Return table.
+    return table
+
+def remap_mask(
+    mask:   Tensor,
+    table:  Tensor
+) -> Tensor:
+    """# Remap raw mask labels to class indices, with a single table lookup.
+
+    ## Args:
+        * mask  (Tensor):   Raw labels, in [0, 255], of any shape.
+        * table (Tensor):   Lookup table, as returned by `label_table`.
+
+    ## Returns:
+        * Tensor:   uint8 class indices, of the same shape as `mask`.
+    """
+    # Index table with labels (as integers, since uint8 indices would be read as a boolean mask).
+    return table[mask.to(int64)]
@@ -0,0 +1,291 @@
+"""Datasets module."""
+
+__all__ = ["load_dataset"]
+
+from logging                import Logger
+
+from numpy                  import array
+from PIL                    import Image
+from torch                  import as_tensor, Tensor
+from torch.cuda             import is_available
+from torch.utils.data       import BatchSampler, DataLoader, Dataset, SequentialSampler
+from torchvision.transforms import Compose, InterpolationMode, PILToTensor, Resize
+from torchvision.datasets   import OxfordIIITPet, VOCSegmentation
+
+from datasets.bucketing     import BucketBatchSampler, PaddedCollator
+from datasets.cache         import build_cache, CachedDataset, is_cached
+from datasets.labels        import label_table, remap_mask
+from datasets.synthetic     import SyntheticDataset
+from utilities              import LOGGER
+
+# Split evaluated on each dataset.
+SPLITS: dict =  {"pets": "test", "voc": "val"}
+
+def load_dataset(
+    dataset_name:       str,
+    batch_size:         int =   8,
+    num_workers:        int =   4,
+    input_size:         tuple = (512, 512),
+    cache_dataset:      bool =  False,
+    cache_path:         str =   "data/cache",
+    pin_memory:         bool =  True,
+    persistent_workers: bool =  True,
+    prefetch_factor:    int =   2,
+    num_classes:        int =   3,
+    num_samples:        int =   256,
+    seed:               int =   0,
+    native_resolution:  bool =  False,
+    **kwargs
+) -> DataLoader:
+    """Initialize dataset and loaders.
+
+    ## Args:
+        * dataset_name          (str, optional):        Dataset on which model(s) will be
+                                                        evaluated. Options are "pets", "voc",
+                                                        and "synthetic". Defaults to "pets".
+        * batch_size            (int, optional):        Dataloader batch size. Defaults to 8.
+        * num_workers           (int, optional):        Number of threads to use for data
+                                                        loading. Defaults to 4.
+        * input_size            (tuple[int], optional): Clip size for samples. Defaults to (512,
+                                                        512).
+        * cache_dataset         (bool, optional):       Serve samples from a memory-mapped cache
+                                                        of resized images & masks, building it on
+                                                        first use. Defaults to False.
+        * cache_path            (str, optional):        Directory under which caches are stored.
+                                                        Defaults to "data/cache".
+        * pin_memory            (bool, optional):       Collate batches into page-locked memory,
+                                                        so that host-to-device copies can be
+                                                        asynchronous (CUDA only). Defaults to
+                                                        True.
+        * persistent_workers    (bool, optional):       Keep workers alive between passes over
+                                                        the dataset (i.e., across models).
+                                                        Defaults to True.
+        * prefetch_factor       (int, optional):        Batches loaded in advance by each worker.
+                                                        Defaults to 2.
+        * num_classes           (int, optional):        Number of classes of synthetic dataset.
+                                                        Defaults to 3.
+        * num_samples           (int, optional):        Number of samples of synthetic dataset.
+                                                        Defaults to 256.
+        * seed                  (int, optional):        Seed of synthetic dataset. Defaults to 0.
+        * native_resolution     (bool, optional):       Evaluate Pets & VOC samples at their own
+                                                        resolution instead of resizing them to
+                                                        `input_size`: samples are batched by
+                                                        aspect ratio and padded to a multiple of
+                                                        32, and batches carry the valid size of
+                                                        each sample. Defaults to False.
+
+    ## Returns:
+        * Dataloader:   Initialized data loader.
+    """
+    # Initialize logger.
+    _logger_:               Logger =            LOGGER.getChild("dataset-loader")
+
+    # Define loader options (worker options only apply when using workers).
+    options:                dict =              {
+                                                    "num_workers":          num_workers,
+                                                    "pin_memory":           pin_memory and is_available(),
+                                                    "persistent_workers":   persistent_workers and num_workers > 0,
+                                                    "prefetch_factor":      prefetch_factor if num_workers > 0 else None
+                                                }
+
+    # If generating samples (in memory, so never cached)...
+    if dataset_name == "synthetic":
+
+        # Log action.
+        _logger_.info(f"Generating synthetic dataset ({num_samples} samples, {num_classes} classes, seed {seed})...")
+
+        # Initialize synthetic dataset.
+        dataset:            SyntheticDataset =  SyntheticDataset(
+                                                    num_classes =   num_classes,
+                                                    input_size =    input_size,
+                                                    num_samples =   num_samples,
+                                                    seed =          seed
+                                                )
+
+    # Otherwise, if evaluating at native resolution (never cached, as sizes vary)...
+    elif native_resolution:
+
+        # Define lookup table remapping raw mask labels to class indices.
+        table:              Tensor =            label_table(dataset_name)
+
+        # Decode images & masks at their own size.
+        dataset:            Dataset =           _initialize_dataset_(
+                                                    dataset_name =      dataset_name,
+                                                    transform =         PILToTensor(),
+                                                    target_transform =  lambda x: remap_mask(mask = as_tensor(array(x)), table = table)
+                                                )
+
+        # Group samples of similar shape, reading sizes from image headers.
+        sampler:            BucketBatchSampler = BucketBatchSampler(sizes = _image_sizes_(dataset), batch_size = batch_size)
+
+        # Log action.
+        _logger_.info(f"Evaluating {dataset_name} at native resolution, in {len(sampler)} aspect-ratio bucketed batches...")
+
+        # Return dataloader, padding each batch to a multiple of 32.
+        return  DataLoader(
+                    dataset =       dataset,
+                    batch_sampler = sampler,
+                    collate_fn =    PaddedCollator(),
+                    **options
+                )
+
+    # Otherwise, if serving from cache...
+    elif cache_dataset:
+
+        # Validate dataset selection.
+        if dataset_name not in SPLITS: raise ValueError(f"Invalid dataset selection: {dataset_name}")
+
+        # Key cache by dataset, split, and input size.
+        path:               str =               f"{cache_path}/{dataset_name}_{SPLITS[dataset_name]}_{input_size[0]}x{input_size[1]}"
+
+        # If cache has not been built (or predates its current layout)...
+        if not is_cached(path):
+
+            # Log action.
+            _logger_.info(f"Building dataset cache at {path}...")
+
+            # Decode & resize samples once, without normalizing.
+            build_cache(
+                dataset =       _initialize_dataset_(
+                                    dataset_name =      dataset_name,
+                                    transform =         Compose([
+                                                            Resize(size = input_size, antialias = True),
+                                                            PILToTensor()
+                                                        ]),
+                                    target_transform =  Compose([
+                                                            Resize(size = input_size, interpolation = InterpolationMode.NEAREST),
+                                                            PILToTensor()
+                                                        ])
+                                ),
+                path =          path,
+                table =         label_table(dataset_name),
+                num_workers =   num_workers
+            )
+
+        # Log action.
+        _logger_.info(f"Loading dataset from cache at {path}...")
+
+        # Initialize cached dataset.
+        dataset:            CachedDataset =     CachedDataset(path = path)
+
+    # Otherwise, decode samples one at a time.
+    else:
+
+        # Resize images, keeping them uint8 (they are normalized on device, batch by batch).
+        transform:          Compose =           Compose([
+                                                    Resize(size = input_size, antialias = True),
+                                                    PILToTensor()
+                                                ])
+
+        # Define lookup table remapping raw mask labels to class indices.
+        table:              Tensor =            label_table(dataset_name)
+
+        # Resize masks without interpolating labels, then remap them to uint8 class indices in the
+        # loader workers (rather than in the evaluation loop).
+        target_transform:   Compose =           Compose([
+                                                    Resize(size = input_size, interpolation = InterpolationMode.NEAREST),
+                                                    lambda x: remap_mask(mask = as_tensor(array(x)), table = table)
+                                                ])
+
+        # Return dataloader.
+        return  DataLoader(
+                    dataset =           _initialize_dataset_(
+                                            dataset_name =      dataset_name,
+                                            transform =         transform,
+                                            target_transform =  target_transform
+                                        ),
+                    batch_size =        batch_size,
+                    shuffle =           False,
+                    **options
+                )
+
+    # Return dataloader, fetching whole batches from the cache or generator.
+    return  DataLoader(
+                dataset =       dataset,
+                sampler =       BatchSampler(
+                                    sampler =       SequentialSampler(dataset),
+                                    batch_size =    batch_size,
+                                    drop_last =     False
+                                ),
+                batch_size =    None,
+                **options
+            )
+
+def _initialize_dataset_(
+    dataset_name:       str,
+    transform:          Compose,
+    target_transform:   Compose
+) -> Dataset:
+    """# Download/verify and initialize dataset.
+
+    ## Args:
+        * dataset_name      (str):      Dataset selection.
+        * transform         (Compose):  Image transforms.
+        * target_transform  (Compose):  Mask transforms.
+
+    ## Returns:
+        * Dataset:  Initialized dataset.
+    """
+    # Initialize logger.
+    _logger_:               Logger =            LOGGER.getChild("dataset-loader")
+
+    # Match dataset selection.
+    match dataset_name:
+
+        # Oxford IIIT Pets
+        case "pets":
+
+            # Log action.
+            _logger_.info("Loading Oxford-IIIT Pet dataset...")
+
+            # Download/verify dataset.
+            return  OxfordIIITPet(
+                        root =              "data",
+                        split =             SPLITS["pets"],
+                        target_types =      "segmentation",
+                        download =          True,
+                        transform =         transform,
+                        target_transform =  target_transform
+                    )
+
+        # Pascal VOC Segmentation.
+        case "voc":
+
+            # Log action.
+            _logger_.info("Loading Pascal VOC Segmentation dataset...")
+
+            # Download/verify dataset.
+            return  VOCSegmentation(
+                        root =              "data",
+                        year =              "2012",
+                        image_set =         SPLITS["voc"],
+                        download =          True,
+                        transform =         transform,
+                        target_transform =  target_transform
+                    )
+
+        # Invalid selection.
+        case _: raise ValueError(f"Invalid dataset selection: {dataset_name}")
+
+def _image_sizes_(
+    dataset:    Dataset
+) -> list[tuple[int, int]]:
+    """# Read the size of each image of a dataset, from file headers alone.
+
+    ## Args:
+        * dataset   (Dataset):  Oxford-IIIT Pet or Pascal VOC dataset.
+
+    ## Returns:
+        * list[tuple[int, int]]:    Height & width of each image.
+    """
+    # Initialize sizes array.
+    sizes:  list =  []
+
+    # For each image file (Pets & VOC keep their file lists under different names)...
+    for path in (dataset._images if isinstance(dataset, OxfordIIITPet) else dataset.images):
+
+        # Read size from header, without decoding pixels.
+        with Image.open(path) as image: sizes.append((image.height, image.width))
+
+    # Return sizes.
+    return sizes
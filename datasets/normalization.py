@@ -0,0 +1,45 @@
+"""Batched image normalization."""
+
+__all__ = ["MEAN", "normalization_constants", "normalize_images", "STD"]
+
+from torch                  import device as Device, float32, tensor, Tensor
+
+# ImageNet normalization statistics.
+MEAN:   list =  [0.485, 0.456, 0.406]
+STD:    list =  [0.229, 0.224, 0.225]
+
+def normalization_constants(
+    device: str =   "cpu"
+) -> tuple[Tensor, Tensor]:
+    """# Fold scaling to [0, 1] and ImageNet normalization into a single scale & shift.
+
+    ## Args:
+        * device    (str, optional):    Device on which constants are placed. Defaults to "cpu".
+
+    ## Returns:
+        * tuple[Tensor, Tensor]:    Per-channel scale (1 / (255 * std)) and shift (-mean / std),
+                                    shaped [1, 3, 1, 1].
+    """
+    # Define statistics.
+    mean:   Tensor =    tensor(MEAN, device = Device(device)).view(1, 3, 1, 1)
+    std:    Tensor =    tensor(STD,  device = Device(device)).view(1, 3, 1, 1)
+
+    # Return scale & shift.
+    return 1 / (255 * std), -mean / std
+
+def normalize_images(
+    images: Tensor,
+    scale:  Tensor,
+    shift:  Tensor
+) -> Tensor:
+    """# Convert a batch of uint8 images to normalized float32, as one batched operation.
+
+    ## Args:
+        * images    (Tensor):   uint8 images, shaped [B, 3, H, W].
+        * scale     (Tensor):   Per-channel scale, as returned by `normalization_constants`.
+        * shift     (Tensor):   Per-channel shift, as returned by `normalization_constants`.
+
+    ## Returns:
+        * Tensor:   Normalized float32 images, on the device of `images`.
+    """
+    return images.to(float32).mul_(scale).add_(shift)
@@ -0,0 +1,123 @@
+"""Procedural synthetic dataset."""
+
+__all__ = ["SyntheticDataset"]
+
+from torch                  import arange, Generator, int64, rand, randint, randn, stack, Tensor, uint8, zeros
+from torch.utils.data       import Dataset
+
+from datasets.labels        import IGNORE_INDEX
+
+class SyntheticDataset(Dataset):
+    """# Dataset of procedurally generated images & multi-class masks.
+
+    Each mask is background (class 0) overlaid with randomly placed ellipses & rectangles of random
+    classes, and each image paints every class in its own color, plus noise. Samples are generated
+    on the fly, never touching disk, from a generator seeded by the dataset seed and the sample
+    index, so they are identical across runs, batch sizes, and worker processes.
+
+    Like `CachedDataset`, indexing with a list of indices returns a whole batch of uint8 images &
+    masks, to be normalized on device. Use with a `BatchSampler` and `batch_size = None`.
+    """
+
+    def __init__(self,
+        num_classes:    int =           3,
+        input_size:     tuple[int] =    (512, 512),
+        num_samples:    int =           256,
+        seed:           int =           0,
+        max_shapes:     int =           8
+    ):
+        """# Initialize synthetic dataset.
+
+        ## Args:
+            * num_classes   (int, optional):        Number of classes, including background (at
+                                                    most 255). Defaults to 3.
+            * input_size    (tuple[int], optional): Size of samples. Defaults to (512, 512).
+            * num_samples   (int, optional):        Number of samples. Defaults to 256.
+            * seed          (int, optional):        Seed from which samples are generated. Defaults
+                                                    to 0.
+            * max_shapes    (int, optional):        Maximum number of shapes per mask. Defaults to
+                                                    8.
+        """
+        # Masks are stored as uint8 class indices, short of the ignore index.
+        if not 2 <= num_classes <= IGNORE_INDEX: raise ValueError(f"Synthetic datasets support 2 to {IGNORE_INDEX} classes, got {num_classes}")
+
+        # Define configuration.
+        self.num_classes:   int =           num_classes
+        self.input_size:    tuple[int] =    tuple(input_size)
+        self.num_samples:   int =           num_samples
+        self.seed:          int =           seed
+        self.max_shapes:    int =           max_shapes
+
+        # Assign each class a color, shared by all samples.
+        self.palette:       Tensor =        rand(num_classes, 3, generator = Generator().manual_seed(seed))
+
+    def __len__(self) -> int:
+        """# Number of samples in dataset."""
+        return self.num_samples
+
+    def __getitem__(self,
+        indices:    int | list[int]
+    ) -> tuple[Tensor, Tensor]:
+        """# Generate a sample, or a batch of samples.
+
+        ## Args:
+            * indices   (int | list[int]):  Sample index, or list of sample indices.
+
+        ## Returns:
+            * tuple[Tensor, Tensor]:    uint8 image(s) and mask(s).
+        """
+        # Serve single sample as a batch of one.
+        if isinstance(indices, int):
+            images, masks = self[[indices]]
+            return images[0], masks[0]
+
+        # Generate samples.
+        images, masks = zip(*[self._generate_(index) for index in indices])
+
+        # Collate batch.
+        return stack(images), stack(masks)
+
+    def _generate_(self,
+        index:  int
+    ) -> tuple[Tensor, Tensor]:
+        """# Generate one sample.
+
+        ## Args:
+            * index (int):  Sample index.
+
+        ## Returns:
+            * tuple[Tensor, Tensor]:    uint8 image and mask.
+        """
+        # Verify index.
+        if not 0 <= index < self.num_samples: raise IndexError(f"Sample index {index} out of range for {self.num_samples} samples")
+
+        # Seed sample's generator from dataset seed & sample index.
+        generator:  Generator = Generator().manual_seed((self.seed << 32) + index)
+
+        # Define pixel coordinates, normalized to [0, 1].
+        height, width =         self.input_size
+        rows:       Tensor =    (arange(height) / height).view(-1, 1)
+        columns:    Tensor =    (arange(width) / width).view(1, -1)
+
+        # Initialize mask to background.
+        mask:       Tensor =    zeros(self.input_size, dtype = int64)
+
+        # For each shape...
+        for _ in range(int(randint(1, self.max_shapes + 1, (1,), generator = generator))):
+
+            # Draw class, center, radii, and kind of shape.
+            label:              int =       int(randint(1, self.num_classes, (1,), generator = generator))
+            center_y, center_x, \
+            radius_y, radius_x, kind =      rand(5, generator = generator).tolist()
+            radius_y, radius_x =            0.05 + 0.3 * radius_y, 0.05 + 0.3 * radius_x
+
+            # Paint ellipse or rectangle (later shapes occlude earlier ones).
+            distance_y:         Tensor =    (rows - center_y).abs_().div_(radius_y)
+            distance_x:         Tensor =    (columns - center_x).abs_().div_(radius_x)
+            mask[(distance_y ** 2 + distance_x ** 2 <= 1) if kind < 0.5 else ((distance_y <= 1) & (distance_x <= 1))] = label
+
+        # Paint each class in its color, plus noise.
+        image:      Tensor =    self.palette[mask].permute(2, 0, 1).add_(randn(3, height, width, generator = generator), alpha = 0.1).clamp_(0, 1)
+
+        # Return sample, quantized like a decoded image.
+        return image.mul_(255).round_().to(uint8), mask.to(uint8)
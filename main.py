@@ -1,23 +1,48 @@
 """Drive applicaiton."""
 
-from commands   import *
-from utilities  import *
+from argparse   import Namespace
+
+from utilities  import BANNER, configure_logging, LOGGER, parse_arguments
 
 if __name__ == "__main__":
     """Execute application command(s)."""
     
+    # Parse arguments (before importing any command, so that help & validation errors are quick).
+    ARGS:   Namespace = parse_arguments()
+    
+    # Configure logging.
+    configure_logging(level = ARGS.logging_level, path = ARGS.logging_path)
+    
     try:# Log banner
         LOGGER.info(BANNER)
-        
-        # Match command.
+    
+        # Match command (importing only the command being executed).
         match ARGS.command:
-            
+    
             # Execute job.
-            case "benchmark":   run_benchmark(**vars(ARGS))
-        
+            case "benchmark":
+    
+                # Match benchmark mode.
+                match ARGS.dataset_name:
+    
+                    # Batch-size & resolution sweep.
+                    case "sweep":
+                        from commands import run_sweep
+                        run_sweep(**vars(ARGS))
+    
+                    # Dataset evaluation.
+                    case _:
+                        from commands import run_benchmark
+                        run_benchmark(**vars(ARGS))
+    
+            # Measure startup time.
+            case "startup":
+                from commands import run_startup
+                run_startup(**vars(ARGS))
+    
     # Gracefully handle keyboard interruptions
     except KeyboardInterrupt:   LOGGER.info("Keyboard interruption detected. Aborting operations.")
-        
+    
     # Catch wildcard errors
     except Exception as e:      LOGGER.error(f"Unexpected error: {e}", exc_info = True)
     
@@ -0,0 +1,11 @@
+"""Metrics package."""
+
+__all__ = ["AsyncMetricEvaluator", "calculate_metrics", "MetricAccumulator", "confusion_matrix", "hausdorff_distance", "HAUSDORFF_PENALTY", "plot_results", "plot_sweep", "predict_labels", "prediction_confidence", "scores_from_confusion"]
+
+from metrics.accumulators   import MetricAccumulator
+from metrics.asynchronous   import AsyncMetricEvaluator
+from metrics.confusion      import confusion_matrix, scores_from_confusion
+from metrics.hausdorff      import hausdorff_distance, HAUSDORFF_PENALTY
+from metrics.plots          import plot_results, plot_sweep
+from metrics.predictions    import predict_labels, prediction_confidence
+from metrics.segmentation   import calculate_metrics
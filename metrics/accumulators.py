@@ -0,0 +1,268 @@
+"""Streaming metric accumulators."""
+
+__all__ = ["MetricAccumulator"]
+
+from numpy                          import array, flatnonzero, isnan, ndarray, zeros
+from torch                          import float64, inference_mode, stack, Tensor, tensor
+
+from metrics.confusion              import confusion_matrix, scores_from_confusion
+from metrics.hausdorff              import hausdorff_distance
+
+class MetricAccumulator():
+    """# Streaming dataset-level segmentation metrics.
+
+    Batches are folded into running per-class counts (a confusion matrix, kept on the device of
+    the predictions), per-class Hausdorff distance sums, and optionally a confidence sum, so memory
+    stays O(classes) regardless of dataset size. Metrics are reduced once, by `compute`, and no longer depend on batch size.
+    Partial states (i.e., from separate shards or workers) combine through `merge`.
+
+    Running state is always allocated outside of inference mode, so that it can keep accumulating
+    (i.e., merging asynchronous results) after inference mode is exited.
+    """
+
+    def __init__(self,
+        dataset_name:           str,
+        num_classes:            int,
+        smooth:                 float = 1e-6,
+        hausdorff_backend:      str =   "edt",
+        hausdorff_percentile:   float = 100.0,
+        hausdorff_stride:       int =   1,
+        confidence:             bool =  False
+    ):
+        """# Initialize metric accumulator.
+
+        ## Args:
+            * dataset_name          (str):              Dataset being evaluated.
+            * num_classes           (int):              Number of classes in dataset.
+            * smooth                (float, optional):  Smoothing factor. Defaults to 1e-6.
+            * hausdorff_backend     (str, optional):    One of "edt", "medpy", or "none"
+                                                        (disabled). Defaults to "edt".
+            * hausdorff_percentile  (float, optional):  Percentile of surface distances
+                                                        reported (i.e., 95 for HD95). Defaults
+                                                        to 100.
+            * hausdorff_stride      (int, optional):    Boundary subsampling cell size. Defaults
+                                                        to 1 (exact).
+            * confidence            (bool, optional):   Also report mean confidence (maximum
+                                                        softmax probability) over labelled
+                                                        pixels. Defaults to False.
+        """
+        # Define configuration.
+        self.dataset_name:          str =       dataset_name
+        self.num_classes:           int =       num_classes
+        self.smooth:                float =     smooth
+        self.hausdorff_backend:     str =       hausdorff_backend
+        self.hausdorff_percentile:  float =     hausdorff_percentile
+        self.hausdorff_stride:      int =       hausdorff_stride
+        self.confidence:            bool =      confidence
+
+        # Initialize running state.
+        self.reset()
+
+    def empty(self) -> "MetricAccumulator":
+        """# Create an empty accumulator with the same configuration.
+
+        ## Returns:
+            * MetricAccumulator:    Empty accumulator.
+        """
+        return  MetricAccumulator(
+                    dataset_name =          self.dataset_name,
+                    num_classes =           self.num_classes,
+                    smooth =                self.smooth,
+                    hausdorff_backend =     self.hausdorff_backend,
+                    hausdorff_percentile =  self.hausdorff_percentile,
+                    hausdorff_stride =      self.hausdorff_stride,
+                    confidence =            self.confidence
+                )
+
+    def reset(self) -> None:
+        """# Clear running state."""
+        # Confusion matrix is allocated on first update, on the device of the predictions.
+        self.confusion:         Tensor =    None
+
+        # Initialize per-class Hausdorff distance sums and image counts.
+        self.hausdorff_sum:     ndarray =   zeros(self.num_classes)
+        self.hausdorff_count:   ndarray =   zeros(self.num_classes, dtype = int)
+
+        # Confidence sum & pixel count are allocated on first update, alongside confusion matrix.
+        self.confidence_sum:    Tensor =    None
+
+    def update(self,
+        prediction: Tensor,
+        target:     Tensor,
+        confidence: Tensor =    None
+    ) -> None:
+        """# Fold a batch into running state.
+
+        ## Args:
+            * prediction    (Tensor):           Predicted class labels.
+            * target        (Tensor):           Ground truth class labels.
+            * confidence    (Tensor, optional): Confidence of each pixel's prediction (see
+                                                `prediction_confidence`), required if reporting
+                                                confidence. Defaults to None.
+        """
+        # Reduce batch to confusion matrix on device.
+        confusion:  Tensor =    confusion_matrix(
+                                    prediction =    prediction,
+                                    target =        target,
+                                    num_classes =   self.num_classes
+                                )
+
+        # Accumulate counts, without leaving the device.
+        if self.confusion is None:  self.confusion =    _state_(confusion)
+        else:                       self.confusion +=   confusion
+
+        # If reporting confidence...
+        if self.confidence:
+
+            # Verify that confidence was provided.
+            if confidence is None: raise ValueError("Confidence of predictions is required when reporting confidence")
+
+            # Sum confidence over labelled pixels (masking, rather than indexing, to avoid a device sync).
+            labelled:   Tensor =    target.to(confidence.device) < self.num_classes
+            totals:     Tensor =    stack([confidence.to(float64).mul(labelled).sum(), labelled.sum().to(float64)])
+
+            # Accumulate sum & count, without leaving the device.
+            if self.confidence_sum is None: self.confidence_sum =   _state_(totals)
+            else:                           self.confidence_sum +=  totals.to(self.confidence_sum.device)
+
+        # Skip Hausdorff distance if disabled.
+        if self.hausdorff_backend == "none": return
+
+        # Copy masks to host for distance transforms.
+        prediction: ndarray =   prediction.detach().cpu().numpy()
+        target:     ndarray =   target.detach().cpu().numpy()
+
+        # For each class present in target...
+        for cls in flatnonzero(confusion.sum(dim = 1).cpu().numpy()):
+
+            # Skip background for every dataset but Pets (whose class 0 is the pet).
+            if cls == 0 and self.dataset_name.lower() != "pets": continue
+
+            # Calculate Hausdorff distance of each image in batch.
+            distances:  ndarray =   hausdorff_distance(
+                                        prediction =    prediction == cls,
+                                        target =        target == cls,
+                                        backend =       self.hausdorff_backend,
+                                        percentile =    self.hausdorff_percentile,
+                                        stride =        self.hausdorff_stride
+                                    )
+
+            # Accumulate distances of images in which class is present.
+            self.hausdorff_sum[cls] +=      distances[~isnan(distances)].sum()
+            self.hausdorff_count[cls] +=    (~isnan(distances)).sum()
+
+    def merge(self,
+        other:  "MetricAccumulator"
+    ) -> "MetricAccumulator":
+        """# Combine another accumulator's partial state into this one.
+
+        ## Args:
+            * other (MetricAccumulator):    Accumulator with the same dataset and number of
+                                            classes.
+
+        ## Returns:
+            * MetricAccumulator:    This accumulator, for chaining.
+        """
+        # Ensure states are compatible.
+        if other.num_classes != self.num_classes: raise ValueError(f"Cannot merge accumulators over {other.num_classes} and {self.num_classes} classes")
+
+        # Combine confusion matrices on this accumulator's device.
+        if other.confusion is not None:
+            if self.confusion is None:  self.confusion =    _state_(other.confusion)
+            else:                       self.confusion +=   other.confusion.to(self.confusion.device)
+
+        # Combine confidence sums & counts.
+        if other.confidence_sum is not None:
+            if self.confidence_sum is None: self.confidence_sum =   _state_(other.confidence_sum)
+            else:                           self.confidence_sum +=  other.confidence_sum.to(self.confidence_sum.device)
+
+        # Combine Hausdorff distance sums and counts.
+        self.hausdorff_sum +=   other.hausdorff_sum
+        self.hausdorff_count += other.hausdorff_count
+
+        # Return self for chaining.
+        return self
+
+    def state_dict(self) -> dict:
+        """# Export running state as plain values (i.e., for checkpointing).
+
+        ## Returns:
+            * dict: Confusion matrix, Hausdorff distance sums, image counts, and confidence sum &
+                    pixel count.
+        """
+        return  {
+                    "confusion":        self.confusion.cpu().tolist() if self.confusion is not None else None,
+                    "hausdorff_sum":    self.hausdorff_sum.tolist(),
+                    "hausdorff_count":  self.hausdorff_count.tolist(),
+                    "confidence_sum":   self.confidence_sum.cpu().tolist() if self.confidence_sum is not None else None
+                }
+
+    def load_state_dict(self,
+        state:  dict,
+        device: str =   "cpu"
+    ) -> None:
+        """# Restore running state exported by `state_dict`.
+
+        ## Args:
+            * state     (dict):             Running state.
+            * device    (str, optional):    Device on which confusion matrix is kept. Defaults to
+                                            "cpu".
+        """
+        # Restore confusion matrix.
+        self.confusion:         Tensor =    tensor(state["confusion"], device = device) if state["confusion"] is not None else None
+
+        # Restore Hausdorff distance sums and counts.
+        self.hausdorff_sum:     ndarray =   array(state["hausdorff_sum"], dtype = float)
+        self.hausdorff_count:   ndarray =   array(state["hausdorff_count"], dtype = int)
+
+        # Restore confidence sum & count.
+        self.confidence_sum:    Tensor =    tensor(state["confidence_sum"], dtype = float64, device = device) if state["confidence_sum"] is not None else None
+
+    def compute(self) -> dict:
+        """# Reduce running state to dataset-level metrics.
+
+        ## Returns:
+            * dict: Dice coefficient, precision, recall, Haussdorf distance, and mean confidence (if
+                    reported).
+        """
+        # Copy counts to host (or start from empty counts if nothing was accumulated).
+        confusion:  ndarray =   (
+                                    self.confusion.cpu().numpy() if self.confusion is not None
+                                    else zeros((self.num_classes, self.num_classes), dtype = int)
+                                )
+
+        # Derive Dice score, precision, and recall from counts.
+        results:    dict =      scores_from_confusion(
+                                    confusion =     confusion,
+                                    dataset_name =  self.dataset_name,
+                                    smooth =        self.smooth
+                                )
+
+        # Average Hausdorff distance over every image & class measured, recording zero if none.
+        results["Hausdorff"] =  (
+                                    float("nan") if self.hausdorff_backend == "none"
+                                    else float(self.hausdorff_sum.sum() / self.hausdorff_count.sum()) if self.hausdorff_count.any()
+                                    else 0.0
+                                )
+
+        # Average confidence over every labelled pixel, recording zero if none.
+        if self.confidence:
+            total, count =          self.confidence_sum.tolist() if self.confidence_sum is not None else (0.0, 0.0)
+            results["Confidence"] = total / count if count else 0.0
+
+        # Return dataset-level metrics.
+        return results
+
+def _state_(
+    counts: Tensor
+) -> Tensor:
+    """# Copy counts into running state, as a normal tensor even within inference mode (in which
+    tensors created cannot be updated in place once it is exited).
+
+    ## Args:
+        * counts    (Tensor):   Counts being copied.
+
+    ## Returns:
+        * Tensor:   Copy of counts.
+    """
+    with inference_mode(False): return counts.clone()
@@ -0,0 +1,125 @@
+"""Asynchronous metric evaluation."""
+
+__all__ = ["AsyncMetricEvaluator"]
+
+from collections                    import deque
+from concurrent.futures             import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing                import get_context
+from threading                      import BoundedSemaphore
+
+from torch                          import Tensor
+
+from metrics.accumulators           import MetricAccumulator
+
+class AsyncMetricEvaluator():
+    """# Evaluate metrics off the inference critical path.
+
+    Each submitted batch is folded into an empty copy of its accumulator by a worker pool, while
+    inference continues on the main thread. Batches are handed over on their device, and workers
+    copy them to the host, so that the main thread never waits for the device to finish a batch.
+    At most `max_pending` batches are in flight; further submissions block until one completes,
+    so device & host memory stay bounded. Partial states are merged back in submission order, so
+    results do not depend on worker scheduling.
+    """
+
+    def __init__(self,
+        workers:        int =   2,
+        max_pending:    int =   4,
+        executor:       str =   "thread"
+    ):
+        """# Initialize asynchronous metric evaluator.
+
+        ## Args:
+            * workers       (int, optional):    Number of metric workers. Defaults to 2.
+            * max_pending   (int, optional):    Maximum number of batches in flight. Defaults to 4.
+            * executor      (str, optional):    One of "thread" or "process". Defaults to "thread".
+        """
+        # Match executor selection.
+        match executor:
+
+            # Threads share memory; distance transforms & reductions release the GIL.
+            case "thread":  self.executor:  Executor =  ThreadPoolExecutor(max_workers = workers)
+
+            # Processes run on separate cores entirely (spawned, as parent may hold CUDA state).
+            case "process": self.executor:  Executor =  ProcessPoolExecutor(max_workers = workers, mp_context = get_context("spawn"))
+
+            # Invalid selection.
+            case _:         raise ValueError(f"Invalid metric executor: {executor}")
+
+        # Initialize backpressure & pending queue.
+        self.slots:     BoundedSemaphore =  BoundedSemaphore(max_pending)
+        self.pending:   deque =             deque()
+
+    def submit(self,
+        accumulator:    MetricAccumulator,
+        prediction:     Tensor,
+        target:         Tensor,
+        confidence:     Tensor =    None
+    ) -> None:
+        """# Fold a batch into an accumulator asynchronously.
+
+        ## Args:
+            * accumulator   (MetricAccumulator):    Accumulator receiving batch.
+            * prediction    (Tensor):               Predicted class labels.
+            * target        (Tensor):               Ground truth class labels.
+            * confidence    (Tensor, optional):     Confidence of each pixel's prediction, if
+                                                    reported. Defaults to None.
+        """
+        # Block until a slot frees up.
+        self.slots.acquire()
+
+        # Hand batch to pool (copying it to host here would block until the device catches up).
+        future: Future =    self.executor.submit(_update_, accumulator.empty(), prediction.detach(), target.detach(), confidence.detach() if confidence is not None else None)
+
+        # Free slot once batch is evaluated.
+        future.add_done_callback(lambda _: self.slots.release())
+
+        # Queue partial state.
+        self.pending.append((accumulator, future))
+
+        # Merge any leading batches that have completed.
+        while self.pending and self.pending[0][1].done(): self._merge_()
+
+    def join(self) -> None:
+        """# Wait for all pending batches, merging them into their accumulators."""
+        while self.pending: self._merge_()
+
+    def shutdown(self) -> None:
+        """# Wait for pending batches and release workers."""
+        # Merge remaining batches.
+        self.join()
+
+        # Release workers.
+        self.executor.shutdown()
+
+    def _merge_(self) -> None:
+        """# Merge oldest pending batch into its accumulator (re-raising worker errors)."""
+        # Take oldest pending batch.
+        accumulator, future =   self.pending.popleft()
+
+        # Merge partial state.
+        accumulator.merge(future.result())
+
+def _update_(
+    accumulator:    MetricAccumulator,
+    prediction:     Tensor,
+    target:         Tensor,
+    confidence:     Tensor =    None
+) -> MetricAccumulator:
+    """# Copy a batch to host and fold it into an accumulator (executed by workers).
+
+    ## Args:
+        * accumulator   (MetricAccumulator):    Empty accumulator.
+        * prediction    (Tensor):               Predicted class labels, on any device.
+        * target        (Tensor):               Ground truth class labels, on any device.
+        * confidence    (Tensor, optional):     Confidence of each pixel's prediction, on any
+                                                device. Defaults to None.
+
+    ## Returns:
+        * MetricAccumulator:    Partial state of batch.
+    """
+    # Fold host copy of batch (waiting for the device on this worker, not the main thread).
+    accumulator.update(prediction = prediction.cpu(), target = target.cpu(), confidence = confidence.cpu() if confidence is not None else None)
+
+    # Return partial state.
+    return accumulator
@@ -0,0 +1,85 @@
+"""Confusion-matrix metric engine."""
+
+__all__ = ["confusion_matrix", "scores_from_confusion"]
+
+from numpy                          import diag, float64, ndarray, ones
+from torch                          import bincount, int64, Tensor, where
+
+def confusion_matrix(
+    prediction:     Tensor,
+    target:         Tensor,
+    num_classes:    int
+) -> Tensor:
+    """# Compute the per-class confusion matrix of a batch.
+
+    The whole batch is reduced with a single bincount on the device on which the tensors already
+    reside, so only the [num_classes, num_classes] count matrix ever needs to leave the device.
+    Pixels whose target falls outside of the class range (i.e., the ignore index, to which VOC's
+    "void" border is remapped) are not counted.
+
+    ## Args:
+        * prediction    (Tensor):   Predicted class indices.
+        * target        (Tensor):   Ground truth class indices.
+        * num_classes   (int):      Number of classes in dataset.
+
+    ## Returns:
+        * Tensor:   Confusion matrix, with rows indexed by target class and columns indexed by
+                    predicted class.
+    """
+    # Flatten labels.
+    prediction: Tensor =    prediction.reshape(-1).to(int64)
+    target:     Tensor =    target.reshape(-1).to(int64)
+
+    # Route out-of-range pixels to an overflow bin (avoids a device sync from boolean indexing).
+    valid:      Tensor =    (target >= 0) & (target < num_classes) & (prediction >= 0) & (prediction < num_classes)
+    indices:    Tensor =    where(valid, target * num_classes + prediction, num_classes ** 2)
+
+    # Count every (target, prediction) pair at once, dropping the overflow bin.
+    return bincount(indices, minlength = num_classes ** 2 + 1)[:num_classes ** 2].reshape(num_classes, num_classes)
+
+def scores_from_confusion(
+    confusion:      ndarray,
+    dataset_name:   str,
+    smooth:         float = 1e-6
+) -> dict:
+    """# Derive Dice score, precision, and recall from a confusion matrix.
+
+    Scores are averaged over the classes present in the target. Background (class 0) is skipped
+    for every dataset except Pets, whose class 0 is the pet, weighted higher than background or
+    border.
+
+    ## Args:
+        * confusion     (ndarray):          Confusion matrix, as returned by `confusion_matrix`.
+        * dataset_name  (str):              Dataset being evaluated.
+        * smooth        (float, optional):  Smoothing factor. Defaults to 1e-6.
+
+    ## Returns:
+        * dict: Dice score, precision, and recall.
+    """
+    # Extract per-class counts.
+    confusion:      ndarray =   confusion.astype(float64)
+    true_positive:  ndarray =   diag(confusion)
+    predicted:      ndarray =   confusion.sum(axis = 0)
+    actual:         ndarray =   confusion.sum(axis = 1)
+
+    # Only score classes present in the target.
+    present:        ndarray =   actual > 0
+
+    # Initialize class weights.
+    weights:        ndarray =   ones(len(confusion))
+
+    # For pet dataset - class 0 is the main class of interest (pet).
+    if dataset_name.lower() == "pets":  weights[0] =    3.0
+
+    # Skip background for other datasets.
+    else:                               present[0] =    False
+
+    # Calculate per-class scores.
+    scores:         dict =      {
+                                    "Dice Score":   (2. * true_positive + smooth) / (predicted + actual + smooth),
+                                    "Precision":    (true_positive + smooth) / (predicted + smooth),
+                                    "Recall":       (true_positive + smooth) / (actual + smooth)
+                                }
+
+    # Average weighted scores over present classes, recording a zero if there are none.
+    return {metric: float((values * weights)[present].mean()) if present.any() else 0.0 for metric, values in scores.items()}
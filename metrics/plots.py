@@ -0,0 +1,211 @@
+"""Benchmark result plots."""
+
+__all__ = ["plot_results", "plot_sweep"]
+
+from logging                        import Logger
+from os                             import makedirs
+
+from pandas                         import DataFrame
+
+from utilities                      import LOGGER, TIMESTAMP
+
+def plot_results(
+    results_df: DataFrame,
+    dataset_name:   str,
+    num_classes:    int,
+    save_path:  str =       "results"
+) -> None:
+    """Plot the benchmark results.
+    
+    ## Args:
+        * results_df    (DataFrame):    DataFrame containing benchmark results.
+    """
+    # Initialize logger.
+    _logger_:   Logger =        LOGGER.getChild("plot-results")
+    
+    # Load plotting library (only when plotting, as it is slow to import).
+    import matplotlib.pyplot        as plt
+    
+    from matplotlib.container       import BarContainer
+    from matplotlib.pyplot          import figure, subplot, text, tight_layout, savefig, title, xticks
+    
+    # Create a directory for plots.
+    makedirs(f"{save_path}/plots", exist_ok = True)
+    
+    # Initialize figure.
+    figure(figsize=(12, 8))
+    
+    # For each metric recorded...
+    for i, metric in enumerate(["Dice Score", "Precision", "Recall", "Hausdorff"]):
+        
+        # Set subplot location.
+        subplot(2, 2, i+1)
+        
+        # Initialize bar graph.
+        bars: BarContainer =    plt.bar(results_df["Model"], results_df[metric])
+        
+        # Set title.
+        title(f"{metric.replace('_', ' ').title()}")
+        
+        # Slant labels.
+        xticks(rotation = 45)
+        
+        # For each bar in graph...
+        for bar in bars:
+            
+            # Record height.
+            height: int =   bar.get_height()
+            
+            # Add values on top of bars.
+            text(bar.get_x() + bar.get_width()/2., height, f"{height:.3f}", ha = "center", va = "bottom")
+    
+    # Initialize new layout.
+    tight_layout()
+    
+    # Save figure.
+    savefig(f"{save_path}/{dataset_name}_segmentation_metrics_{TIMESTAMP}.png")
+    
+    # Initialize figure for computational costs.
+    figure(figsize = (10, 5))
+    
+    # Set subplot location.
+    subplot(2, 2, 1)
+    
+    # Initialize bar graph.
+    bars:   BarContainer =  plt.bar(results_df["Model"], results_df["Inference Time MS"])
+    
+    # Set title.
+    title("Inference Time (ms)")
+    
+    # Slant labels.
+    xticks(rotation = 45)
+    
+    # For each bar in graph...
+    for bar in bars:
+        
+        # Get height of bar.
+        height: int =   bar.get_height()
+        
+        # Add values on top of bars.
+        text(bar.get_x() + bar.get_width()/2., height, f"{height:.1f}", ha = "center", va = "bottom")
+    
+    # Set subplot location.
+    subplot(2, 2, 2)
+    
+    # Initialize bar graph.
+    bars:   BarContainer =  plt.bar(results_df["Model"], results_df["Peak Memory MB"])
+    
+    # Set title.
+    title("Peak Memory Usage (MB)")
+    
+    # Slant labels.
+    xticks(rotation = 45)
+    
+    # For each bar in graph.
+    for bar in bars:
+        
+        # Get height of bar.
+        height: int =   bar.get_height()
+        
+        # Add values on top of bars.
+        text(bar.get_x() + bar.get_width()/2., height, f"{height:.1f}", ha = "center", va = "bottom")
+    
+    # Set subplot location.
+    subplot(2, 2, 3)
+    
+    # Initialize bar graph.
+    bars:   BarContainer =  plt.bar(results_df["Model"], results_df["FLOPS"])
+    
+    # Set title.
+    title("Floating Point Operations Per Second")
+    
+    # Slant labels.
+    xticks(rotation = 45)
+    
+    # For each bar in graph...
+    for bar in bars:
+        
+        # Get height of bar.
+        height: int =   bar.get_height()
+        
+        # Add values on top of bars.
+        text(bar.get_x() + bar.get_width()/2., height, f"{height:.1f}", ha = "center", va = "bottom")
+    
+    # Set subplot location.
+    subplot(2, 2, 4)
+    
+    # Initialize bar graph.
+    bars:   BarContainer =  plt.bar(results_df["Model"], results_df["Parameters"])
+    
+    # Set title.
+    title("Parameters")
+    
+    # Slant labels.
+    xticks(rotation = 45)
+    
+    # For each bar in graph...
+    for bar in bars:
+        
+        # Get height of bar.
+        height: int =   bar.get_height()
+        
+        # Add values on top of bars.
+        text(bar.get_x() + bar.get_width()/2., height, f"{height:.1f}", ha = "center", va = "bottom")
+    
+    # Set new layout.
+    tight_layout()
+    
+    # Save figure.
+    savefig(f"{save_path}/{dataset_name}_computational_costs_{TIMESTAMP}.png")
+    
+    _logger_.info(f"Plots saved to {save_path}/plots/")
+
+def plot_sweep(
+    results_df: DataFrame,
+    save_path:  str =       "results"
+) -> None:
+    """Plot throughput saturation curves of a batch-size & resolution sweep.
+    
+    ## Args:
+        * results_df    (DataFrame):    DataFrame containing sweep results.
+    """
+    # Initialize logger.
+    _logger_:       Logger =    LOGGER.getChild("plot-sweep")
+    
+    # Load plotting library (only when plotting, as it is slow to import).
+    from matplotlib.pyplot          import figure, legend, plot, subplot, tight_layout, savefig, title, xlabel, xscale, ylabel
+    
+    # Record swept resolutions.
+    input_sizes:    list =      sorted(results_df["Input Size"].unique())
+    
+    # Initialize figure.
+    figure(figsize = (6 * len(input_sizes), 5))
+    
+    # For each resolution...
+    for i, input_size in enumerate(input_sizes):
+        
+        # Set subplot location.
+        subplot(1, len(input_sizes), i + 1)
+        
+        # For each model...
+        for model_name, group in results_df[results_df["Input Size"] == input_size].groupby("Model"):
+            
+            # Plot throughput over batch size.
+            plot(group["Batch Size"], group["Throughput IMG/S"], marker = "o", label = model_name)
+        
+        # Batch sizes are typically powers of two.
+        xscale("log", base = 2)
+        
+        # Set title & labels.
+        title(f"Throughput @ {input_size}x{input_size}")
+        xlabel("Batch Size")
+        ylabel("Images / Second")
+        legend()
+    
+    # Initialize new layout.
+    tight_layout()
+    
+    # Save figure.
+    savefig(f"{save_path}/sweep_throughput_{TIMESTAMP}.png")
+    
+    _logger_.info(f"Sweep plot saved to {save_path}/")
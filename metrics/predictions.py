@@ -0,0 +1,70 @@
+"""Post-processing of model outputs into predictions."""
+
+__all__ = ["predict_labels", "prediction_confidence"]
+
+from torch                          import maximum, Tensor, uint8, zeros
+
+def predict_labels(
+    logits: Tensor
+) -> Tensor:
+    """# Predict class labels from logits, as compact uint8 label maps.
+
+    Softmax is monotonic, so the argmax of logits is the argmax of probabilities: no probability
+    tensor (as large as the logits) is ever materialized. Classes are swept one channel at a time,
+    keeping a running maximum & label per pixel, so the only buffers allocated are the running
+    maximum and the uint8 labels themselves. On contiguous (NCHW) logits every operation reads a
+    contiguous plane; on channels-last logits each channel plane is strided, and it is read in place
+    rather than copied. Ties resolve to the lowest class, as with `argmax`.
+
+    Unlike `argmax` (which picks a NaN logit), a NaN logit never wins a comparison yet propagates
+    into the running maximum: the pixel keeps the best class preceding its first NaN logit (class 0
+    if that logit is the first).
+
+    ## Args:
+        * logits    (Tensor):   Model outputs, shaped [B, C, H, W], with C at most 255 (255 is the
+                                ignore index).
+
+    ## Returns:
+        * Tensor:   uint8 class labels, shaped [B, H, W], on the device of `logits`.
+    """
+    # Labels are uint8, short of the ignore index.
+    if logits.shape[1] > 255: raise ValueError(f"uint8 label maps support at most 255 classes, got {logits.shape[1]}")
+
+    # Start from first class.
+    peak:   Tensor =    logits[:, 0].clone()
+    labels: Tensor =    zeros(peak.shape, dtype = uint8, device = logits.device)
+
+    # For each other class...
+    for cls in range(1, logits.shape[1]):
+
+        # Relabel pixels on which class beats running maximum, then raise maximum.
+        labels.masked_fill_(logits[:, cls] > peak, cls)
+        maximum(peak, logits[:, cls], out = peak)
+
+    # Return label maps.
+    return labels
+
+def prediction_confidence(
+    logits:         Tensor,
+    chunk_classes:  int =   8
+) -> Tensor:
+    """# Probability of the predicted class of each pixel (maximum softmax probability).
+
+    Only needed by confidence-based metrics. The softmax denominator is accumulated a chunk of
+    classes at a time, so that no temporary as large as the logits is allocated.
+
+    ## Args:
+        * logits        (Tensor):           Model outputs, shaped [B, C, H, W].
+        * chunk_classes (int, optional):    Classes exponentiated at once. Defaults to 8.
+
+    ## Returns:
+        * Tensor:   float32 confidence of each pixel, shaped [B, H, W].
+    """
+    # Find largest logit of each pixel (the predicted class), for numerical stability.
+    peak:       Tensor =    logits.amax(dim = 1, keepdim = True).float()
+
+    # Accumulate softmax denominator over chunks of classes.
+    total:      Tensor =    sum((logits[:, start:start + chunk_classes].float() - peak).exp_().sum(dim = 1) for start in range(0, logits.shape[1], chunk_classes))
+
+    # Probability of predicted class is exp(0) over the denominator.
+    return total.reciprocal_()
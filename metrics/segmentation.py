@@ -0,0 +1,51 @@
+"""Segmentation metrics."""
+
+__all__ = ["calculate_metrics"]
+
+from torch                          import Tensor
+
+from metrics.accumulators           import MetricAccumulator
+
+def calculate_metrics(
+    prediction:             Tensor,
+    target:                 Tensor,
+    dataset_name:           str,
+    num_classes:            int,
+    smooth:                 float = 1e-6,
+    hausdorff_backend:      str =   "edt",
+    hausdorff_percentile:   float = 100.0,
+    hausdorff_stride:       int =   1
+) -> dict:
+    """# Calculate segmentation metrics.
+
+    ## Args:
+        * prediction            (Tensor):           Model prediction(s).
+        * target                (Tensor):           Ground truth(s) to model prediction(s).
+        * dataset_name          (str):              Dataset being evaluated.
+        * num_classes           (int):              Number of classes in dataset.
+        * smooth                (float, optional):  Smoothing factor.
+        * hausdorff_backend     (str, optional):    One of "edt", "medpy", or "none" (disabled).
+                                                    Defaults to "edt".
+        * hausdorff_percentile  (float, optional):  Percentile of surface distances reported (i.e.,
+                                                    95 for HD95). Defaults to 100.
+        * hausdorff_stride      (int, optional):    Boundary subsampling cell size. Defaults to 1
+                                                    (exact).
+
+    ## Returns:
+        * dict: Dice coefficient, precision, recall, and Haussdorf distance.
+    """
+    # Initialize accumulator.
+    accumulator:    MetricAccumulator = MetricAccumulator(
+                                            dataset_name =          dataset_name,
+                                            num_classes =           num_classes,
+                                            smooth =                smooth,
+                                            hausdorff_backend =     hausdorff_backend,
+                                            hausdorff_percentile =  hausdorff_percentile,
+                                            hausdorff_stride =      hausdorff_stride
+                                        )
+
+    # Fold batch into accumulator.
+    accumulator.update(prediction = prediction, target = target)
+
+    # Return batch metrics.
+    return accumulator.compute()
\ No newline at end of file
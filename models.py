@@ -1,103 +1,269 @@
 """Models module."""
 
+from hashlib                        import sha1
 from logging                        import Logger
+from os                             import makedirs, stat, stat_result
+from os.path                        import exists
 
+from torch                          import device as Device, load, save, Tensor
 from torch.nn                       import BatchNorm2d, Conv2d, GroupNorm, Module
 from segmentation_models_pytorch    import DeepLabV3Plus, FPN, Segformer, Unet
 from torch.nn.init                  import constant_, kaiming_normal_
 
 from utilities                      import LOGGER
 
+# Encoder shared by all models.
+ENCODER:    str =   "mobilenet_v2"
+
 def load_model(
     model_name:     str,
     num_classes:    int =   3,
     device:         str =   "cuda",
+    weights:        str =   "random",
+    weights_cache:  str =   "models/cache",
     **kwargs
 ) -> Module:
     """# Get a segmentation model by name.
-    
+
+    Models are constructed without downloading anything, so that they can be built on air-gapped
+    nodes. Pretrained encoder weights & fine-tuned checkpoints are read from a local cache,
+    memory-mapped rather than copied into memory.
+
     ## Args:
-        * model_name    (str):  Model selection.
+        * model_name    (str):              Model selection.
+        * num_classes   (int, optional):    Number of output classes. Defaults to 3.
+        * device        (str, optional):    Device on which model is placed. Defaults to "cuda".
+        * weights       (str, optional):    One of "random" (Kaiming initialization), "imagenet"
+                                            (ImageNet encoder, randomly initialized decoder & head),
+                                            or "checkpoint" (whole model, from
+                                            "{weights_cache}/{model_name}_{num_classes}.pt").
+                                            Defaults to "random".
+        * weights_cache (str, optional):    Directory in which weights are cached. Defaults to
+                                            "models/cache".
+
+    ## Returns:
+        * Module:   Model, placed on device.
     """
     # Initialize logger.
     _logger_:   Logger =    LOGGER.getChild("model-loader")
-    
+
     # Match model selection.
     match model_name:
-        
+
         # DeepLab-V3+
         case "deeplab-v3":
-            
+
             # Log action.
             _logger_.info("Loading DeepLab-V3+ model.")
-            
-            # Initialize model.
-            model:  DeepLabV3Plus = DeepLabV3Plus(
-                                        encoder_name =      "mobilenet_v2",
-                                        encoder_weights =   "imagenet",
-                                        in_channels =       3,
-                                        classes =           num_classes,
-                                        activation =        None
-                                    )
-        
+
+            # Define architecture.
+            architecture:   type =  DeepLabV3Plus
+
         # FPN
         case "fpn":
-            
+
             # Log action.
             _logger_.info("Loading FPN model.")
-            
-            # Initialize model.
-            model:  FPN =           FPN(
-                                        encoder_name =      "mobilenet_v2",
-                                        encoder_weights =   "imagenet",
-                                        in_channels =       3,
-                                        classes =           num_classes,
-                                        activation =        None
-                                    )
-        
+
+            # Define architecture.
+            architecture:   type =  FPN
+
         # Seg-Former
         case "seg-former":
-            
+
             # Log action.
             _logger_.info("Loading Seg-Former model.")
-            
-            # Initialize model.
-            model:  Segformer =     Segformer(
-                                        encoder_name =      "mobilenet_v2",
-                                        encoder_weights =   "imagenet",
-                                        in_channels =       3,
-                                        classes =           num_classes,
-                                        activation =        None
-                                    )
-        
+
+            # Define architecture.
+            architecture:   type =  Segformer
+
         # U-Net
         case "u-net":
-            
+
             # Log action.
             _logger_.info("Loading U-Net model.")
-            
-            # Initialize model.
-            model:  Unet =          Unet(
-                                        encoder_name =      "mobilenet_v2",
-                                        encoder_weights =   "imagenet",
-                                        in_channels =       3,
-                                        classes =           num_classes,
-                                        activation =        None
-                                    )
-        
+
+            # Define architecture.
+            architecture:   type =  Unet
+
         # Invalid selection.
         case _: raise ValueError(f"Invalid model selection: {model_name}")
-    
-    # For each module within model...
-    for m in model.modules():
-        
+
+    # Match weights selection.
+    match weights:
+
+        # Random weights.
+        case "random":
+
+            # Initialize model, without pretrained weights (they would be overwritten).
+            model:  Module =    _construct_(architecture = architecture, num_classes = num_classes)
+
+            # Initialize all layers.
+            _initialize_(model)
+
+        # ImageNet encoder.
+        case "imagenet":
+
+            # Initialize model.
+            model:  Module =    _construct_(architecture = architecture, num_classes = num_classes)
+
+            # Initialize decoder & head.
+            _initialize_(*[child for name, child in model.named_children() if name != "encoder"])
+
+            # Restore pretrained encoder.
+            model.encoder.load_state_dict(_imagenet_encoder_(weights_cache = weights_cache))
+
+        # Fine-tuned checkpoint.
+        case "checkpoint":
+
+            # Define checkpoint path.
+            path:   str =       _weights_path_(model_name = model_name, num_classes = num_classes, weights = weights, weights_cache = weights_cache)
+
+            # Verify that checkpoint exists.
+            if not exists(path): raise FileNotFoundError(f"No checkpoint of {model_name} ({num_classes} classes) found at {path}")
+
+            # Initialize model structure, without allocating or initializing weights.
+            with Device("meta"): model = _construct_(architecture = architecture, num_classes = num_classes)
+
+            # Assign memory-mapped weights in place of placeholders.
+            model.load_state_dict(load(path, map_location = "cpu", mmap = True, weights_only = True), assign = True)
+
+        # Invalid selection.
+        case _: raise ValueError(f"Invalid weights selection: {weights}")
+
+    # Return initialized model, placed on device.
+    return model.to(device)
+
+def weights_version(
+    model_name:     str,
+    num_classes:    int =   3,
+    weights:        str =   "random",
+    weights_cache:  str =   "models/cache"
+) -> str:
+    """# Identify the cached weights file a model is loaded from, so that artifacts & results derived
+    from a file are not reused once it is replaced.
+
+    ## Args:
+        * model_name    (str):              Model selection.
+        * num_classes   (int, optional):    Number of output classes. Defaults to 3.
+        * weights       (str, optional):    Weights selection (see `load_model`). Defaults to
+                                            "random".
+        * weights_cache (str, optional):    Directory in which weights are cached. Defaults to
+                                            "models/cache".
+
+    ## Returns:
+        * str:  Digest of the file's size & modification time (empty for random weights, which
+                are not read from a file, or if the file is not cached yet).
+    """
+    # Define weights path.
+    path:   str =   _weights_path_(model_name = model_name, num_classes = num_classes, weights = weights, weights_cache = weights_cache)
+
+    # Random weights (and files not fetched yet) have no version.
+    if path is None or not exists(path): return ""
+
+    # Digest file's size & modification time (cheaper than hashing its contents).
+    status: stat_result =   stat(path)
+    return sha1(f"{status.st_size}:{status.st_mtime_ns}".encode()).hexdigest()[:12]
+
+def _construct_(
+    architecture:   type,
+    num_classes:    int
+) -> Module:
+    """# Construct a model around the shared encoder, without pretrained weights.
+
+    ## Args:
+        * architecture  (type): Model class.
+        * num_classes   (int):  Number of output classes.
+
+    ## Returns:
+        * Module:   Model.
+    """
+    return  architecture(
+                encoder_name =      ENCODER,
+                encoder_weights =   None,
+                in_channels =       3,
+                classes =           num_classes,
+                activation =        None
+            )
+
+def _imagenet_encoder_(
+    weights_cache:  str
+) -> dict[str, Tensor]:
+    """# Read ImageNet weights of the shared encoder from cache, fetching them on first use.
+
+    ## Args:
+        * weights_cache (str):  Directory in which weights are cached.
+
+    ## Returns:
+        * dict[str, Tensor]:    Memory-mapped encoder state.
+    """
+    # Define cache path.
+    path:   str =   _weights_path_(model_name = None, num_classes = None, weights = "imagenet", weights_cache = weights_cache)
+
+    # If weights are not cached...
+    if not exists(path):
+
+        # Log action.
+        LOGGER.getChild("model-loader").info(f"Fetching ImageNet weights of {ENCODER} into {path} (requires network access; copy this file to air-gapped nodes).")
+
+        # Fetch weights.
+        from segmentation_models_pytorch.encoders import get_encoder
+
+        # Cache encoder state.
+        makedirs(name = weights_cache, exist_ok = True)
+        save(get_encoder(ENCODER, in_channels = 3, weights = "imagenet").state_dict(), path)
+
+    # Map cached weights.
+    return load(path, map_location = "cpu", mmap = True, weights_only = True)
+
+def _weights_path_(
+    model_name:     str,
+    num_classes:    int,
+    weights:        str,
+    weights_cache:  str
+) -> str | None:
+    """# Locate the cached weights file of a weights selection.
+
+    ## Args:
+        * model_name    (str):  Model selection.
+        * num_classes   (int):  Number of output classes.
+        * weights       (str):  Weights selection (see `load_model`).
+        * weights_cache (str):  Directory in which weights are cached.
+
+    ## Returns:
+        * str | None:   Path of file (the shared encoder's ImageNet weights, or the model's
+                        fine-tuned checkpoint), or None for random weights.
+    """
+    # Match weights selection.
+    match weights:
+
+        # Random weights are not read from a file.
+        case "random":      return None
+
+        # ImageNet weights of the shared encoder.
+        case "imagenet":    return f"{weights_cache}/{ENCODER}_imagenet.pt"
+
+        # Fine-tuned checkpoint of model.
+        case "checkpoint":  return f"{weights_cache}/{model_name}_{num_classes}.pt"
+
+        # Invalid selection.
+        case _:             raise ValueError(f"Invalid weights selection: {weights}")
+
+def _initialize_(
+    *modules:   Module
+) -> None:
+    """# Initialize convolutional & normalization layers of modules, in place.
+
+    ## Args:
+        * modules   (Module):   Modules being initialized.
+    """
+    # For each layer within modules...
+    for m in [m for module in modules for m in module.modules()]:
+
         # Initialize convoling layer weights.
         if isinstance(m, Conv2d):  kaiming_normal_(m.weight, mode = "fan_out", nonlinearity = "relu")
-        
+
         # Initialize normalization layers.
         elif isinstance(m, (BatchNorm2d, GroupNorm)):
             constant_(m.weight, 1)
             constant_(m.bias, 0)
-            
-    # Return initialized model, placed on device.
-    return model.to(device)
\ No newline at end of file
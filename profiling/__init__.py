@@ -0,0 +1,8 @@
+"""Profiling package."""
+
+__all__ = ["LatencyRecorder", "MemoryMonitor", "profile_cost", "profile_stages"]
+
+from profiling.cost     import profile_cost
+from profiling.latency  import LatencyRecorder
+from profiling.memory   import MemoryMonitor
+from profiling.stages   import profile_stages
@@ -0,0 +1,87 @@
+"""Computational cost analysis."""
+
+__all__ = ["profile_cost"]
+
+from copy                           import deepcopy
+from hashlib                        import sha1
+from json                           import dump, dumps, load
+from os                             import makedirs, replace
+from os.path                        import exists
+
+from torch                          import zeros
+from torch.nn                       import Module
+
+def profile_cost(
+    model:          Module,
+    num_classes:    int,
+    input_size:     tuple[int] =    (512, 512),
+    batch_size:     int =           1,
+    cache_path:     str =           "results/cache/costs"
+) -> dict:
+    """# Count operations & parameters of a model, in total and per top-level module.
+
+    An isolated copy of the model is profiled on the CPU, at batch size 1, so that the model being
+    timed is never run or modified by the profiler (which attaches counters to every module).
+    Operation counts scale linearly with batch size. Counts are cached on disk per architecture,
+    encoder, number of classes, and input size, so repeated runs do not profile again.
+
+    ## Args:
+        * model         (Module):               Model being profiled.
+        * num_classes   (int):                  Number of output classes.
+        * input_size    (tuple[int], optional): Input size. Defaults to (512, 512).
+        * batch_size    (int, optional):        Batch size to which operation counts are scaled.
+                                                Defaults to 1.
+        * cache_path    (str, optional):        Directory in which counts are cached. Defaults to
+                                                "results/cache/costs".
+
+    ## Returns:
+        * dict: Multiply-accumulate operations ("FLOPS") and parameters of the model, followed by
+                those of each of its top-level modules (i.e., encoder, decoder, and head).
+    """
+    # Key counts by architecture, encoder, classes, and input size.
+    key:    str =   sha1(dumps({
+                        "architecture": type(model).__name__,
+                        "encoder":      getattr(model, "name", None),
+                        "classes":      num_classes,
+                        "input_size":   list(input_size)
+                    }).encode()).hexdigest()
+
+    # If counts are not cached...
+    if not exists(f"{cache_path}/{key}.json"):
+
+        # Load profiler (only on cache misses, as it is slow to import).
+        from thop                   import profile
+
+        # Profile an isolated copy, at batch size 1.
+        flops, parameters, layers = profile(
+                                        model =             deepcopy(model).cpu().eval(),
+                                        inputs =            (zeros(1, 3, *input_size),),
+                                        verbose =           False,
+                                        ret_layer_info =    True
+                                    )
+
+        # Ensure cache path exists.
+        makedirs(name = cache_path, exist_ok = True)
+
+        # Cache counts (written aside, then swapped into place).
+        with open(f"{cache_path}/{key}.json.tmp", "w") as file:
+            dump({
+                "flops":        flops,
+                "parameters":   parameters,
+                "modules":      {name: [info[0], info[1]] for name, info in layers.items()}
+            }, file)
+        replace(f"{cache_path}/{key}.json.tmp", f"{cache_path}/{key}.json")
+
+    # Read counts.
+    with open(f"{cache_path}/{key}.json") as file: counts = load(file)
+
+    # Report totals, scaling operations to batch size.
+    return  {
+                "FLOPS":        counts["flops"] * batch_size,
+                "Parameters":   counts["parameters"],
+                **{
+                    f"{name.replace('_', ' ').title()} {column}": value
+                    for name, (flops, parameters) in counts["modules"].items()
+                    for column, value in (("FLOPS", flops * batch_size), ("Parameters", parameters))
+                }
+            }
@@ -0,0 +1,134 @@
+"""Latency measurement."""
+
+__all__ = ["LatencyRecorder"]
+
+from contextlib                     import contextmanager
+from time                           import perf_counter_ns
+from typing                         import Callable, Iterator
+
+from numpy                          import array, ndarray, percentile
+from torch                          import device as Device
+from torch.cuda                     import synchronize as cuda_synchronize
+from torch.mps                      import synchronize as mps_synchronize
+
+class LatencyRecorder():
+    """# Per-batch latency recorder.
+
+    Every measured batch is bracketed by device synchronization and timed with `perf_counter_ns`,
+    so queued asynchronous kernels are attributed to the batch that launched them. Each sample is
+    kept, allowing tail latencies to be reported rather than a single mean.
+    """
+
+    def __init__(self,
+        device: str =   "cuda"
+    ):
+        """# Initialize latency recorder.
+
+        ## Args:
+            * device    (str, optional):    Device on which measured work executes. Defaults to
+                                            "cuda".
+        """
+        # Define device.
+        self.device:        Device =    Device(device)
+
+        # Initialize samples.
+        self.samples_ns:    list =      []
+        self.images:        int =       0
+
+    def synchronize(self) -> None:
+        """# Wait for all work queued on the device to complete."""
+        # Match device type.
+        match self.device.type:
+
+            # CUDA kernels execute asynchronously.
+            case "cuda":    cuda_synchronize(self.device)
+
+            # As do Metal kernels.
+            case "mps":     mps_synchronize()
+
+            # CPU operations are synchronous.
+            case _:         pass
+
+    def warmup(self,
+        forward:    Callable[[], object],
+        iterations: int =   10
+    ) -> None:
+        """# Execute untimed iterations so that lazy initialization, allocator growth, and kernel
+        selection do not skew measurements.
+
+        ## Args:
+            * forward       (Callable): Work being warmed up.
+            * iterations    (int):      Number of warm-up iterations. Defaults to 10.
+        """
+        # Execute warm-up iterations.
+        for _ in range(iterations): forward()
+
+        # Wait for warm-up to complete.
+        self.synchronize()
+
+    @contextmanager
+    def measure(self,
+        batch_size: int
+    ) -> Iterator[None]:
+        """# Time the enclosed block as one batch.
+
+        ## Args:
+            * batch_size    (int):  Number of images in batch.
+        """
+        # Ensure previously queued work is not attributed to this batch.
+        self.synchronize()
+
+        # Record starting time.
+        start:  int =   perf_counter_ns()
+
+        # Execute measured block.
+        yield
+
+        # Wait for measured work to complete.
+        self.synchronize()
+
+        # Record sample.
+        self.samples_ns.append(perf_counter_ns() - start)
+        self.images +=  batch_size
+
+    def state_dict(self) -> dict:
+        """# Export recorded samples (i.e., for checkpointing).
+
+        ## Returns:
+            * dict: Batch latency samples and number of images measured.
+        """
+        return {"samples_ns": list(self.samples_ns), "images": self.images}
+
+    def load_state_dict(self,
+        state:  dict
+    ) -> None:
+        """# Restore samples exported by `state_dict`.
+
+        ## Args:
+            * state (dict): Recorded samples.
+        """
+        self.samples_ns:    list =  list(state["samples_ns"])
+        self.images:        int =   state["images"]
+
+    def summary(self) -> dict:
+        """# Summarize recorded samples.
+
+        ## Returns:
+            * dict: Mean, percentile, and standard deviation of batch latency (in milliseconds),
+                    as well as throughput (in images per second).
+        """
+        # Convert samples to milliseconds.
+        samples:    ndarray =   array(self.samples_ns, dtype = float) / 1e6
+
+        # If nothing was measured, report zeros.
+        if not len(samples): samples = array([0.0])
+
+        # Summarize samples.
+        return  {
+                    "Inference Time MS":    float(samples.mean()),
+                    "Latency P50 MS":       float(percentile(samples, 50)),
+                    "Latency P90 MS":       float(percentile(samples, 90)),
+                    "Latency P99 MS":       float(percentile(samples, 99)),
+                    "Latency STD MS":       float(samples.std()),
+                    "Throughput IMG/S":     float(self.images / (samples.sum() / 1e3)) if samples.sum() else 0.0
+                }
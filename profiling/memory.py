@@ -0,0 +1,287 @@
+"""Memory measurement."""
+
+__all__ = ["MemoryMonitor"]
+
+from contextlib                     import contextmanager
+from ctypes                         import CDLL
+from threading                      import Event, Lock, Thread
+from typing                         import Iterable, Iterator
+
+import tracemalloc
+
+from psutil                         import NoSuchProcess, Process
+from torch                          import device as Device
+from torch.cuda                     import max_memory_allocated, memory_allocated, reset_peak_memory_stats
+
+# Bytes per megabyte.
+MB:     int =   1024 * 1024
+
+class MemoryMonitor():
+    """# Per-model memory monitor.
+
+    While started, a background thread samples the resident set size (RSS) of the process, and
+    that of its child processes (i.e., DataLoader & metric workers), so that peaks are measured
+    over the monitored window alone rather than over the lifetime of the process. CUDA allocator
+    peaks are reset when the window (and each phase) begins.
+
+    Work can be attributed to phases (i.e., "setup", "data", "inference", "metrics"). The memory a
+    phase needs is its growth above the level at which it was entered: on CUDA, the allocator's
+    peak; on CPU, the sampled RSS (an approximation, as freed memory is reused by later phases
+    rather than returned to the system, and short peaks may fall between samples).
+
+    Sampling is suspended while timed blocks execute (see `paused`), so that it does not perturb
+    latency measurements; peaks of timed work are measured on its untimed warm-up instead.
+    """
+
+    def __init__(self,
+        device:         str =   "cuda",
+        interval:       float = 0.01,
+        worker_every:   int =   10,
+        trace_python:   bool =  False
+    ):
+        """# Initialize memory monitor.
+
+        ## Args:
+            * device        (str, optional):    Device on which monitored work executes. Defaults
+                                                to "cuda".
+            * interval      (float, optional):  Seconds between RSS samples. Defaults to 0.01.
+            * worker_every  (int, optional):    Sample child processes every this many samples
+                                                (enumerating them is slower). Defaults to 10.
+            * trace_python  (bool, optional):   Also trace peak Python heap allocations with
+                                                `tracemalloc` (which slows Python code down
+                                                considerably). Defaults to False.
+        """
+        # Define configuration.
+        self.device:        Device =    Device(device)
+        self.interval:      float =     interval
+        self.worker_every:  int =       worker_every
+        self.trace_python:  bool =      trace_python
+
+        # Define monitored process.
+        self.process:       Process =   Process()
+
+        # Initialize sampling state.
+        self._lock_:        Lock =      Lock()
+        self._stop_:        Event =     Event()
+        self._resume_:      Event =     Event()
+        self._thread_:      Thread =    None
+        self._phase_:       str =       None
+        self._entry_:       int =       0
+        self._tracing_:     bool =      False
+
+    @property
+    def is_cuda(self) -> bool:
+        """# Whether monitored work executes on a CUDA device."""
+        return self.device.type == "cuda"
+
+    def start(self) -> None:
+        """# Begin monitored window, resetting peaks."""
+        # Reset device allocator peak.
+        if self.is_cuda: reset_peak_memory_stats(self.device)
+
+        # Record baselines.
+        self.baseline_rss:      int =   self._rss_()
+        self.baseline_device:   int =   memory_allocated(self.device) if self.is_cuda else 0
+
+        # Initialize peaks.
+        self.peak_rss:          int =   self.baseline_rss
+        self.peak_device:       int =   self.baseline_device
+        self.peak_workers:      int =   0
+        self.growth:            dict =  {}
+
+        # Trace Python allocations, if requested.
+        if self.trace_python:
+            self._tracing_:     bool =  not tracemalloc.is_tracing()
+            if self._tracing_: tracemalloc.start()
+            tracemalloc.reset_peak()
+
+        # Start sampling.
+        self._stop_.clear()
+        self._resume_.set()
+        self._thread_:          Thread =    Thread(target = self._sample_loop_, daemon = True)
+        self._thread_.start()
+
+    def stop(self) -> dict:
+        """# End monitored window.
+
+        ## Returns:
+            * dict: Peak memory above baseline (device allocator on CUDA, RSS otherwise), peak RSS
+                    of the process, peak RSS of its workers, growth of each phase, and peak Python
+                    heap (if traced), in megabytes.
+        """
+        # Stop sampling (waking sampler if paused).
+        self._stop_.set()
+        self._resume_.set()
+        self._thread_.join()
+        self._sample_(workers = True)
+
+        # Fold in device allocator peak.
+        if self.is_cuda: self.peak_device = max(self.peak_device, max_memory_allocated(self.device))
+
+        # Summarize window.
+        summary:    dict =  {
+                                "Peak Memory MB":   ((self.peak_device - self.baseline_device) if self.is_cuda else (self.peak_rss - self.baseline_rss)) / MB,
+                                "Peak RSS MB":      self.peak_rss / MB,
+                                "Worker RSS MB":    self.peak_workers / MB,
+                                **{f"{phase.title()} Memory MB": growth / MB for phase, growth in self.growth.items()}
+                            }
+
+        # Report peak Python heap, if traced.
+        if self.trace_python:
+            summary["Python Peak MB"] = tracemalloc.get_traced_memory()[1] / MB
+            if self._tracing_: tracemalloc.stop()
+
+        # Return summary.
+        return summary
+
+    @contextmanager
+    def phase(self,
+        name:       str,
+        release:    bool =  False
+    ) -> Iterator[None]:
+        """# Attribute the enclosed block to a phase.
+
+        ## Args:
+            * name      (str):              Phase name.
+            * release   (bool, optional):   On CPU, first return freed heap memory to the system,
+                                            so that the block's RSS growth is not hidden by reuse
+                                            of memory freed by earlier blocks (which perturbs
+                                            timing, so only use it for blocks that are not timed).
+                                            Defaults to False.
+        """
+        # Release freed heap memory, if requested.
+        if release and not self.is_cuda: _trim_heap_()
+
+        # If on CUDA...
+        if self.is_cuda:
+
+            # Fold in allocator peak so far, then reset it for this phase.
+            self.peak_device:   int =   max(self.peak_device, max_memory_allocated(self.device))
+            reset_peak_memory_stats(self.device)
+
+            # Record level on entry.
+            entry:              int =   memory_allocated(self.device)
+
+        # Enter phase, recording RSS on entry.
+        with self._lock_: self._phase_, self._entry_ = name, self._rss_()
+        self.growth.setdefault(name, 0)
+
+        # Execute block.
+        try:        yield
+
+        # Exit phase.
+        finally:
+
+            # Sample RSS on exit, so that short phases are sampled at least once.
+            self._sample_()
+            with self._lock_: self._phase_ = None
+
+            # Record allocator growth on CUDA.
+            if self.is_cuda: self.growth[name] = max(self.growth[name], max_memory_allocated(self.device) - entry)
+
+    @contextmanager
+    def paused(self) -> Iterator[None]:
+        """# Suspend background sampling while the enclosed (timed) block executes.
+
+        The sampler thread blocks until the block exits, rather than waking up every interval, so
+        that it neither competes for the GIL nor preempts the measured work. CUDA allocator peaks
+        are still tracked, and RSS is still sampled when the enclosing phase exits.
+        """
+        # Suspend sampling.
+        self._resume_.clear()
+
+        # Execute block.
+        try:        yield
+
+        # Resume sampling.
+        finally:    self._resume_.set()
+
+    def iterate(self,
+        iterable:   Iterable,
+        name:       str =   "data"
+    ) -> Iterator:
+        """# Iterate, attributing the fetching of each item to a phase.
+
+        ## Args:
+            * iterable  (Iterable):         Iterable being consumed (i.e., a data loader).
+            * name      (str, optional):    Phase name. Defaults to "data".
+
+        ## Yields:
+            * object:   Next item.
+        """
+        # Initialize iterator.
+        iterator:   Iterator =  iter(iterable)
+
+        # Until exhausted...
+        while True:
+
+            # Fetch next item within phase.
+            with self.phase(name):
+                try:                    item = next(iterator)
+                except StopIteration:   return
+
+            # Hand item over.
+            yield item
+
+    def _rss_(self) -> int:
+        """# Current RSS of the process, in bytes."""
+        return self.process.memory_info().rss
+
+    def _workers_rss_(self) -> int:
+        """# Current total RSS of child processes, in bytes."""
+        # Initialize total.
+        total:  int =   0
+
+        # For each child process...
+        for child in self.process.children(recursive = True):
+
+            # Add its RSS, unless it has exited since enumeration.
+            try:                    total += child.memory_info().rss
+            except NoSuchProcess:   pass
+
+        # Return total.
+        return total
+
+    def _sample_(self,
+        workers:    bool =  False
+    ) -> None:
+        """# Take one sample.
+
+        ## Args:
+            * workers   (bool, optional):   Also sample child processes. Defaults to False.
+        """
+        # Sample RSS.
+        rss:    int =   self._rss_()
+
+        # Update peaks.
+        with self._lock_:
+
+            # Update process peak.
+            self.peak_rss:  int =   max(self.peak_rss, rss)
+
+            # Update CPU growth of current phase.
+            if self._phase_ is not None and not self.is_cuda: self.growth[self._phase_] = max(self.growth.get(self._phase_, 0), rss - self._entry_)
+
+        # Update worker peak, if requested.
+        if workers: self.peak_workers = max(self.peak_workers, self._workers_rss_())
+
+    def _sample_loop_(self) -> None:
+        """# Sample periodically until stopped (background thread)."""
+        # Initialize count.
+        count:  int =   0
+
+        # Until stopped...
+        while not self._stop_.wait(self.interval):
+
+            # Sleep through paused blocks.
+            self._resume_.wait()
+            if self._stop_.is_set(): return
+
+            # Take sample, including workers periodically.
+            self._sample_(workers = count % self.worker_every == 0)
+            count += 1
+
+def _trim_heap_() -> None:
+    """# Return freed heap memory to the system (glibc only; elsewhere, a no-op)."""
+    try:                                CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):   pass
@@ -0,0 +1,166 @@
+"""Per-stage latency profiling."""
+
+__all__ = ["profile_stages"]
+
+from functools                      import partial
+from typing                         import Callable
+
+from pandas                         import DataFrame
+from torch                          import device as Device
+from torch.autograd.profiler        import record_function
+from torch.nn                       import Module
+from torch.profiler                 import profile, ProfilerActivity
+from torch.utils.hooks              import RemovableHandle
+
+# Prefix of profiler ranges opened around modules.
+PREFIX: str =   "module::"
+
+def profile_stages(
+    model:      Module,
+    forward:    Callable[[], object],
+    device:     str =   "cuda",
+    iterations: int =   10,
+    depth:      int =   3,
+    top:        int =   20,
+    trace_path: str =   None
+) -> DataFrame:
+    """# Profile time & memory spent in each stage (sub-module) of a model.
+
+    Forward hooks open a profiler range around every sub-module up to `depth` levels deep (i.e.,
+    the encoder, the decoder & its blocks, such as DeepLabV3+'s ASPP or FPN's pyramid, and the
+    head), so that operators are attributed to the stage that launched them. Self time & memory of
+    a stage exclude those of its nested stages.
+
+    ## Args:
+        * model         (Module):               Model being profiled.
+        * forward       (Callable):             Forward pass being profiled.
+        * device        (str, optional):        Device on which model is executed. Defaults to
+                                                "cuda".
+        * iterations    (int, optional):        Number of profiled forward passes. Defaults to
+                                                10.
+        * depth         (int, optional):        Depth of deepest sub-modules profiled. Defaults to
+                                                3.
+        * top           (int, optional):        Number of stages reported. Defaults to 20.
+        * trace_path    (str, optional):        Path at which Chrome trace is exported. Defaults
+                                                to None (not exported).
+
+    ## Returns:
+        * DataFrame:    Top stages by self time, with calls, total & self time (in milliseconds),
+                        and memory allocated by their own operators (in megabytes), per iteration.
+    """
+    # Initialize open ranges and hook handles.
+    ranges:     list =                      []
+    handles:    list[RemovableHandle] =     []
+
+    # For each sub-module within depth...
+    for name, module in model.named_modules():
+
+        # Skip model itself & deeper sub-modules.
+        if not name or name.count(".") >= depth: continue
+
+        # Open range before, and close it after, sub-module's forward pass.
+        handles.append(module.register_forward_pre_hook(partial(_open_, ranges = ranges, name = name)))
+        handles.append(module.register_forward_hook(partial(_close_, ranges = ranges)))
+
+    # Profile device activity along with CPU activity.
+    activities: list =                      [ProfilerActivity.CPU] + ([ProfilerActivity.CUDA] if Device(device).type == "cuda" else [])
+
+    # Profile forward passes.
+    try:
+        with profile(activities = activities, profile_memory = True) as profiler:
+            for _ in range(iterations): forward()
+
+    # Detach hooks.
+    finally:
+        for handle in handles: handle.remove()
+
+    # Export Chrome trace, if requested.
+    if trace_path is not None: profiler.export_chrome_trace(trace_path)
+
+    # Initialize per-stage aggregates.
+    stages:     dict =                      {}
+
+    # For each stage range...
+    for event in [event for event in profiler.events() if event.name.startswith(PREFIX)]:
+
+        # Aggregate over range's operators.
+        total, own =                        _aggregate_(event)
+
+        # Accumulate per stage.
+        stage:  dict =                      stages.setdefault(event.name[len(PREFIX):], {"Calls": 0, "Total CPU MS": 0.0, "Self CPU MS": 0.0, "Total Device MS": 0.0, "Self Device MS": 0.0, "Self Memory MB": 0.0})
+        stage["Calls"] +=                   1
+        stage["Total CPU MS"] +=            total[0] / 1e3
+        stage["Self CPU MS"] +=             own[0] / 1e3
+        stage["Total Device MS"] +=         total[1] / 1e3
+        stage["Self Device MS"] +=          own[1] / 1e3
+        stage["Self Memory MB"] +=          own[2] / (1024 * 1024)
+
+    # Tabulate stages, per iteration.
+    table:      DataFrame =                 DataFrame([{"Module": name, **stage} for name, stage in stages.items()], columns = ["Module", "Calls", "Total CPU MS", "Self CPU MS", "Total Device MS", "Self Device MS", "Self Memory MB"])
+    table[table.columns[1:]] /=             iterations
+
+    # Return top stages by self time (on device, if profiled).
+    return table.sort_values("Self Device MS" if ProfilerActivity.CUDA in activities else "Self CPU MS", ascending = False).head(top).reset_index(drop = True)
+
+def _aggregate_(
+    event:  object
+) -> tuple[tuple[float, float, float], tuple[float, float, float]]:
+    """# Sum CPU time, device time, and allocated memory over an event's sub-tree.
+
+    ## Args:
+        * event (FunctionEvent):    Profiler event.
+
+    ## Returns:
+        * tuple:    Sums over whole sub-tree, and over the part of it outside of nested stages.
+    """
+    # Start from event's own time & memory.
+    own:    list =  [event.self_cpu_time_total, event.self_device_time_total, max(event.self_cpu_memory_usage, 0) + max(event.self_device_memory_usage, 0)]
+    total:  list =  list(own)
+
+    # For each child event...
+    for child in event.cpu_children:
+
+        # Aggregate child's sub-tree.
+        child_total, child_own =    _aggregate_(child)
+
+        # Nested stages only count towards total.
+        total:  list =              [a + b for a, b in zip(total, child_total)]
+        if not child.name.startswith(PREFIX): own = [a + b for a, b in zip(own, child_own)]
+
+    # Return sums.
+    return tuple(total), tuple(own)
+
+def _open_(
+    module: Module,
+    args:   tuple,
+    ranges: list,
+    name:   str
+) -> None:
+    """# Open profiler range of a stage (forward pre-hook).
+
+    ## Args:
+        * module    (Module):   Stage being entered.
+        * args      (tuple):    Stage inputs.
+        * ranges    (list):     Open ranges.
+        * name      (str):      Qualified name of stage.
+    """
+    # Open range.
+    ranges.append(record_function(f"{PREFIX}{name}"))
+    ranges[-1].__enter__()
+
+def _close_(
+    module: Module,
+    args:   tuple,
+    output: object,
+    ranges: list
+) -> None:
+    """# Close innermost profiler range (forward hook).
+
+    ## Args:
+        * module    (Module):   Stage being exited.
+        * args      (tuple):    Stage inputs.
+        * output    (object):   Stage outputs.
+        * ranges    (list):     Open ranges.
+    """
+    # Close range.
+    ranges.pop().__exit__(None, None, None)
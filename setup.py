@@ -26,9 +26,14 @@ setup(
                             "medpy",
                             "numpy",
                             "pandas",
+                            "psutil",
+                            "scipy",
                             "segmentation_models_pytorch",
                             "thop",
                             "torch",
                             "tqdm"
-                        ]
+                        ],
+    extras_require =    {
+                            "onnx": ["onnx", "onnxruntime"]
+                        }
 )
\ No newline at end of file
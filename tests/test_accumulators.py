@@ -0,0 +1,134 @@
+"""Tests of streaming metric accumulators."""
+
+from pytest                         import approx, raises
+from torch                          import cat, full, Generator, inference_mode, rand, randint, tensor, Tensor
+
+from metrics                        import asynchronous, AsyncMetricEvaluator, MetricAccumulator
+
+def _batches_(count: int) -> list[tuple[Tensor, Tensor]]:
+    """# Random batches of predictions & targets over 3 classes."""
+    generator:  Generator = Generator().manual_seed(0)
+
+    return [(randint(0, 3, (2, 32, 32), generator = generator), randint(0, 3, (2, 32, 32), generator = generator)) for _ in range(count)]
+
+def _accumulator_(**config) -> MetricAccumulator:
+    """# Accumulator over 3 VOC-style classes."""
+    return MetricAccumulator(dataset_name = "voc", num_classes = 3, **config)
+
+def test_compute_does_not_depend_on_batching():
+    """# Accumulating batch by batch matches accumulating the whole dataset at once."""
+    batches:    list =  _batches_(3)
+    streamed:   MetricAccumulator = _accumulator_()
+    whole:      MetricAccumulator = _accumulator_()
+
+    for prediction, target in batches: streamed.update(prediction = prediction, target = target)
+    whole.update(prediction = cat([prediction for prediction, _ in batches]), target = cat([target for _, target in batches]))
+
+    assert streamed.compute() == approx(whole.compute())
+
+def test_merge_matches_sequential_updates():
+    """# Merging partial states of separate shards matches updating a single accumulator."""
+    batches:    list =  _batches_(4)
+    sequential: MetricAccumulator = _accumulator_()
+    merged:     MetricAccumulator = _accumulator_()
+
+    for prediction, target in batches: sequential.update(prediction = prediction, target = target)
+
+    for prediction, target in batches:
+        shard:  MetricAccumulator = merged.empty()
+        shard.update(prediction = prediction, target = target)
+        merged.merge(shard)
+
+    assert (merged.confusion == sequential.confusion).all()
+    assert merged.compute() == approx(sequential.compute())
+
+def test_async_evaluation_matches_inline():
+    """# Batches evaluated by workers are merged back into the same state as inline updates."""
+    batches:    list =                  _batches_(6)
+    inline:     MetricAccumulator =     _accumulator_()
+    background: MetricAccumulator =     _accumulator_()
+    evaluator:  AsyncMetricEvaluator =  AsyncMetricEvaluator(workers = 2, max_pending = 2)
+
+    for prediction, target in batches:
+        inline.update(prediction = prediction, target = target)
+        evaluator.submit(accumulator = background, prediction = prediction, target = target)
+
+    evaluator.shutdown()
+
+    assert (background.confusion == inline.confusion).all()
+    assert background.compute() == approx(inline.compute())
+
+def test_batches_are_copied_by_workers(monkeypatch):
+    """# Batches are handed to workers as submitted, so that the main thread never waits on a device copy."""
+    prediction, target =                _batches_(1)[0]
+    confidence: Tensor =                rand(prediction.shape)
+    handed:     list =                  []
+    update =                            asynchronous._update_
+    evaluator:  AsyncMetricEvaluator =  AsyncMetricEvaluator(workers = 1)
+
+    monkeypatch.setattr(asynchronous, "_update_", lambda accumulator, *batch: (handed.extend(batch), update(accumulator, *batch))[1])
+
+    evaluator.submit(accumulator = _accumulator_(confidence = True), prediction = prediction, target = target, confidence = confidence)
+    evaluator.shutdown()
+
+    assert [tensor.data_ptr() for tensor in handed] == [prediction.data_ptr(), target.data_ptr(), confidence.data_ptr()]
+
+def test_merge_rejects_mismatched_classes():
+    """# Accumulators over different numbers of classes cannot be merged."""
+    with raises(ValueError): _accumulator_().merge(MetricAccumulator(dataset_name = "voc", num_classes = 4))
+
+def test_state_dict_round_trip():
+    """# Restoring an exported state resumes to the same metrics."""
+    original:   MetricAccumulator = _accumulator_()
+    restored:   MetricAccumulator = _accumulator_()
+
+    for prediction, target in _batches_(2): original.update(prediction = prediction, target = target)
+    restored.load_state_dict(state = original.state_dict())
+
+    assert restored.compute() == approx(original.compute())
+
+def test_compute_without_updates():
+    """# An empty accumulator reports zero scores."""
+    results:    dict =  _accumulator_().compute()
+
+    assert (results["Dice Score"], results["Precision"], results["Recall"], results["Hausdorff"]) == (0.0, 0.0, 0.0, 0.0)
+
+def test_hausdorff_disabled():
+    """# Disabled Hausdorff distance is reported as NaN."""
+    accumulator:    MetricAccumulator = _accumulator_(hausdorff_backend = "none")
+
+    for prediction, target in _batches_(1): accumulator.update(prediction = prediction, target = target)
+
+    assert accumulator.compute()["Hausdorff"] != accumulator.compute()["Hausdorff"]
+
+def test_state_outlives_inference_mode():
+    """# State first allocated within inference mode keeps accumulating after it is exited."""
+    batches:    list =              _batches_(4)
+    updated:    MetricAccumulator = _accumulator_()
+    merged:     MetricAccumulator = _accumulator_()
+
+    with inference_mode():
+        updated.update(*batches[0])
+        merged.merge(_accumulator_().merge(updated))
+
+    updated.update(*batches[1])
+    merged.merge(updated)
+
+    assert not merged.confusion.is_inference() and not updated.confusion.is_inference()
+    assert merged.confusion.sum() == 3 * 2 * 32 * 32
+
+def test_confidence_over_labelled_pixels():
+    """# Mean confidence covers labelled pixels alone, across updates, merges & restored states."""
+    prediction, target =                _batches_(1)[0]
+    target[0] =                         255
+    accumulator:    MetricAccumulator = _accumulator_(confidence = True)
+    restored:       MetricAccumulator = _accumulator_(confidence = True)
+
+    accumulator.update(prediction = prediction, target = target, confidence = full(prediction.shape, 0.9).index_fill_(0, tensor([0]), 0.1))
+    accumulator.merge(_accumulator_(confidence = True).merge(_accumulator_(confidence = True)))
+    restored.load_state_dict(state = accumulator.state_dict())
+
+    assert accumulator.compute()["Confidence"] == approx(0.9) and restored.compute()["Confidence"] == approx(0.9)
+    assert "Confidence" not in _accumulator_().compute() and _accumulator_(confidence = True).compute()["Confidence"] == 0.0
+
+    with raises(ValueError): accumulator.update(prediction = prediction, target = target)
@@ -0,0 +1,37 @@
+"""Tests of inference backends."""
+
+from os                             import listdir
+
+from pytest                         import mark
+from torch                          import randn
+from torch.nn                       import BatchNorm2d, Conv2d, Module, ReLU, Sequential
+
+from backends                       import check_parity, load_backend, restore_weights, variant_name
+
+def _model_() -> Module:
+    """# Tiny convolutional model, in evaluation mode."""
+    return Sequential(Conv2d(3, 8, 3, padding = 1), BatchNorm2d(8), ReLU(), Conv2d(8, 2, 1)).eval()
+
+@mark.parametrize("backend", ["torchscript", "onnx"])
+def test_exported_backends_match_eager(backend, tmp_path):
+    """# Exported models compute the eager model's function, and their artifacts are cached."""
+    model, example =    _model_(), randn(2, 3, 32, 32)
+    runner =            load_backend(model = model, backend = backend, example = example, key = "tiny", cache_path = str(tmp_path))
+
+    assert check_parity(reference = model, candidate = runner, example = example) < 1e-4
+    assert any(file.startswith("tiny.") and not file.endswith(".weights.pt") for file in listdir(tmp_path))
+
+def test_cached_weights_are_shared_by_variants(tmp_path):
+    """# A later variant restores the weights its cached artifact was exported with."""
+    first, second =     _model_(), _model_()
+    example =           randn(1, 3, 32, 32)
+
+    load_backend(model = restore_weights(model = first, key = "tiny", cache_path = str(tmp_path)), backend = "torchscript", example = example, key = "tiny", cache_path = str(tmp_path))
+    runner =            load_backend(model = restore_weights(model = second, key = "tiny", cache_path = str(tmp_path)), backend = "torchscript", example = example, key = "tiny", cache_path = str(tmp_path))
+
+    assert check_parity(reference = first, candidate = second, example = example) == 0
+    assert check_parity(reference = second, candidate = runner, example = example) < 1e-4
+
+def test_variant_names():
+    """# Eager models keep their name, and other backends are qualified."""
+    assert (variant_name("u-net", "eager"), variant_name("u-net", "onnx")) == ("u-net", "u-net (onnx)")
@@ -0,0 +1,41 @@
+"""Tests of benchmark result comparisons."""
+
+from math                           import isnan
+
+from pytest                         import approx
+from torch                          import randn
+from torch.nn                       import Conv2d
+
+from commands.benchmark             import _compare_to_eager_
+from commands.evaluation            import _host_latency_
+
+def _row_(p50: float, **columns) -> dict:
+    """# Result row of a variant."""
+    return {"Dice Score": 0.5, "Latency P50 MS": p50, **columns}
+
+def test_speedup_against_eager():
+    """# Variants are compared with their eager row, or with their own host baseline, and unmeasured latency is NaN."""
+    variants:   dict =  {
+                            "u-net":                ("u-net", "eager", "fp32", "none"),
+                            "u-net (onnx)":         ("u-net", "onnx", "fp32", "none"),
+                            "u-net (int8-static)":  ("u-net", "int8-static", "fp32", "none"),
+                            "u-net (compile)":      ("u-net", "compile", "fp32", "none")
+                        }
+    completed:  dict =  {
+                            "u-net":                _row_(10.0),
+                            "u-net (onnx)":         _row_(5.0),
+                            "u-net (int8-static)":  _row_(20.0, **{"Host FP32 P50 MS": 40.0}),
+                            "u-net (compile)":      _row_(0.0)
+                        }
+
+    _compare_to_eager_(variants = variants, completed = completed)
+
+    assert [completed[variant]["Speedup"] for variant in variants][:3] == approx([1.0, 2.0, 2.0])
+    assert isnan(completed["u-net (compile)"]["Speedup"])
+    assert completed["u-net (onnx)"]["Dice Delta"] == 0.0
+
+def test_host_latency():
+    """# Host baselines are measured on a copy of the model."""
+    model:  Conv2d =    Conv2d(3, 2, 1)
+
+    assert _host_latency_(model = model, images = randn(2, 3, 8, 8), warmup_iterations = 1, iterations = 3) > 0
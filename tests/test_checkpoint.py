@@ -0,0 +1,56 @@
+"""Tests of the resumable result cache."""
+
+from commands                       import checkpoint
+from commands.checkpoint            import ResultCache
+
+def test_key_depends_on_run_configuration(tmp_path):
+    """# Entries of different models, or run configurations, do not collide."""
+    cache:  ResultCache =   ResultCache(path = str(tmp_path), batch_size = 8, input_size = [512, 512])
+
+    assert cache.key("u-net") == ResultCache(path = str(tmp_path), batch_size = 8, input_size = [512, 512]).key("u-net")
+    assert cache.key("u-net") != cache.key("fpn")
+    assert cache.key("u-net") != ResultCache(path = str(tmp_path), batch_size = 4, input_size = [512, 512]).key("u-net")
+    assert cache.key("u-net") != ResultCache(path = str(tmp_path), batch_size = 8, input_size = [256, 512]).key("u-net")
+
+def test_variant_configuration_only_keys_its_variant(tmp_path):
+    """# Calibration size re-keys statically quantized variants, and no others."""
+    def cache(samples: int) -> ResultCache:
+        return ResultCache(path = str(tmp_path), variant_config = {"u-net (int8-static)": {"quantization_samples": samples}}, batch_size = 8)
+
+    assert cache(64).key("u-net (int8-static)") != cache(128).key("u-net (int8-static)")
+    assert cache(64).key("u-net") == cache(128).key("u-net") == ResultCache(path = str(tmp_path), batch_size = 8).key("u-net")
+
+def test_results_replace_checkpoints(tmp_path):
+    """# Storing a result discards the model's checkpoint, and results are read back as stored."""
+    cache:  ResultCache =   ResultCache(path = str(tmp_path))
+
+    cache.save_checkpoint("u-net", {"batches": 50})
+    assert cache.load_checkpoint("u-net") == {"batches": 50}
+
+    cache.save_result("u-net", {"Dice Score": 0.5})
+    assert cache.load_checkpoint("u-net") is None
+    assert cache.load_result("u-net") == {"Dice Score": 0.5}
+
+def test_code_version_ignores_files_outside_sources(tmp_path, monkeypatch):
+    """# Only project packages & modules are hashed, so tests and environments do not invalidate results."""
+    for file in ["commands/checkpoint.py", "models.py", "tests/test_models.py", ".venv/lib/site.py"]:
+        (tmp_path / file).parent.mkdir(parents = True, exist_ok = True)
+        (tmp_path / file).write_text(file)
+
+    monkeypatch.setattr(checkpoint, "__file__", str(tmp_path / "commands" / "checkpoint.py"))
+
+    def version() -> str:
+        checkpoint._code_version_.cache_clear()
+        return checkpoint._code_version_()
+
+    original:   str =   version()
+    (tmp_path / "tests" / "test_models.py").write_text("changed")
+    (tmp_path / ".venv" / "lib" / "site.py").write_text("changed")
+
+    assert version() == original
+
+    (tmp_path / "models.py").write_text("changed")
+    changed:    str =   version()
+    checkpoint._code_version_.cache_clear()
+
+    assert changed != original
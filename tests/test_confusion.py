@@ -0,0 +1,33 @@
+"""Tests of the confusion-matrix metric engine."""
+
+from numpy                          import array
+from pytest                         import approx
+from torch                          import tensor
+
+from metrics                        import confusion_matrix, scores_from_confusion
+
+def test_confusion_matrix_counts_pairs():
+    """# Rows are indexed by target class, columns by predicted class."""
+    confusion = confusion_matrix(prediction = tensor([0, 1, 1, 2]), target = tensor([0, 1, 2, 2]), num_classes = 3)
+
+    assert confusion.tolist() == [[1, 0, 0], [0, 1, 0], [0, 1, 1]]
+
+def test_confusion_matrix_drops_ignored_pixels():
+    """# Targets outside of the class range (i.e., the ignore index) are not counted."""
+    confusion = confusion_matrix(prediction = tensor([0, 1, 2]), target = tensor([0, 255, 255]), num_classes = 3)
+
+    assert confusion.sum() == 1
+
+def test_scores_skip_background_except_for_pets():
+    """# Background is scored for Pets (weighted pet class) but skipped for other datasets."""
+    confusion = array([[2, 2], [0, 4]])
+
+    # Class 1: Dice 8/10, precision 4/6, recall 1.
+    assert scores_from_confusion(confusion = confusion, dataset_name = "voc", smooth = 0) == approx({"Dice Score": 0.8, "Precision": 4 / 6, "Recall": 1.0})
+
+    # Class 0 (weighted 3): Dice 4/6, precision 1, recall 0.5.
+    assert scores_from_confusion(confusion = confusion, dataset_name = "pets", smooth = 0)["Recall"] == approx((3 * 0.5 + 1.0) / 2)
+
+def test_scores_without_present_classes():
+    """# Scores are zero when no scored class is present in the target."""
+    assert scores_from_confusion(confusion = array([[5, 0], [0, 0]]), dataset_name = "voc") == {"Dice Score": 0.0, "Precision": 0.0, "Recall": 0.0}
@@ -0,0 +1,27 @@
+"""Tests of operation & parameter counting."""
+
+from torch.nn                       import Conv2d, Module
+
+from profiling                      import profile_cost
+
+class _Model_(Module):
+    """# Two 1x1 convolutions, as top-level modules."""
+
+    def __init__(self):
+        super().__init__()
+        self.encoder =  Conv2d(3, 4, 1)
+        self.head =     Conv2d(4, 2, 1)
+
+    def forward(self, images):
+        return self.head(self.encoder(images))
+
+def test_counts_scale_with_batch_size_and_leave_model_untouched(tmp_path):
+    """# Operations scale with batch size, modules are broken down, and the model is not modified."""
+    model:  _Model_ =   _Model_()
+    single: dict =      profile_cost(model = model, num_classes = 2, input_size = (8, 8), cache_path = str(tmp_path))
+    batch:  dict =      profile_cost(model = model, num_classes = 2, input_size = (8, 8), batch_size = 4, cache_path = str(tmp_path))
+
+    assert single["Parameters"] == 3 * 4 + 4 + 4 * 2 + 2
+    assert single["Encoder FLOPS"] + single["Head FLOPS"] == single["FLOPS"] > 0
+    assert batch["FLOPS"] == 4 * single["FLOPS"]
+    assert not any(hasattr(module, "total_ops") for module in model.modules())
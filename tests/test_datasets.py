@@ -0,0 +1,82 @@
+"""Tests of datasets."""
+
+from pytest                         import raises
+from torch                          import arange, tensor, uint8, zeros
+from torch.utils.data               import TensorDataset
+
+from datasets                       import BucketBatchSampler, IGNORE_INDEX, label_table, PaddedCollator, remap_mask, SyntheticDataset, valid_region
+from datasets.cache                 import build_cache, CachedDataset
+from utilities                      import parse_arguments
+
+def _dataset_() -> TensorDataset:
+    """# Four uint8 samples of distinct constant values."""
+    images  = arange(4, dtype = uint8).mul(60).view(4, 1, 1, 1).expand(4, 3, 8, 8).contiguous()
+    masks   = arange(4, dtype = uint8).view(4, 1, 1, 1).expand(4, 1, 8, 8).contiguous()
+
+    return TensorDataset(images, masks)
+
+def test_cache_round_trip(tmp_path):
+    """# Cached samples are served as uint8 & remapped, in order, for contiguous and scattered indices."""
+    build_cache(dataset = _dataset_(), path = str(tmp_path), table = label_table("pets"), num_workers = 0)
+    dataset = CachedDataset(path = str(tmp_path))
+
+    for indices in ([1, 2, 3], [3, 0]):
+        images, masks = dataset[indices]
+
+        assert masks[:, 0, 0].tolist() == [index - 1 if index else IGNORE_INDEX for index in indices]
+        assert images.dtype == uint8 and images[:, 0, 0, 0].tolist() == [60 * index for index in indices]
+
+    assert len(dataset) == 4
+
+def test_pets_labels_are_remapped():
+    """# Pets trimaps (1 = pet, 2 = background, 3 = border) map to classes 0-2, anything else is ignored."""
+    mask:   tensor =    tensor([[0, 1], [2, 3]], dtype = uint8)
+
+    assert remap_mask(mask = mask, table = label_table("pets")).tolist() == [[IGNORE_INDEX, 0], [1, 2]]
+
+def test_voc_void_stays_ignored():
+    """# VOC classes are kept as-is, and its void border stays ignored."""
+    mask:   tensor =    tensor([0, 20, 255], dtype = uint8)
+
+    assert remap_mask(mask = mask, table = label_table("voc")).tolist() == [0, 20, IGNORE_INDEX]
+
+def test_label_table_rejects_unknown_dataset():
+    """# Datasets without a label map are rejected."""
+    with raises(ValueError): label_table("synthetic")
+
+def test_synthetic_samples_are_deterministic():
+    """# Samples depend only on the seed & index, whether served alone or within any batch."""
+    dataset:    SyntheticDataset =  SyntheticDataset(num_classes = 4, input_size = (16, 24), num_samples = 4, seed = 1)
+    images, masks =                 dataset[[2, 0, 3]]
+    image, mask =                   SyntheticDataset(num_classes = 4, input_size = (16, 24), num_samples = 4, seed = 1)[0]
+
+    assert images.shape == (3, 3, 16, 24) and masks.dtype == uint8 and int(masks.max()) < 4
+    assert (image == images[1]).all() and (mask == masks[1]).all()
+    assert not (SyntheticDataset(num_classes = 4, input_size = (16, 24), seed = 2)[0][0] == image).all()
+
+def test_buckets_group_similar_aspect_ratios():
+    """# Batches hold samples of similar aspect ratio, and cover every sample once."""
+    sampler:    BucketBatchSampler =    BucketBatchSampler(sizes = [(100, 200), (200, 100), (110, 210), (210, 110)], batch_size = 2)
+
+    assert sorted(sorted(batch) for batch in sampler) == [[0, 2], [1, 3]]
+
+def test_padded_collator_pads_to_multiple():
+    """# Images & masks are padded to a multiple of 32, masks with the ignore index."""
+    images, masks, sizes =  PaddedCollator()([(zeros(3, 40, 50, dtype = uint8), zeros(40, 50, dtype = uint8)), (zeros(3, 20, 70, dtype = uint8), zeros(20, 70, dtype = uint8))])
+
+    assert images.shape == (2, 3, 64, 96) and masks.shape == (2, 64, 96)
+    assert sizes.tolist() == [[40, 50], [20, 70]]
+    assert (masks[1, 20:] == IGNORE_INDEX).all() and (masks[1, :20, :70] == 0).all()
+
+def test_valid_region_marks_unpadded_pixels():
+    """# Only pixels within each sample's valid size are marked."""
+    region: tensor =    valid_region(sizes = tensor([[2, 3], [1, 1]]), height = 4, width = 4)
+
+    assert region.sum(dim = (1, 2)).tolist() == [6, 1]
+
+def test_parser_bounds_synthetic_classes():
+    """# Synthetic datasets are limited to 255 classes, as 255 is the ignore index."""
+    assert parse_arguments(["benchmark", "synthetic", "--num-classes", "255"]).num_classes == 255
+
+    for invalid in ["1", "256", "many"]:
+        with raises(SystemExit): parse_arguments(["benchmark", "synthetic", "--num-classes", invalid])
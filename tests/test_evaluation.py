@@ -0,0 +1,77 @@
+"""Tests of single-model evaluation."""
+
+from time                           import sleep
+
+from pytest                         import fixture
+from torch                          import Generator, randint, Tensor, uint8
+from torch.nn                       import BatchNorm2d, Conv2d, Module, Sequential
+
+from commands                       import evaluation
+from commands.evaluation            import _calibration_batches_, evaluate_model
+from datasets                       import PaddedCollator
+from metrics                        import asynchronous, AsyncMetricEvaluator
+
+def _model_(num_classes: int, **kwargs) -> Module:
+    """# Tiny convolutional stand-in for a segmentation model."""
+    return Sequential(Conv2d(3, 4, 3, padding = 1), BatchNorm2d(4), Conv2d(4, num_classes, 1))
+
+def _batches_(count: int = 2, size: int = 32) -> list[tuple[Tensor, Tensor]]:
+    """# Random normalized images & uint8 masks over 3 classes."""
+    generator:  Generator = Generator().manual_seed(0)
+
+    return [(randint(0, 255, (2, 3, size, size), generator = generator) / 255, randint(0, 3, (2, size, size), generator = generator, dtype = uint8)) for _ in range(count)]
+
+@fixture
+def evaluate(tmp_path, monkeypatch):
+    """# Evaluate the stand-in model on CPU, with every cache under a temporary directory."""
+    monkeypatch.setattr(evaluation, "load_model", lambda model_name, num_classes, **kwargs: _model_(num_classes))
+
+    def evaluate(**config) -> dict:
+        return  evaluate_model(**{
+                    "model_name":           "tiny",
+                    "batches":              _batches_(),
+                    "dataset_name":         "pets",
+                    "batch_size":           2,
+                    "device":               "cpu",
+                    "input_size":           (32, 32),
+                    "hausdorff_backend":    "none",
+                    "warmup_iterations":    1,
+                    "cost_cache":           str(tmp_path / "costs"),
+                    "backend_cache":        str(tmp_path / "backends"),
+                    "weights_cache":        str(tmp_path / "weights"),
+                    "save_path":            str(tmp_path),
+                    **config
+                })
+
+    return evaluate
+
+def test_row_reports_precision_mode_and_metric(evaluate):
+    """# The precision mode and the precision metric are reported in separate columns."""
+    row:    dict =  evaluate(precision = "bf16")
+
+    assert row["Precision Mode"] == "bf16"
+    assert isinstance(row["Precision"], float)
+
+def test_inference_mode_with_async_metrics(evaluate, monkeypatch):
+    """# Metrics evaluated asynchronously are merged after leaving inference mode."""
+    evaluator:  AsyncMetricEvaluator =  AsyncMetricEvaluator(workers = 2, max_pending = 1)
+    update =                            asynchronous._update_
+
+    # Slow workers down, so that the first batch is merged within inference mode and the last one after it.
+    monkeypatch.setattr(asynchronous, "_update_", lambda *args: (sleep(0.1), update(*args))[1])
+
+    try:        row = evaluate(optimization = "inference-mode", evaluator = evaluator)
+    finally:    evaluator.shutdown()
+
+    assert row["Dice Score"] == evaluate()["Dice Score"]
+
+def test_calibration_batches_of_fixed_and_native_resolution():
+    """# Calibration takes the first images of both fixed-size and padded native-resolution batches."""
+    fixed:  list =  _batches_(count = 3)
+    native: list =  [PaddedCollator()([(image.mul(255).to(uint8), mask) for image, mask in zip(*batch)]) for batch in fixed]
+
+    for batches in (fixed, native):
+        calibration:    list =  _calibration_batches_(batches = batches, samples = 3)
+
+        assert [len(images) for images in calibration] == [2, 1]
+        assert (calibration[1] == batches[1][0][:1]).all()
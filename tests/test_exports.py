@@ -0,0 +1,19 @@
+"""Tests of package & module exports."""
+
+from importlib                      import import_module
+from pkgutil                        import walk_packages
+
+from pytest                         import mark
+
+# Packages of the project.
+PACKAGES:   list[str] = ["backends", "commands", "datasets", "metrics", "profiling", "utilities"]
+
+# Every module of the project.
+MODULES:    list[str] = PACKAGES + [module.name for package in PACKAGES for module in walk_packages(import_module(package).__path__, prefix = f"{package}.")]
+
+@mark.parametrize("module", MODULES)
+def test_all_names_exist(module: str):
+    """# Every name listed in `__all__` is defined by its module."""
+    imported =  import_module(module)
+
+    assert [name for name in getattr(imported, "__all__", []) if not hasattr(imported, name)] == []
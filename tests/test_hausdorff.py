@@ -0,0 +1,50 @@
+"""Tests of Hausdorff distance backends."""
+
+from numpy                          import isnan, zeros
+from pytest                         import approx, raises
+
+from metrics                        import hausdorff_distance, HAUSDORFF_PENALTY
+from utilities                      import parse_arguments
+
+def _squares_() -> tuple:
+    """# Batch of two images: offset squares, and a target missed by an empty prediction."""
+    prediction, target =    zeros((2, 32, 32), dtype = bool), zeros((2, 32, 32), dtype = bool)
+
+    prediction[0, 4:12, 4:12] =     True
+    target[0, 8:20, 6:14] =         True
+    target[1, 4:8, 4:8] =           True
+
+    return prediction, target
+
+def test_edt_matches_medpy():
+    """# Distance transforms reproduce the reference HD and HD95."""
+    for percentile in (100, 95):
+        edt     = hausdorff_distance(*_squares_(), backend = "edt",   percentile = percentile)
+        medpy   = hausdorff_distance(*_squares_(), backend = "medpy", percentile = percentile)
+
+        assert edt[0] == approx(medpy[0])
+
+def test_missed_and_empty_targets():
+    """# Missed targets are penalized, and empty targets are not measured."""
+    prediction, target =    _squares_()
+
+    assert hausdorff_distance(prediction, target)[1] == HAUSDORFF_PENALTY
+    assert isnan(hausdorff_distance(prediction, zeros((2, 32, 32), dtype = bool))).all()
+
+def test_stride_error_is_bounded():
+    """# Subsampled boundaries stay within sqrt(2) * (stride - 1) pixels of the exact distance."""
+    exact   = hausdorff_distance(*_squares_())[0]
+
+    assert abs(hausdorff_distance(*_squares_(), stride = 4)[0] - exact) <= 2 ** 0.5 * 3
+
+def test_medpy_rejects_unsupported_percentile():
+    """# Medpy cannot report arbitrary percentiles, so they are rejected instead of falling back to HD."""
+    masks = zeros((1, 8, 8), dtype = bool)
+
+    with raises(ValueError): hausdorff_distance(prediction = masks, target = masks, backend = "medpy", percentile = 90)
+
+def test_parser_rejects_unsupported_medpy_percentile():
+    """# Unsupported medpy percentiles are rejected when parsing arguments."""
+    with raises(SystemExit): parse_arguments(["benchmark", "--hausdorff-backend", "medpy", "--hausdorff-percentile", "90", "synthetic"])
+
+    assert parse_arguments(["benchmark", "--hausdorff-backend", "medpy", "--hausdorff-percentile", "95", "synthetic"]).hausdorff_percentile == 95
@@ -0,0 +1,24 @@
+"""Tests of latency measurement."""
+
+from time                           import sleep
+
+from pytest                         import approx
+
+from profiling                      import LatencyRecorder
+
+def test_measured_batches_are_summarized():
+    """# Percentiles are ordered, and throughput counts the images of every measured batch."""
+    latency:    LatencyRecorder =   LatencyRecorder(device = "cpu")
+
+    latency.warmup(forward = lambda: None, iterations = 2)
+    for _ in range(5):
+        with latency.measure(batch_size = 4): sleep(0.01)
+
+    summary:    dict =              latency.summary()
+
+    assert 10 <= summary["Latency P50 MS"] <= summary["Latency P90 MS"] <= summary["Latency P99 MS"]
+    assert summary["Throughput IMG/S"] == approx(20 / (summary["Inference Time MS"] * 5 / 1e3))
+
+def test_nothing_measured():
+    """# Without samples, zeros are reported."""
+    assert set(LatencyRecorder(device = "cpu").summary().values()) == {0.0}
@@ -0,0 +1,59 @@
+"""Tests of the memory monitor."""
+
+from time                           import sleep
+
+from torch                          import ones
+
+from profiling                      import MemoryMonitor
+
+def _counted_monitor_() -> tuple[MemoryMonitor, list]:
+    """# CPU monitor recording each background sample."""
+    monitor:    MemoryMonitor = MemoryMonitor(device = "cpu", interval = 0.001)
+    samples:    list =          []
+    sample =                    monitor._sample_
+
+    monitor._sample_ =          lambda workers = False: (samples.append(workers), sample(workers = workers))
+
+    return monitor, samples
+
+def test_phase_growth_on_cpu():
+    """# Memory allocated within a phase is attributed to it, and to the window's peak."""
+    monitor:    MemoryMonitor = MemoryMonitor(device = "cpu", interval = 0.001)
+    monitor.start()
+
+    with monitor.phase("setup"):        pass
+    with monitor.phase("inference"):    buffer = ones(32 * 2 ** 20, dtype = int)
+
+    summary:    dict =  monitor.stop()
+    del buffer
+
+    assert summary["Inference Memory MB"] > 200 and summary["Setup Memory MB"] < 200
+    assert summary["Peak Memory MB"] >= summary["Inference Memory MB"]
+    assert summary["Peak RSS MB"] > 0 and "Python Peak MB" not in summary
+
+def test_sampling_is_suspended_while_paused():
+    """# No samples are taken within a paused (timed) block, and sampling resumes after it."""
+    monitor, samples =  _counted_monitor_()
+    monitor.start()
+
+    with monitor.paused():
+        sleep(0.01)
+        before: int =   len(samples)
+        sleep(0.05)
+        during: int =   len(samples)
+
+    sleep(0.05)
+    monitor.stop()
+
+    assert during == before
+    assert len(samples) > during
+
+def test_stop_while_paused():
+    """# Stopping a paused monitor does not wait for the block to exit."""
+    monitor, _ =    _counted_monitor_()
+    monitor.start()
+
+    with monitor.paused(): summary = monitor.stop()
+
+    assert not monitor._thread_.is_alive()
+    assert summary["Peak RSS MB"] > 0
@@ -0,0 +1,39 @@
+"""Tests of model construction & weight loading."""
+
+from os                             import utime
+
+from pytest                         import raises
+from torch                          import save
+from torch.nn                       import Module
+
+from models                         import load_model, weights_version
+
+def test_checkpoint_round_trip(tmp_path):
+    """# A fine-tuned checkpoint is assigned in place of meta-device placeholders."""
+    model:      Module =    load_model(model_name = "u-net", num_classes = 3, device = "cpu")
+    save(model.state_dict(), tmp_path / "u-net_3.pt")
+
+    restored:   Module =    load_model(model_name = "u-net", num_classes = 3, device = "cpu", weights = "checkpoint", weights_cache = str(tmp_path))
+
+    assert all((restored.state_dict()[name] == value).all() for name, value in model.state_dict().items())
+    assert not any(parameter.is_meta for parameter in restored.parameters())
+
+def test_missing_checkpoint(tmp_path):
+    """# Missing checkpoints are reported with their expected path."""
+    with raises(FileNotFoundError, match = "fpn_5.pt"): load_model(model_name = "fpn", num_classes = 5, device = "cpu", weights = "checkpoint", weights_cache = str(tmp_path))
+
+def test_invalid_selections():
+    """# Unknown models & weights are rejected."""
+    with raises(ValueError): load_model(model_name = "mask-rcnn", device = "cpu")
+    with raises(ValueError): load_model(model_name = "u-net", device = "cpu", weights = "coco")
+
+def test_weights_version_follows_file(tmp_path):
+    """# Replacing a checkpoint changes its version, and random weights have none."""
+    save({"weight": 0}, tmp_path / "u-net_3.pt")
+    utime(tmp_path / "u-net_3.pt", ns = (0, 0))
+    original:   str =   weights_version(model_name = "u-net", weights = "checkpoint", weights_cache = str(tmp_path))
+
+    save({"weight": 1}, tmp_path / "u-net_3.pt")
+
+    assert original and weights_version(model_name = "u-net", weights = "checkpoint", weights_cache = str(tmp_path)) != original
+    assert weights_version(model_name = "fpn", weights = "checkpoint", weights_cache = str(tmp_path)) == weights_version(model_name = "u-net") == ""
@@ -0,0 +1,46 @@
+"""Tests of inference graph optimizations."""
+
+from pytest                         import raises
+from torch                          import channels_last, Generator, randn, Tensor
+from torch.nn                       import BatchNorm2d, Conv2d, Identity, Module, ReLU, Sequential
+
+from backends                       import check_parity, fuse_conv_bn, optimization_passes, optimize_model
+
+def _model_() -> Module:
+    """# Plain and separable (sequential) convolutions, each followed by batch normalization."""
+    model:  Module =    Sequential(
+                            Conv2d(3, 8, 3, padding = 1), BatchNorm2d(8), ReLU(),
+                            Sequential(Conv2d(8, 8, 3, padding = 1, groups = 8), Conv2d(8, 4, 1)), BatchNorm2d(4)
+                        )
+
+    # Give normalization layers non-trivial statistics.
+    for module in model.modules():
+        if isinstance(module, BatchNorm2d): module.running_mean.uniform_(-1, 1), module.running_var.uniform_(0.5, 2)
+
+    return model.eval()
+
+def _images_() -> Tensor:
+    """# Random input batch."""
+    return randn(2, 3, 16, 16, generator = Generator().manual_seed(0))
+
+def test_fusion_preserves_outputs():
+    """# Normalization following plain & separable convolutions is folded into them."""
+    reference:  Module =    _model_()
+    fused:      Module =    _model_()
+    fused.load_state_dict(reference.state_dict())
+
+    assert fuse_conv_bn(model = fused) == 2
+    assert isinstance(fused[1], Identity) and isinstance(fused[4], Identity)
+    assert check_parity(reference = reference, candidate = fused, example = _images_()) < 1e-4
+
+def test_channels_last():
+    """# Channels-last stores convolution weights in NHWC layout."""
+    model:  Module =    optimize_model(model = _model_(), passes = optimization_passes("channels-last"))
+
+    assert model[0].weight.is_contiguous(memory_format = channels_last)
+
+def test_optimization_passes():
+    """# "all" expands to every pass, and unknown selections are rejected."""
+    assert optimization_passes("none") == set() and optimization_passes("all") == {"fuse-bn", "channels-last", "inference-mode"}
+
+    with raises(ValueError): optimization_passes("prune")
@@ -0,0 +1,37 @@
+"""Tests of the parallel multi-model scheduler."""
+
+from commands                       import parallel
+
+def _fake_schedule_(calls: list):
+    """# Scheduler recording its core budgets, in which concurrent runs are 50% slower than solo runs."""
+    def schedule(variants: list, budgets: list, settings: dict, max_batches: int = None) -> list[dict]:
+        calls.append(budgets)
+        return [{"Model": model_name, "Latency P50 MS": 10.0 if max_batches else 15.0} for model_name, *_ in variants]
+
+    return schedule
+
+def test_interference_against_solo_calibration(monkeypatch):
+    """# Cores are split into disjoint budgets, and concurrent latency is compared with solo runs."""
+    calls:  list =  []
+
+    monkeypatch.setattr(parallel, "load_dataset",       lambda **kwargs: None)
+    monkeypatch.setattr(parallel, "_available_cores_",  lambda: {0, 1, 2, 3})
+    monkeypatch.setattr(parallel, "_schedule_",         _fake_schedule_(calls))
+
+    rows:   list =  parallel.run_parallel(variants = [("u-net", "eager"), ("fpn", "eager")], parallel_models = 2)
+
+    assert calls == [[[0, 1]], [[0, 1], [2, 3]]]
+    assert [(row["Solo P50 MS"], row["Interference"]) for row in rows] == [(10.0, 1.5), (10.0, 1.5)]
+
+def test_single_budget_skips_calibration(monkeypatch):
+    """# Models evaluated one at a time are neither calibrated nor compared against solo runs."""
+    calls:  list =  []
+
+    monkeypatch.setattr(parallel, "load_dataset",       lambda **kwargs: None)
+    monkeypatch.setattr(parallel, "_available_cores_",  lambda: {0, 1, 2, 3})
+    monkeypatch.setattr(parallel, "_schedule_",         _fake_schedule_(calls))
+
+    rows:   list =  parallel.run_parallel(variants = [("u-net", "eager"), ("fpn", "eager")], parallel_models = 1)
+
+    assert calls == [[[0, 1, 2, 3]]]
+    assert not any("Interference" in row or "Solo P50 MS" in row for row in rows)
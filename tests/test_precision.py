@@ -0,0 +1,22 @@
+"""Tests of inference precision modes."""
+
+from pytest                         import mark, raises
+from torch                          import bfloat16, float32, randn
+from torch.nn                       import Linear
+
+from backends                       import precision_context, variant_name
+
+@mark.parametrize("precision, dtype", [("fp32", float32), ("bf16", bfloat16)])
+def test_autocast_follows_device(precision, dtype):
+    """# Precision modes autocast on the device the model is executed on, including CPU."""
+    with precision_context(precision = precision, device = "cpu"): output = Linear(4, 2)(randn(1, 4))
+
+    assert output.dtype == dtype
+
+def test_invalid_precision():
+    """# Unknown precision modes are rejected."""
+    with raises(ValueError): precision_context(precision = "int4", device = "cpu")
+
+def test_variant_names_qualify_precision():
+    """# Reduced precisions are qualified after the backend."""
+    assert (variant_name("u-net", "eager", "bf16"), variant_name("u-net", "compile", "fp16"), variant_name("u-net", "onnx", "fp32")) == ("u-net (bf16)", "u-net (compile, fp16)", "u-net (onnx)")
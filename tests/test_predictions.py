@@ -0,0 +1,39 @@
+"""Tests of post-processing model outputs into predictions."""
+
+from pytest                         import raises
+from torch                          import channels_last, Generator, nan, randn, tensor, Tensor, uint8, zeros
+
+from metrics                        import predict_labels, prediction_confidence
+
+def _logits_(classes: int = 21) -> Tensor:
+    """# Random logits, with ties between the first classes of some pixels."""
+    logits: Tensor =    randn(2, classes, 16, 24, generator = Generator().manual_seed(0))
+    logits[:, 1, :4] =  logits[:, 0, :4]
+
+    return logits
+
+def test_labels_match_argmax():
+    """# Labels match argmax (including ties, which resolve to the lowest class) for contiguous and channels-last logits."""
+    logits: Tensor =    _logits_()
+
+    for layout in (logits, logits.contiguous(memory_format = channels_last)):
+        labels: Tensor =    predict_labels(layout)
+
+        assert labels.dtype == uint8 and (labels == logits.argmax(dim = 1)).all()
+
+def test_labels_reject_too_many_classes():
+    """# uint8 label maps cannot hold more than 255 classes."""
+    with raises(ValueError): predict_labels(zeros(1, 256, 1, 1))
+
+def test_nan_logits_keep_preceding_label():
+    """# A NaN logit keeps the best class preceding it, and stops later classes from relabelling the pixel."""
+    logits: Tensor =    tensor([[0.0, 2.0], [1.0, nan], [3.0, 5.0]]).reshape(1, 3, 1, 2)
+
+    assert predict_labels(logits).flatten().tolist() == [2, 0]
+
+def test_confidence_matches_softmax():
+    """# Confidence is the largest softmax probability, however classes are chunked."""
+    logits: Tensor =    _logits_() * 10
+
+    for chunk_classes in (1, 8, 64):
+        assert (prediction_confidence(logits, chunk_classes = chunk_classes) - logits.softmax(dim = 1).amax(dim = 1)).abs().max() < 1e-6
@@ -0,0 +1,23 @@
+"""Tests of device prefetching."""
+
+from pytest                         import approx
+from torch                          import arange, uint8
+
+from datasets                       import DevicePrefetcher, MEAN, STD
+
+def test_batches_are_served_in_order():
+    """# Every batch is served once, in order, however many are kept in flight."""
+    batches:    list =  [(arange(6).view(2, 3) + 10 * index, arange(2) + index) for index in range(5)]
+
+    for depth in (1, 3, 8):
+        prefetcher: DevicePrefetcher =  DevicePrefetcher(loader = batches, device = "cpu", depth = depth, normalize = False)
+
+        assert len(prefetcher) == 5
+        assert [(images.tolist(), masks.tolist()) for images, masks in prefetcher] == [(images.tolist(), masks.tolist()) for images, masks in batches]
+
+def test_images_are_normalized_on_device():
+    """# uint8 images are served as float32, scaled to [0, 1] and normalized with ImageNet statistics."""
+    images, masks = arange(255).to(uint8).view(5, 3, 17, 1), arange(5)
+    served, _ =     next(iter(DevicePrefetcher(loader = [(images, masks)], device = "cpu")))
+
+    for channel in range(3): assert served[:, channel].flatten().tolist() == approx(((images[:, channel].flatten() / 255 - MEAN[channel]) / STD[channel]).tolist(), abs = 1e-5)
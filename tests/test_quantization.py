@@ -0,0 +1,50 @@
+"""Tests of post-training INT8 quantization."""
+
+from torch                          import Generator, randn, Tensor
+from torch.nn                       import BatchNorm2d, Conv2d, Flatten, Linear, Module, ReLU, Sequential
+
+from backends                       import dynamic_layers, quantize_dynamic_int8, quantize_static_int8
+from commands.benchmark             import _dynamic_layers_
+
+class _Branching_(Module):
+    """# Convolution with data-dependent control flow, which FX cannot trace whole."""
+
+    def __init__(self):
+        super().__init__()
+        self.encoder:   Module =    Sequential(Conv2d(3, 8, 3, padding = 1), BatchNorm2d(8), ReLU())
+        self.head:      Module =    Conv2d(8, 2, 1)
+        self.stride:    int =       1
+
+    def forward(self, images: Tensor) -> Tensor:
+        features:   Tensor =    self.encoder(images)
+
+        return self.head(features if features.sum() > 0 else -features)
+
+def _images_(count: int) -> list[Tensor]:
+    """# Random calibration batches."""
+    generator:  Generator = Generator().manual_seed(0)
+
+    return [randn(2, 3, 16, 16, generator = generator) for _ in range(count)]
+
+def test_dynamic_quantization_of_linear_layers():
+    """# Linear layers of a copy are quantized, leaving the original model in FP32."""
+    model:      Module =    Sequential(Flatten(), Linear(12, 4)).eval()
+    quantized:  Module =    quantize_dynamic_int8(model)
+    images:     Tensor =    randn(2, 3, 2, 2)
+
+    assert type(model[1]) is Linear and type(quantized[1]) is not Linear
+    assert (quantized(images) - model(images)).abs().max() < 0.1
+
+def test_static_quantization_of_untraceable_model():
+    """# Traceable sub-modules are quantized individually, keeping the model's plain attributes."""
+    model:      Module =    _Branching_().eval()
+    quantized:  Module =    quantize_static_int8(model = model, calibration = _images_(4))
+    images:     Tensor =    _images_(1)[0]
+
+    assert quantized.stride == 1 and not any(isinstance(module, Conv2d) for module in quantized.modules())
+    assert (quantized(images) - model(images)).abs().max() < 0.2
+
+def test_models_without_dynamic_layers():
+    """# Only models with linear layers (Seg-Former's MLP blocks) have layers to quantize dynamically."""
+    assert dynamic_layers(Sequential(Conv2d(3, 8, 1), Flatten(), Linear(8, 2))) == 1
+    assert [model_name for model_name in ["deeplab-v3", "fpn", "seg-former", "u-net"] if _dynamic_layers_(model_name, num_classes = 3)] == ["seg-former"]
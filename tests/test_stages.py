@@ -0,0 +1,18 @@
+"""Tests of per-stage profiling."""
+
+from torch                          import randn
+from torch.nn                       import Conv2d, ReLU, Sequential
+
+from profiling                      import profile_stages
+
+def test_stages_within_depth_are_reported(tmp_path):
+    """# Sub-modules within depth are reported once per iteration, and a Chrome trace is exported."""
+    model =     Sequential(Sequential(Conv2d(3, 8, 3), ReLU()), Conv2d(8, 2, 1))
+    images =    randn(1, 3, 32, 32)
+
+    stages =    profile_stages(model = model, forward = lambda: model(images), device = "cpu", iterations = 2, depth = 1, trace_path = str(tmp_path / "trace.json"))
+
+    assert sorted(stages["Module"]) == ["0", "1"]
+    assert (stages["Calls"] == 1).all()
+    assert (stages["Total CPU MS"] >= stages["Self CPU MS"]).all()
+    assert (tmp_path / "trace.json").exists()
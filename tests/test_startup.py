@@ -0,0 +1,10 @@
+"""Tests of CLI startup."""
+
+from commands                       import run_startup
+
+def test_probes_import_no_heavy_modules():
+    """# Importing the packages, help and argument validation leave heavy libraries unimported."""
+    results:    list =  run_startup(repeats = 1, budget_ms = 10000.0)
+
+    assert [row["Probe"] for row in results] == ["import", "--help", "benchmark --help", "invalid arguments"]
+    assert not any(row["Failed"] or row["Heavy Modules"] for row in results)
@@ -0,0 +1,26 @@
+"""Tests of sweep summaries."""
+
+from pandas                         import DataFrame
+from pytest                         import approx
+
+from commands.sweep                 import _summarize_sweep_
+
+def test_saturation_and_scaling():
+    """# Saturation is the first batch size gaining too little throughput, and cost scales with pixels."""
+    results:    DataFrame = DataFrame([
+                                {"Model": "u-net", "Input Size": size, "Batch Size": batch_size, "Throughput IMG/S": throughput / (size / 256) ** 2}
+                                for size in (256, 512)
+                                for batch_size, throughput in ((1, 100.0), (2, 180.0), (4, 185.0), (8, 186.0))
+                            ])
+
+    summary:    DataFrame = _summarize_sweep_(results_df = results, saturation_threshold = 0.05)
+
+    assert summary["Saturation Batch Size"].tolist() == [2, 2]
+    assert summary["Relative Cost"].tolist() == approx([1.0, 4.0])
+    assert summary["Scaling Exponent"].tolist() == approx([1.0, 1.0])
+
+def test_empty_results():
+    """# Sweeps without measurements summarize to an empty table of the same columns."""
+    summary:    DataFrame = _summarize_sweep_(results_df = DataFrame(), saturation_threshold = 0.05)
+
+    assert summary.empty and summary.columns.tolist() == ["Model", "Input Size", "Saturation Batch Size", "Peak Throughput IMG/S", "MS Per Image", "Relative Cost", "Scaling Exponent"]
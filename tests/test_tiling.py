@@ -0,0 +1,29 @@
+"""Tests of sliding-window tiled inference."""
+
+from pytest                         import mark, raises
+from torch                          import Generator, randn, Tensor
+from torch.nn                       import Conv2d, Module
+
+from backends                       import blend_weights, TiledRunner
+
+@mark.parametrize("blend", ["gaussian", "linear"])
+def test_pointwise_model_is_reproduced(blend):
+    """# Blending overlapping tiles of a pointwise model reproduces whole-image inference, including images smaller than a tile."""
+    model:  Module =    Conv2d(3, 2, 1).eval()
+
+    for height, width in ((70, 100), (20, 40)):
+        images: Tensor =    randn(2, 3, height, width, generator = Generator().manual_seed(0))
+
+        assert (TiledRunner(runner = model, tile_size = 32, overlap = 0.5, blend = blend, tile_batch = 3)(images) - model(images)).abs().max() < 1e-5
+
+def test_blend_weights_peak_in_center():
+    """# Weights are strictly positive, peaking in the center of the tile."""
+    weights:    Tensor =    blend_weights(tile_size = 32)
+
+    assert weights.shape == (1, 1, 32, 32) and (weights > 0).all()
+    assert weights[0, 0, 15, 15] > weights[0, 0, 0, 0]
+
+def test_invalid_configuration():
+    """# Tiles must be a multiple of 32, and overlap less than a whole tile."""
+    with raises(ValueError): TiledRunner(runner = None, tile_size = 48)
+    with raises(ValueError): TiledRunner(runner = None, overlap = 1.0)
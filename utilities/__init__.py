@@ -1,8 +1,8 @@
 """Utilities package."""
 
-__all__ = ["ARGS", "BANNER", "LOGGER", "TIMESTAMP"]
+__all__ = ["BANNER", "configure_logging", "LOGGER", "parse_arguments", "TIMESTAMP"]
 
-from utilities.arguments    import ARGS
+from utilities.arguments    import parse_arguments
 from utilities.banner       import BANNER
-from utilities.logger       import LOGGER
+from utilities.logger       import configure_logging, LOGGER
 from utilities.timestamp    import TIMESTAMP
\ No newline at end of file
@@ -1,3 +1,3 @@
-__all__ = ["ARGS"]
+__all__ = ["parse_arguments"]
 
-from utilities.arguments.primary    import ARGS
\ No newline at end of file
+from utilities.arguments.primary    import parse_arguments
\ No newline at end of file
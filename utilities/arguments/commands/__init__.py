@@ -1,5 +1,6 @@
 """Commands arguments package."""
 
-__all__ = ["add_benchmark_parser"]
+__all__ = ["add_benchmark_parser", "add_startup_parser"]
 
-from utilities.arguments.commands.benchmark   import add_benchmark_parser
\ No newline at end of file
+from utilities.arguments.commands.benchmark   import add_benchmark_parser
+from utilities.arguments.commands.startup     import add_startup_parser
\ No newline at end of file
@@ -1,10 +1,11 @@
 """Argument definitions for running a job."""
 
-__all__ = ["add_run_job_parser"]
+__all__ = ["add_benchmark_parser"]
 
-from argparse                       import ArgumentParser, _SubParsersAction
+from argparse                                   import ArgumentParser, _ArgumentGroup, BooleanOptionalAction, _SubParsersAction
 
-from utilities.arguments.datasets   import *
+from utilities.arguments.commands.sweep         import add_sweep_parser
+from utilities.arguments.datasets               import *
 
 def add_benchmark_parser(
     parent_subparser:   _SubParsersAction
@@ -20,12 +21,404 @@ def add_benchmark_parser(
                                             help =  """Benchmark segmentation model(s) on a dataset."""
                                         )
     
+    # EXECUTION ====================================================================================
+    _execution_:    _ArgumentGroup =    _parser_.add_argument_group(
+                                            title =         "Execution",
+                                            description =   """Execution configuration."""
+                                        )
+    
+    _execution_.add_argument(
+        "--device",
+        type =          str,
+        default =       "cuda",
+        help =          """Device on which models are executed (i.e., "cuda", "cuda:1", "cpu"). 
+                        Defaults to "cuda"."""
+    )
+    
+    _execution_.add_argument(
+        "--backends",
+        type =          str,
+        nargs =         "+",
+        choices =       ["eager", "torchscript", "compile", "onnx", "int8-dynamic", "int8-static"],
+        default =       ["eager"],
+        help =          """Inference backends on which each model is evaluated, each reported as a 
+                        separate variant. ONNX models run on ONNX Runtime (CPU), and INT8 models 
+                        (post-training quantized) run on CPU. Models without linear layers have 
+                        no int8-dynamic variant. Defaults to eager only."""
+    )
+    
+    _execution_.add_argument(
+        "--precisions",
+        type =          str,
+        nargs =         "+",
+        choices =       ["fp32", "bf16", "fp16"],
+        default =       ["fp32"],
+        help =          """Precisions at which each model is evaluated, each reported as a separate 
+                        variant. Reduced precisions autocast on the selected device (i.e., BF16 
+                        autocast on CPU), and apply to the eager & compile backends. Defaults to 
+                        FP32 only."""
+    )
+    
+    _execution_.add_argument(
+        "--optimizations",
+        type =          str,
+        nargs =         "+",
+        choices =       ["none", "fuse-bn", "channels-last", "inference-mode", "all"],
+        default =       ["none"],
+        help =          """Graph optimizations applied to each model, each reported as a separate 
+                        variant, so that latency gains can be attributed to individual passes: 
+                        folding batch normalization into convolutions, NHWC memory layout, and 
+                        inference mode in place of no-grad mode. Defaults to none."""
+    )
+    
+    _execution_.add_argument(
+        "--parity-tolerance",
+        type =          float,
+        default =       1e-3,
+        help =          """Maximum absolute difference from eager outputs tolerated of other 
+                        backends. Defaults to 1e-3."""
+    )
+    
+    _execution_.add_argument(
+        "--quantization-samples",
+        type =          int,
+        default =       64,
+        help =          """Images of the dataset on which static INT8 quantization is calibrated. 
+                        Defaults to 64."""
+    )
+    
+    _execution_.add_argument(
+        "--parallel-models",
+        type =          int,
+        default =       1,
+        help =          """Number of models evaluated concurrently, each in a worker process pinned 
+                        to its own share of the available cores. Implies a dataset cache. Defaults 
+                        to 1 (sequential)."""
+    )
+    
+    _execution_.add_argument(
+        "--calibration-batches",
+        type =          int,
+        default =       10,
+        help =          """Batches timed in the solo calibration run of each model, against which 
+                        parallel timings are checked for interference. Defaults to 10."""
+    )
+    
+    _execution_.add_argument(
+        "--interference-tolerance",
+        type =          float,
+        default =       0.10,
+        help =          """Relative slowdown of median latency over solo calibration above which 
+                        interference between parallel models is reported. Defaults to 0.10."""
+    )
+    
+    _execution_.add_argument(
+        "--result-cache",
+        type =          str,
+        default =       "results/cache",
+        help =          """Directory in which completed results & partial model checkpoints are 
+                        cached, keyed by model, configuration, and code version. Defaults to 
+                        "./results/cache/"."""
+    )
+    
+    _execution_.add_argument(
+        "--resume",
+        action =        BooleanOptionalAction,
+        default =       True,
+        help =          """Skip models whose results are cached and resume interrupted models from 
+                        their last checkpoint. Enabled by default."""
+    )
+    
+    _execution_.add_argument(
+        "--checkpoint-interval",
+        type =          int,
+        default =       50,
+        help =          """Batches between checkpoints of a model's partial state. Defaults to 50."""
+    )
+    
+    # MODEL ========================================================================================
+    _model_:        _ArgumentGroup =    _parser_.add_argument_group(
+                                            title =         "Model",
+                                            description =   """Model construction configuration."""
+                                        )
+    
+    _model_.add_argument(
+        "--weights",
+        type =          str,
+        choices =       ["random", "imagenet", "checkpoint"],
+        default =       "random",
+        help =          """Model weights. "random" initializes every layer without downloading 
+                        anything, "imagenet" restores the cached ImageNet encoder (fetched on first 
+                        use, where network access is available), and "checkpoint" memory-maps a 
+                        fine-tuned model from "<weights-cache>/<model>_<classes>.pt". Defaults to 
+                        "random"."""
+    )
+    
+    _model_.add_argument(
+        "--weights-cache",
+        type =          str,
+        default =       "models/cache",
+        help =          """Directory in which pretrained weights & fine-tuned checkpoints are 
+                        cached. Copy it to air-gapped nodes. Defaults to "./models/cache/"."""
+    )
+    
+    # DATA =========================================================================================
+    _data_:         _ArgumentGroup =    _parser_.add_argument_group(
+                                            title =         "Data",
+                                            description =   """Data loading configuration."""
+                                        )
+    
+    _data_.add_argument(
+        "--cache-dataset",
+        action =        "store_true",
+        default =       False,
+        help =          """Serve samples from a memory-mapped cache of resized uint8 images & masks, 
+                        building it on first use."""
+    )
+    
+    _data_.add_argument(
+        "--cache-path",
+        type =          str,
+        default =       "data/cache",
+        help =          """Directory under which dataset caches are stored. Defaults to 
+                        "./data/cache/"."""
+    )
+    
+    _data_.add_argument(
+        "--input-size",
+        type =          int,
+        nargs =         2,
+        default =       [512, 512],
+        metavar =       ("HEIGHT", "WIDTH"),
+        help =          """Size to which samples are resized (and of synthetic samples). Defaults to 
+                        512 x 512."""
+    )
+    
+    _data_.add_argument(
+        "--native-resolution",
+        action =        "store_true",
+        default =       False,
+        help =          """Evaluate Pets & VOC images at their own resolution instead of resizing 
+                        them to the input size: samples are batched by aspect ratio and padded to 
+                        a multiple of 32, and padding is excluded from metrics."""
+    )
+    
+    _data_.add_argument(
+        "--num-workers",
+        type =          int,
+        default =       4,
+        help =          """Number of data loading worker processes. Defaults to 4."""
+    )
+    
+    _data_.add_argument(
+        "--pin-memory",
+        action =        BooleanOptionalAction,
+        default =       True,
+        help =          """Collate batches into page-locked memory so that host-to-device copies 
+                        can be asynchronous (CUDA only). Enabled by default."""
+    )
+    
+    _data_.add_argument(
+        "--persistent-workers",
+        action =        BooleanOptionalAction,
+        default =       True,
+        help =          """Keep data loading workers alive across models. Enabled by default."""
+    )
+    
+    _data_.add_argument(
+        "--prefetch-factor",
+        type =          int,
+        default =       2,
+        help =          """Batches loaded in advance by each worker. Defaults to 2."""
+    )
+    
+    _data_.add_argument(
+        "--prefetch-depth",
+        type =          int,
+        default =       1,
+        help =          """Batches kept in flight to the device ahead of the forward pass. Defaults 
+                        to 1."""
+    )
+    
+    # METRICS ======================================================================================
+    _metrics_:      _ArgumentGroup =    _parser_.add_argument_group(
+                                            title =         "Metrics",
+                                            description =   """Metric calculation configuration."""
+                                        )
+    
+    _metrics_.add_argument(
+        "--hausdorff-backend",
+        type =          str,
+        choices =       ["edt", "medpy", "none"],
+        default =       "edt",
+        help =          """Hausdorff distance backend. "edt" measures each image with Euclidean 
+                        distance transforms, "medpy" uses the reference implementation, and "none" 
+                        disables the metric. Defaults to "edt"."""
+    )
+    
+    _metrics_.add_argument(
+        "--hausdorff-percentile",
+        type =          float,
+        default =       100.0,
+        help =          """Percentile of surface distances reported as Hausdorff distance (i.e., 95 
+                        for HD95); the medpy backend only supports 95 & 100. Defaults to 100 
+                        (maximum)."""
+    )
+    
+    _metrics_.add_argument(
+        "--hausdorff-stride",
+        type =          int,
+        default =       1,
+        help =          """Pool Hausdorff boundary points into cells of this size before measuring 
+                        distances. Error is bounded by sqrt(2) * (stride - 1) pixels. Defaults to 1 
+                        (exact)."""
+    )
+    
+    _metrics_.add_argument(
+        "--confidence",
+        action =        "store_true",
+        default =       False,
+        help =          """Also report mean confidence (maximum softmax probability) of predictions 
+                        over labelled pixels."""
+    )
+    
+    _metrics_.add_argument(
+        "--async-metrics",
+        action =        "store_true",
+        default =       False,
+        help =          """Evaluate metrics in a worker pool while inference continues."""
+    )
+    
+    _metrics_.add_argument(
+        "--metric-workers",
+        type =          int,
+        default =       2,
+        help =          """Number of asynchronous metric workers. Defaults to 2."""
+    )
+    
+    _metrics_.add_argument(
+        "--metric-executor",
+        type =          str,
+        choices =       ["thread", "process"],
+        default =       "thread",
+        help =          """Asynchronous metric worker type. Defaults to "thread"."""
+    )
+    
+    _metrics_.add_argument(
+        "--max-pending-batches",
+        type =          int,
+        default =       4,
+        help =          """Maximum number of batches awaiting asynchronous metric evaluation; 
+                        inference blocks beyond this. Defaults to 4."""
+    )
+    
+    # TIMING =======================================================================================
+    _timing_:       _ArgumentGroup =    _parser_.add_argument_group(
+                                            title =         "Timing",
+                                            description =   """Latency measurement configuration."""
+                                        )
+    
+    _timing_.add_argument(
+        "--warmup-iterations",
+        type =          int,
+        default =       10,
+        help =          """Untimed forward passes executed before measuring each model. Defaults to 
+                        10."""
+    )
+    
+    # TILING =======================================================================================
+    _tiling_:       _ArgumentGroup =    _parser_.add_argument_group(
+                                            title =         "Tiling",
+                                            description =   """Sliding-window tiled inference configuration."""
+                                        )
+    
+    _tiling_.add_argument(
+        "--tile-size",
+        type =          int,
+        default =       None,
+        help =          """Execute models over square tiles of this side (a multiple of 32), 
+                        blending their logits, so that inputs larger than fit in memory can be 
+                        evaluated; peak memory is compared with whole-image inference. Defaults 
+                        to whole images."""
+    )
+    
+    _tiling_.add_argument(
+        "--tile-overlap",
+        type =          float,
+        default =       0.25,
+        help =          """Fraction of each tile overlapping its neighbours. Defaults to 0.25."""
+    )
+    
+    _tiling_.add_argument(
+        "--tile-blend",
+        type =          str,
+        choices =       ["gaussian", "linear"],
+        default =       "gaussian",
+        help =          """Blending of overlapping logits. Defaults to "gaussian"."""
+    )
+    
+    _tiling_.add_argument(
+        "--tile-batch",
+        type =          int,
+        default =       16,
+        help =          """Tiles forwarded at once, across images of a batch. Defaults to 16."""
+    )
+    
+    # PROFILING ====================================================================================
+    _profiling_:    _ArgumentGroup =    _parser_.add_argument_group(
+                                            title =         "Profiling",
+                                            description =   """Per-stage profiling configuration."""
+                                        )
+    
+    _profiling_.add_argument(
+        "--profile",
+        action =        "store_true",
+        default =       False,
+        help =          """Profile time & memory spent in each model stage, exporting a Chrome 
+                        trace and a table of top stages alongside results."""
+    )
+    
+    _profiling_.add_argument(
+        "--profile-iterations",
+        type =          int,
+        default =       10,
+        help =          """Profiled forward passes per model. Defaults to 10."""
+    )
+    
+    _profiling_.add_argument(
+        "--profile-depth",
+        type =          int,
+        default =       3,
+        help =          """Depth of the deepest sub-modules profiled as stages (1 = encoder, 
+                        decoder, head). Defaults to 3."""
+    )
+    
+    _profiling_.add_argument(
+        "--profile-top",
+        type =          int,
+        default =       20,
+        help =          """Number of stages reported, by self time. Defaults to 20."""
+    )
+    
+    _profiling_.add_argument(
+        "--trace-memory",
+        action =        "store_true",
+        default =       False,
+        help =          """Also trace peak Python heap allocations of each model with tracemalloc 
+                        (slows evaluation down considerably)."""
+    )
+    
     # Initialize sub-parser.
     _subparser_:  _SubParsersAction =   _parser_.add_subparsers(
-                                            dest =          "model",
-                                            description =   """Model with which job will be executed."""
+                                            dest =          "dataset_name",
+                                            description =   """Dataset on which model(s) will be evaluated, or 
+                                                            sweep mode."""
                                         )
     
     # Add dataset parsers.
-    add_pets_parser(parent_subparser =  _subparser_)
-    add_voc_parser( parent_subparser =  _subparser_)
\ No newline at end of file
+    add_pets_parser(     parent_subparser = _subparser_)
+    add_voc_parser(      parent_subparser = _subparser_)
+    add_synthetic_parser(parent_subparser = _subparser_)
+    
+    # Add sweep parser.
+    add_sweep_parser(parent_subparser = _subparser_)
\ No newline at end of file
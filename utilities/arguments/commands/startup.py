@@ -0,0 +1,34 @@
+"""Argument definitions for the startup-time benchmark."""
+
+__all__ = ["add_startup_parser"]
+
+from argparse   import ArgumentParser, _SubParsersAction
+
+def add_startup_parser(
+    parent_subparser:   _SubParsersAction
+) -> None:
+    """# Add parser/arguments for the startup-time benchmark.
+
+    ## Args:
+        * parent_subparser  (_SubParsersAction): Parent's sub-parser.
+    """
+    # Initialize parser.
+    _parser_:   ArgumentParser =    parent_subparser.add_parser(
+                                        name =  "startup",
+                                        help =  """Measure CLI startup time (import, help, and argument 
+                                                validation), failing on regressions."""
+                                    )
+    
+    _parser_.add_argument(
+        "--repeats",
+        type =          int,
+        default =       5,
+        help =          """Executions of each probe. Defaults to 5."""
+    )
+    
+    _parser_.add_argument(
+        "--budget-ms",
+        type =          float,
+        default =       500.0,
+        help =          """Median startup time allowed per probe, in milliseconds. Defaults to 500."""
+    )
\ No newline at end of file
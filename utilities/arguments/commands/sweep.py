@@ -0,0 +1,67 @@
+"""Argument definitions for batch-size & resolution sweeps."""
+
+__all__ = ["add_sweep_parser"]
+
+from argparse   import ArgumentParser, _SubParsersAction
+
+def add_sweep_parser(
+    parent_subparser:   _SubParsersAction
+) -> None:
+    """# Add parser/arguments for batch-size & resolution sweeps.
+
+    ## Args:
+        * parent_subparser  (_SubParsersAction): Parent's sub-parser.
+    """
+    # Initialize parser.
+    _parser_:   ArgumentParser =    parent_subparser.add_parser(
+                                        name =  "sweep",
+                                        help =  """Sweep model(s) over a grid of batch sizes and input 
+                                                resolutions using synthetic inputs."""
+                                    )
+    
+    _parser_.add_argument(
+        "--models",
+        type =          str,
+        nargs =         "+",
+        choices =       ["deeplab-v3", "fpn", "seg-former", "u-net"],
+        default =       ["deeplab-v3", "fpn", "seg-former", "u-net"],
+        help =          """Model(s) being swept. Defaults to all models."""
+    )
+    
+    _parser_.add_argument(
+        "--batch-sizes",
+        type =          int,
+        nargs =         "+",
+        default =       [1, 2, 4, 8, 16, 32],
+        help =          """Batch sizes being swept. Defaults to 1, 2, 4, 8, 16, 32."""
+    )
+    
+    _parser_.add_argument(
+        "--input-sizes",
+        type =          int,
+        nargs =         "+",
+        default =       [256, 384, 512],
+        help =          """(Square) input resolutions being swept. Defaults to 256, 384, 512."""
+    )
+    
+    _parser_.add_argument(
+        "--num-classes",
+        type =          int,
+        default =       3,
+        help =          """Number of output classes of each model. Defaults to 3."""
+    )
+    
+    _parser_.add_argument(
+        "--iterations",
+        type =          int,
+        default =       20,
+        help =          """Timed forward passes at each grid point. Defaults to 20."""
+    )
+    
+    _parser_.add_argument(
+        "--saturation-threshold",
+        type =          float,
+        default =       0.05,
+        help =          """Relative throughput gain below which a larger batch size is considered to 
+                        no longer improve throughput. Defaults to 0.05 (5%%)."""
+    )
@@ -1,6 +1,7 @@
 """Dataset arguments package."""
 
-__all__ = ["add_pets_parser", "add_voc_parser"]
+__all__ = ["add_pets_parser", "add_synthetic_parser", "add_voc_parser"]
 
-from utilities.arguments.datasets.pets  import add_pets_parser
-from utilities.arguments.datasets.voc   import add_voc_parser
\ No newline at end of file
+from utilities.arguments.datasets.pets      import add_pets_parser
+from utilities.arguments.datasets.synthetic import add_synthetic_parser
+from utilities.arguments.datasets.voc       import add_voc_parser
\ No newline at end of file
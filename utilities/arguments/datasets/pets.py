@@ -16,4 +16,7 @@ def add_pets_parser(
     _parser_:   ArgumentParser =    parent_subparser.add_parser(
                                         name =  "pets",
                                         help =  """Oxford IIIT PETS dataset."""
-                                    )
\ No newline at end of file
+                                    )
+    
+    # Define number of classes.
+    _parser_.set_defaults(num_classes = 3)
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""Argument definitions for synthetic segmentation dataset."""
+
+__all__ = ["add_synthetic_parser"]
+
+from argparse   import ArgumentParser, ArgumentTypeError, _SubParsersAction
+
+def add_synthetic_parser(
+    parent_subparser:   _SubParsersAction
+) -> None:
+    """# Add parser/arguments for synthetic segmentation dataset.
+
+    ## Args:
+        * parent_subparser  (_SubParsersAction): Parent's sub-parser.
+    """
+    # Initialize parser.
+    _parser_:   ArgumentParser =    parent_subparser.add_parser(
+                                        name =  "synthetic",
+                                        help =  """Procedurally generated, seed-deterministic dataset (no 
+                                                download or disk access)."""
+                                    )
+    
+    _parser_.add_argument(
+        "--num-classes",
+        type =          _num_classes_,
+        default =       3,
+        help =          """Number of classes, including background (2 to 255, as labels are uint8 
+                        and 255 is the ignore index). Defaults to 3."""
+    )
+    
+    _parser_.add_argument(
+        "--num-samples",
+        type =          int,
+        default =       256,
+        help =          """Number of samples. Defaults to 256."""
+    )
+    
+    _parser_.add_argument(
+        "--seed",
+        type =          int,
+        default =       0,
+        help =          """Seed from which samples are generated. Defaults to 0."""
+    )
+
+def _num_classes_(
+    value:  str
+) -> int:
+    """# Parse number of synthetic classes.
+
+    ## Args:
+        * value (str):  Argument value.
+
+    ## Returns:
+        * int:  Number of classes, in [2, 255].
+    """
+    # Parse integer.
+    try:                number = int(value)
+    except ValueError:  raise ArgumentTypeError(f"invalid int value: '{value}'")
+
+    # Labels are uint8, and 255 is the ignore index (the CLI does not import the datasets package, which imports PyTorch).
+    if not 2 <= number <= 255: raise ArgumentTypeError(f"must be between 2 and 255, got {number}")
+
+    # Return number of classes.
+    return number
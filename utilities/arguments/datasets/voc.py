@@ -16,4 +16,7 @@ def add_voc_parser(
     _parser_:   ArgumentParser =    parent_subparser.add_parser(
                                         name =  "voc",
                                         help =  """Pascal VOC Segmentation dataset."""
-                                    )
\ No newline at end of file
+                                    )
+    
+    # Define number of classes.
+    _parser_.set_defaults(num_classes = 21)
\ No newline at end of file
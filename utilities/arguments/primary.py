@@ -1,10 +1,10 @@
 """Argument definitions & parsing."""
 
-__all__ = ["ARGS"]
+__all__ = ["parse_arguments"]
 
 from argparse                       import ArgumentParser, _ArgumentGroup, Namespace, _SubParsersAction
 
-from utilities.arguments.commands   import *
+from utilities.arguments.commands   import add_benchmark_parser, add_startup_parser
 
 # Initialize parser
 _parser_:       ArgumentParser =    ArgumentParser(
@@ -60,10 +60,32 @@ _output_.add_argument(
 
 # COMMANDS =========================================================================================
 add_benchmark_parser(parent_subparser =           _subparser_)
+add_startup_parser(parent_subparser =             _subparser_)
 
 # +================================================================================================+
 # | END ARGUMENTS                                                                                  |
 # +================================================================================================+
 
-# Parse arguments
-ARGS:           Namespace =         _parser_.parse_args()
\ No newline at end of file
+def parse_arguments(
+    argv:   list[str] = None
+) -> Namespace:
+    """# Parse command line arguments.
+
+    Arguments are only parsed when requested (i.e., by the application's entry point), so that
+    modules can be imported as a library without reading or validating `sys.argv`.
+
+    ## Args:
+        * argv  (list[str], optional):  Arguments being parsed. Defaults to None (`sys.argv`).
+
+    ## Returns:
+        * Namespace:    Parsed arguments.
+    """
+    # Parse arguments.
+    arguments:  Namespace = _parser_.parse_args(argv)
+    
+    # Medpy only reports the maximum (HD) or 95th percentile (HD95) of surface distances.
+    if getattr(arguments, "hausdorff_backend", None) == "medpy" and arguments.hausdorff_percentile not in (95, 100):
+        _parser_.error(f"--hausdorff-percentile must be 95 or 100 with the medpy backend, got {arguments.hausdorff_percentile:g}")
+    
+    # Return parsed arguments.
+    return arguments
\ No newline at end of file
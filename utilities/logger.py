@@ -1,30 +1,46 @@
 """Logging utilities."""
 
-__all__ = ["LOGGER"]
+__all__ = ["configure_logging", "LOGGER"]
 
 from logging                import getLogger, Formatter, Logger, StreamHandler
 from logging.handlers       import RotatingFileHandler
 from os                     import makedirs
 from sys                    import stdout
 
-from utilities.arguments    import ARGS
 from utilities.timestamp    import TIMESTAMP
 
-# Ensure that logging path exists
-makedirs(name = ARGS.logging_path, exist_ok = True)
-
 # Initialize logger
 LOGGER:         Logger =                getLogger("segment")
 
-# Set logging level
-LOGGER.setLevel(ARGS.logging_level)
-
-# Define console handler
-stdout_handler: StreamHandler =         StreamHandler(stdout)
-stdout_handler.setFormatter(Formatter("%(levelname)s | %(name)s | %(message)s"))
-LOGGER.addHandler(stdout_handler)
-
-# Define file handler
-file_handler:   RotatingFileHandler =   RotatingFileHandler(f"{ARGS.logging_path}/default_{TIMESTAMP}.log", maxBytes = 1048576)
-file_handler.setFormatter(Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s"))
-LOGGER.addHandler(file_handler)
\ No newline at end of file
+def configure_logging(
+    level:  str =   "INFO",
+    path:   str =   "logs"
+) -> None:
+    """# Attach console & file handlers to the application logger.
+
+    Handlers are only attached when requested (i.e., by the application's entry point), so that
+    modules can be imported as a library without creating log files.
+
+    ## Args:
+        * level (str, optional):    Minimum logging level. Defaults to "INFO".
+        * path  (str, optional):    Path at which log files will be written. Defaults to "logs"
+                                    (None to log to console only).
+    """
+    # Set logging level
+    LOGGER.setLevel(level)
+
+    # Define console handler
+    stdout_handler: StreamHandler =         StreamHandler(stdout)
+    stdout_handler.setFormatter(Formatter("%(levelname)s | %(name)s | %(message)s"))
+    LOGGER.addHandler(stdout_handler)
+
+    # Console only, if no logging path is given.
+    if path is None: return
+
+    # Ensure that logging path exists
+    makedirs(name = path, exist_ok = True)
+
+    # Define file handler
+    file_handler:   RotatingFileHandler =   RotatingFileHandler(f"{path}/default_{TIMESTAMP}.log", maxBytes = 1048576)
+    file_handler.setFormatter(Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s"))
+    LOGGER.addHandler(file_handler)